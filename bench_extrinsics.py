@@ -0,0 +1,242 @@
+"""
+등록 extrinsic 준비/제출 경로 마이크로벤치마크.
+
+측정 항목:
+    compose_burned_register : burned_register call 구성
+    compose_force_batch     : force_batch([burned_register]) call 구성
+    compose_proxy           : Proxy.proxy(force_batch) call 구성
+    encode_call             : force_batch call SCALE 인코딩 (런타임 조회 제외)
+    sign_with_nonce         : create_signed_extrinsic (nonce 지정)
+    sign_without_nonce      : create_signed_extrinsic (account_nextIndex 조회 포함)
+    submit_rtt              : submit_extrinsic 왕복 시간 (mock 노드에서만)
+    prepare_and_submit      : register_force_v2.prepare_and_submit_extrinsic 전체 (mock 노드에서만)
+
+기본으로 mock_node.py의 capture(MOCK_NODE_CAPTURE)를 재생하는 로컬 노드에 대해 실행하므로 네트워크가 필요 없습니다.
+capture는 MOCK_NODE_UPSTREAM을 설정하고 한 번 실행하면 기록됩니다 (제출은 upstream으로 전달되지 않음).
+BENCH_NETWORK를 설정하면 mock 노드 대신 해당 노드에 직접 연결하며, 이때는 제출 항목을 건너뜁니다.
+
+BENCH_OUTPUT을 지정하면 결과를 JSON으로 저장하고, BENCH_BASELINE을 지정하면 항목별로 비교하여
+BENCH_REGRESSION_PCT 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+
+사용법:
+    MOCK_NODE_UPSTREAM=wss://entrypoint-finney.opentensor.ai:443 python bench_extrinsics.py   # capture 기록
+    BENCH_OUTPUT=baseline.json python bench_extrinsics.py
+    BENCH_BASELINE=baseline.json python bench_extrinsics.py
+"""
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from bittensor.core.async_subtensor import AsyncSubtensor
+from bittensor_wallet import Keypair
+from dotenv import load_dotenv
+
+from mock_node import MOCK_NODE_CAPTURE, MOCK_NODE_UPSTREAM, MockNode
+
+load_dotenv()
+
+BENCH_NETWORK = os.getenv("BENCH_NETWORK")  # 설정하면 mock 노드 대신 직접 연결
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+BENCH_ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "50"))
+BENCH_NETUID = int(os.getenv("BENCH_NETUID", os.getenv("NETUID", "1")))
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT")
+BENCH_BASELINE = os.getenv("BENCH_BASELINE")
+BENCH_REGRESSION_PCT = float(os.getenv("BENCH_REGRESSION_PCT", "10"))
+
+# 개발용 고정 키 (서명만 하고 실제 체인에는 제출하지 않음)
+COLDKEY_URI = "//Alice"
+HOTKEY_URI = "//Bob"
+PROXY_REAL_URI = "//Charlie"
+
+
+async def measure(name, factory):
+    """factory()를 BENCH_ITERATIONS번 실행하는 라운드를 BENCH_ROUNDS번 반복하여 건당 시간(µs)을 측정합니다."""
+    await factory()  # 캐시 준비
+    per_call = []
+    for _ in range(BENCH_ROUNDS):
+        start = time.perf_counter_ns()
+        for _ in range(BENCH_ITERATIONS):
+            await factory()
+        per_call.append((time.perf_counter_ns() - start) / BENCH_ITERATIONS / 1000)
+    stats = {
+        "median_us": statistics.median(per_call),
+        "min_us": min(per_call),
+        "max_us": max(per_call),
+    }
+    print(f"{name:>24}: {stats['median_us']:>10.1f} µs (min {stats['min_us']:.1f}, max {stats['max_us']:.1f})")
+    return stats
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_benchmark(url, submit):
+    subtensor = AsyncSubtensor(network=url)
+    substrate = subtensor.substrate
+    # 연결/메타데이터 로드 비용은 제외
+    runtime = await substrate.init_runtime()
+    anchor_block = await substrate.get_block_number(None)
+    era = {"period": 64, "current": anchor_block}
+
+    coldkey = Keypair.create_from_uri(COLDKEY_URI)
+    hotkey = Keypair.create_from_uri(HOTKEY_URI)
+    real = Keypair.create_from_uri(PROXY_REAL_URI)
+    wallet = SimpleNamespace(coldkey=coldkey, hotkey=hotkey, hotkey_str="bench")
+
+    async def compose_burned_register():
+        return await substrate.compose_call(
+            call_module="SubtensorModule",
+            call_function="burned_register",
+            call_params={"netuid": BENCH_NETUID, "hotkey": hotkey.ss58_address},
+        )
+
+    register_call = await compose_burned_register()
+
+    async def compose_force_batch():
+        return await substrate.compose_call(
+            call_module="Utility",
+            call_function="force_batch",
+            call_params={"calls": [register_call]},
+        )
+
+    force_batch_call = await compose_force_batch()
+
+    async def compose_proxy():
+        return await substrate.compose_call(
+            call_module="Proxy",
+            call_function="proxy",
+            call_params={"real": real.ss58_address, "force_proxy_type": "Any", "call": force_batch_call},
+        )
+
+    async def encode_call():
+        call = runtime.runtime_config.create_scale_object("Call", metadata=runtime.metadata)
+        return call.encode(force_batch_call.value)
+
+    async def sign_with_nonce():
+        return await substrate.create_signed_extrinsic(
+            call=force_batch_call, keypair=coldkey, era=dict(era), nonce=0, tip=1_000_000
+        )
+
+    async def sign_without_nonce():
+        return await substrate.create_signed_extrinsic(
+            call=force_batch_call, keypair=coldkey, era=dict(era), tip=1_000_000
+        )
+
+    extrinsic = await sign_with_nonce()
+
+    async def submit_rtt():
+        return await substrate.submit_extrinsic(extrinsic, wait_for_inclusion=False, wait_for_finalization=False)
+
+    async def prepare_and_submit():
+        import register_force_v2
+
+        # 함수 안의 진행 로그는 측정에서 제외
+        with contextlib.redirect_stdout(io.StringIO()):
+            return await register_force_v2.prepare_and_submit_extrinsic(
+                subtensor, wallet, BENCH_NETUID, anchor_block + 1, 0, nonce=0
+            )
+
+    cases = {
+        "compose_burned_register": compose_burned_register,
+        "compose_force_batch": compose_force_batch,
+        "compose_proxy": compose_proxy,
+        "encode_call": encode_call,
+        "sign_with_nonce": sign_with_nonce,
+        "sign_without_nonce": sign_without_nonce,
+    }
+    if submit:
+        cases["submit_rtt"] = submit_rtt
+        cases["prepare_and_submit"] = prepare_and_submit
+
+    print(f"Benchmarking against {url} at block {anchor_block}: {BENCH_ROUNDS} x {BENCH_ITERATIONS} iterations\n")
+    results = {}
+    for name, factory in cases.items():
+        results[name] = await measure(name, factory)
+    return {"block": anchor_block, "spec_version": runtime.runtime_version, "results": results}
+
+
+def compare(report, baseline, threshold_pct):
+    """
+    baseline 대비 항목별 중앙값 변화를 출력합니다.
+
+    Returns:
+        List[str]: threshold_pct 이상 느려진 항목
+    """
+    print(f"\nCompared with baseline {baseline.get('revision') or '?'} ({baseline.get('generated_at')}):")
+    regressions = []
+    for name, stats in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:>24}: (new)")
+            continue
+        change = (stats["median_us"] / previous["median_us"] - 1) * 100
+        marker = ""
+        if change >= threshold_pct:
+            marker = "  ⚠ REGRESSION"
+            regressions.append(name)
+        print(f"{name:>24}: {previous['median_us']:>10.1f} → {stats['median_us']:>10.1f} µs ({change:+.1f}%){marker}")
+    return regressions
+
+
+async def run():
+    node = None
+    if BENCH_NETWORK:
+        url, submit, source = BENCH_NETWORK, False, BENCH_NETWORK
+    else:
+        node = await MockNode(MOCK_NODE_CAPTURE, MOCK_NODE_UPSTREAM).start(port=0)
+        url, submit = node.url, True
+        source = f"capture from {MOCK_NODE_UPSTREAM}" if MOCK_NODE_UPSTREAM else f"mock node ({MOCK_NODE_CAPTURE})"
+    try:
+        report = await run_benchmark(url, submit)
+    finally:
+        if node is not None:
+            await node.stop()
+            if node.misses:
+                print(f"⚠ {sum(node.misses.values())} requests were not in the capture "
+                      f"(record again with MOCK_NODE_UPSTREAM): {list(node.misses)[:3]}")
+    report.update({
+        "source": source,
+        "revision": git_revision(),
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "rounds": BENCH_ROUNDS,
+        "iterations": BENCH_ITERATIONS,
+    })
+    return report
+
+
+def main():
+    report = asyncio.run(run())
+
+    if BENCH_OUTPUT:
+        with open(BENCH_OUTPUT, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {BENCH_OUTPUT}")
+
+    if BENCH_BASELINE:
+        with open(BENCH_BASELINE) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, BENCH_REGRESSION_PCT)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions over {BENCH_REGRESSION_PCT:.0f}%: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n✓ No regressions over {BENCH_REGRESSION_PCT:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
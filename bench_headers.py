@@ -0,0 +1,130 @@
+"""
+헤더 알림 1건 처리 시간 마이크로벤치마크.
+
+비교 대상:
+    decoded  : subscribe_block_headers 경로 (번호 hex 변환 + digest 로그 전체 SCALE 디코딩)
+    raw      : raw_headers.parse_new_head 후 번호만 사용
+    raw+hash : raw 경로에서 블록 해시까지 계산
+
+NETWORK에 연결되면 실제 헤더와 런타임 DigestItem 디코더를 사용하고,
+연결할 수 없으면 합성 Aura 헤더와 scalecodec legacy 타입 레지스트리로 오프라인 측정합니다.
+
+사용법:
+    BENCH_ITERATIONS=20000 python bench_headers.py
+"""
+import asyncio
+import json
+import os
+import statistics
+import time
+
+from dotenv import load_dotenv
+from scalecodec.base import RuntimeConfiguration, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+
+from raw_headers import parse_new_head
+
+load_dotenv()
+
+BENCH_ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "20000"))
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT")
+
+# 합성 Aura 헤더: PreRuntime(aura, slot) + Seal(aura, 64바이트 서명)
+SYNTHETIC_HEADER = {
+    "parentHash": "0x" + "11" * 32,
+    "number": hex(5_123_456),
+    "stateRoot": "0x" + "22" * 32,
+    "extrinsicsRoot": "0x" + "33" * 32,
+    "digest": {
+        "logs": [
+            "0x06" + b"aura".hex() + "20" + (140_000_000).to_bytes(8, "little").hex(),
+            "0x05" + b"aura".hex() + "0101" + "44" * 64,
+        ]
+    },
+}
+
+
+async def load_live_decoder(network):
+    """노드에서 최신 헤더와 런타임의 DigestItem 디코더 클래스를 가져옵니다."""
+    from bittensor.core.async_subtensor import AsyncSubtensor
+
+    subtensor = AsyncSubtensor(network=network)
+    runtime = await subtensor.substrate.init_runtime()
+    header = (await subtensor.substrate.rpc_request("chain_getHeader", []))["result"]
+    return header, runtime.runtime_config.get_decoder_class("sp_runtime::generic::digest::DigestItem")
+
+
+def load_offline_decoder():
+    runtime_config = RuntimeConfiguration()
+    runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    return SYNTHETIC_HEADER, runtime_config.get_decoder_class("DigestItem")
+
+
+def decoded_path(message, digest_cls):
+    """subscribe_block_headers의 decode_block과 같은 작업."""
+    header = dict(message["params"]["result"])
+    header["number"] = int(header["number"], 16)
+    logs = []
+    for log_data in header["digest"]["logs"]:
+        log_digest = digest_cls(data=ScaleBytes(log_data))
+        log_digest.decode()
+        logs.append(log_digest)
+    header["digest"] = {"logs": logs}
+    return header["number"]
+
+
+def raw_path(message):
+    return parse_new_head(message).number
+
+
+def raw_hash_path(message):
+    head = parse_new_head(message)
+    return head.number, head.hash
+
+
+def measure(name, func, message):
+    """func(message)를 BENCH_ITERATIONS번 실행하는 라운드를 반복하여 건당 시간(µs)을 측정합니다."""
+    per_call = []
+    for _ in range(BENCH_ROUNDS):
+        start = time.perf_counter_ns()
+        for _ in range(BENCH_ITERATIONS):
+            func(message)
+        per_call.append((time.perf_counter_ns() - start) / BENCH_ITERATIONS / 1000)
+    stats = {"median_us": statistics.median(per_call), "min_us": min(per_call)}
+    print(f"{name:>9}: {stats['median_us']:>8.2f} µs/header (min {stats['min_us']:.2f})")
+    return stats
+
+
+def main():
+    network = os.getenv("NETWORK", "finney")
+    try:
+        header, digest_cls = asyncio.run(asyncio.wait_for(load_live_decoder(network), timeout=30))
+        source = f"live header #{int(header['number'], 16)} from {network}"
+    except Exception as e:
+        print(f"Could not load live header ({e!r}), using synthetic header")
+        header, digest_cls = load_offline_decoder()
+        source = "synthetic header"
+
+    message = {"jsonrpc": "2.0", "method": "chain_newHead", "params": {"subscription": "bench", "result": header}}
+    print(f"Benchmarking {source}: {len(header['digest']['logs'])} digest logs, "
+          f"{BENCH_ROUNDS} x {BENCH_ITERATIONS} iterations\n")
+
+    results = {
+        "decoded": measure("decoded", lambda m: decoded_path(m, digest_cls), message),
+        "raw": measure("raw", raw_path, message),
+        "raw+hash": measure("raw+hash", raw_hash_path, message),
+    }
+    for name in ("raw", "raw+hash"):
+        saved = results["decoded"]["median_us"] - results[name]["median_us"]
+        print(f"{name}: {results['decoded']['median_us'] / results[name]['median_us']:.1f}x faster "
+              f"({saved:.1f} µs saved per header)")
+
+    if BENCH_OUTPUT:
+        with open(BENCH_OUTPUT, "w") as f:
+            json.dump({"source": source, "iterations": BENCH_ITERATIONS, "results": results}, f, indent=2)
+        print(f"Saved results to {BENCH_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
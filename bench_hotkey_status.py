@@ -0,0 +1,106 @@
+"""
+등록 상태 조회 경로별 시간/메모리 벤치마크.
+
+비교 대상:
+    metagraph : AsyncMetagraph(lite=False).sync() (기존 get_unregistered_hotkeys 경로)
+    keys_map  : hotkey_status.fetch_hotkey_uids (Keys 맵 페이지 조회)
+    uids_multi: hotkey_status.fetch_uids_for_hotkeys (Uids 맵, 지정 hotkey만)
+
+사용법:
+    NETUID=1 NETWORK=finney BENCH_ROUNDS=3 python bench_hotkey_status.py
+"""
+import asyncio
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+from bittensor.core.async_subtensor import AsyncSubtensor
+from bittensor.core.metagraph import AsyncMetagraph
+from dotenv import load_dotenv
+
+from hotkey_status import fetch_hotkey_uids, fetch_uids_for_hotkeys
+
+load_dotenv()
+
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "3"))
+BENCH_SAMPLE_HOTKEYS = int(os.getenv("BENCH_SAMPLE_HOTKEYS", "20"))  # uids_multi에서 확인할 hotkey 수
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT")
+
+
+async def measure(name, factory, rounds):
+    """factory()를 rounds번 실행하여 소요 시간과 tracemalloc 최대 메모리를 측정합니다."""
+    durations = []
+    peaks = []
+    result = None
+    for _ in range(rounds):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = await factory()
+        durations.append((time.perf_counter() - start) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    stats = {
+        "rounds": rounds,
+        "median_ms": statistics.median(durations),
+        "min_ms": min(durations),
+        "peak_mb": max(peaks) / 1024 / 1024,
+    }
+    print(f"{name:>10}: {stats['median_ms']:>9.1f} ms (min {stats['min_ms']:.1f}) peak {stats['peak_mb']:>8.2f} MB")
+    return stats, result
+
+
+async def run_benchmark(network, netuid, rounds):
+    subtensor = AsyncSubtensor(network=network)
+    substrate = subtensor.substrate
+    # 연결/메타데이터 로드 비용은 제외
+    await substrate.init_runtime()
+    block_hash = await substrate.get_chain_head()
+
+    async def metagraph_path():
+        metagraph = AsyncMetagraph(subtensor=subtensor, netuid=netuid, lite=False, sync=False)
+        await metagraph.sync(block=await substrate.get_block_number(block_hash))
+        return set(metagraph.hotkeys)
+
+    async def keys_path():
+        return await fetch_hotkey_uids(subtensor, netuid, block_hash=block_hash)
+
+    print(f"Benchmarking registration status for netuid {netuid} at {block_hash} ({rounds} rounds)\n")
+    results = {}
+    results["metagraph"], metagraph_hotkeys = await measure("metagraph", metagraph_path, rounds)
+    results["keys_map"], hotkey_uids = await measure("keys_map", keys_path, rounds)
+
+    sample = list(hotkey_uids)[:BENCH_SAMPLE_HOTKEYS]
+
+    async def uids_path():
+        return await fetch_uids_for_hotkeys(subtensor, netuid, sample, block_hash=block_hash)
+
+    results["uids_multi"], sample_uids = await measure("uids_multi", uids_path, rounds)
+
+    consistent = metagraph_hotkeys == set(hotkey_uids) and all(
+        sample_uids[hotkey] == hotkey_uids[hotkey] for hotkey in sample
+    )
+    baseline = results["metagraph"]
+    print(f"\nNeurons: {len(hotkey_uids)}, results consistent: {consistent}")
+    for name in ("keys_map", "uids_multi"):
+        print(
+            f"{name}: {baseline['median_ms'] / max(results[name]['median_ms'], 1e-6):.1f}x faster, "
+            f"{baseline['peak_mb'] / max(results[name]['peak_mb'], 1e-6):.1f}x less memory than metagraph"
+        )
+    return {"netuid": netuid, "block_hash": block_hash, "neurons": len(hotkey_uids),
+            "consistent": consistent, "results": results}
+
+
+def main():
+    netuid = int(os.getenv("NETUID", "1"))
+    network = os.getenv("NETWORK", "finney")
+    report = asyncio.run(run_benchmark(network, netuid, BENCH_ROUNDS))
+    if BENCH_OUTPUT:
+        with open(BENCH_OUTPUT, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {BENCH_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
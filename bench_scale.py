@@ -0,0 +1,216 @@
+"""
+hotkey 수천 개 규모의 탐색/상태 확인 벤치마크 (네트워크 없이 실행).
+
+합성 지갑 디렉토리에 hotkey 키파일을 BENCH_SCALE_HOTKEYS개 만들고 다음을 측정합니다.
+    records     : hotkey_records.discover_hotkey_records (키파일 JSON의 ss58Address/publicKey만 읽음)
+    wallets     : hotkey_records.discover_hotkeys (hotkey마다 Wallet + keypair 로드, bittensor_wallet 필요)
+    status      : get_unregistered_hotkeys (records 기준, 합성 `Keys` 맵 256개)
+    lazy_load   : MAX_SLOTS개 레코드의 keypair를 WalletLoader로 로드 (bittensor_wallet 필요)
+
+합성 키파일에는 개인키를 넣지 않습니다 (임의 바이트는 sr25519 키로 로드할 수 없음). 따라서 wallets 경로의 시간은
+sr25519 키 확장 비용이 빠진 하한입니다. ss58 주소는 blake2b(SS58PRE) 체크섬과 base58로 직접 계산합니다.
+
+사용법:
+    BENCH_SCALE_HOTKEYS=10000 BENCH_OUTPUT=bench_scale.json python bench_scale.py
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# hotkey 로그 요약이 적용되도록 register_force_v2 import 전에 설정
+os.environ.setdefault("HOTKEY_LOG_LIMIT", "20")
+
+BENCH_SCALE_HOTKEYS = int(os.getenv("BENCH_SCALE_HOTKEYS", "10000"))
+BENCH_SCALE_REGISTERED = int(os.getenv("BENCH_SCALE_REGISTERED", "256"))  # 합성 서브넷의 등록 UID 수
+BENCH_SCALE_DIR = os.getenv("BENCH_SCALE_DIR")  # 설정하면 합성 지갑을 남겨 두고 다음 실행에서 재사용
+BENCH_SCALE_WALLETS = os.getenv("BENCH_SCALE_WALLETS", "1") == "1"  # Wallet 경로 비교 (느림)
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "3"))
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT")
+
+COLDKEY_NAME = "bench"
+SS58_FORMAT = 42
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def base58_encode(data):
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + encoded
+
+
+def ss58_encode(public_key, ss58_format=SS58_FORMAT):
+    """32바이트 공개키의 ss58 주소 (단일 바이트 prefix 형식)."""
+    payload = bytes([ss58_format]) + public_key
+    checksum = hashlib.blake2b(b"SS58PRE" + payload, digest_size=64).digest()[:2]
+    return base58_encode(payload + checksum)
+
+
+def keyfile_data(public_key):
+    return {
+        "accountId": "0x" + public_key.hex(),
+        "publicKey": "0x" + public_key.hex(),
+        "ss58Address": ss58_encode(public_key),
+        "cryptoType": 1,
+        "secretPhrase": None,
+        "secretSeed": None,
+    }
+
+
+def generate_wallet(path, count, seed=0):
+    """
+    path/COLDKEY_NAME 아래에 coldkey와 hotkey count개(+ 공개키 파일)를 만듭니다. 이미 있으면 그대로 사용합니다.
+
+    Returns:
+        List[str]: 생성한 hotkey ss58 주소 (이름 순)
+    """
+    rng = random.Random(seed)
+    hotkeys_path = os.path.join(path, COLDKEY_NAME, "hotkeys")
+    os.makedirs(hotkeys_path, exist_ok=True)
+    coldkey_file = os.path.join(path, COLDKEY_NAME, "coldkey")
+    coldkey = keyfile_data(rng.randbytes(32))
+    if not os.path.exists(coldkey_file):
+        with open(coldkey_file, "w") as f:
+            json.dump(coldkey, f)
+        with open(os.path.join(path, COLDKEY_NAME, "coldkeypub.txt"), "w") as f:
+            json.dump({key: coldkey[key] for key in ("accountId", "publicKey", "ss58Address", "cryptoType")}, f)
+
+    addresses = []
+    for i in range(count):
+        name = f"hk{i:05d}"
+        data = keyfile_data(rng.randbytes(32))
+        addresses.append(data["ss58Address"])
+        keyfile = os.path.join(hotkeys_path, name)
+        if os.path.exists(keyfile):
+            continue
+        with open(keyfile, "w") as f:
+            json.dump(data, f)
+        with open(os.path.join(hotkeys_path, f"{name}pub.txt"), "w") as f:
+            json.dump({key: data[key] for key in ("accountId", "publicKey", "ss58Address", "cryptoType")}, f)
+    return addresses
+
+
+class SyntheticKeysSubstrate:
+    """`Keys` 맵 query_map만 지원하는 합성 substrate (fetch_hotkey_uids용)."""
+
+    def __init__(self, hotkeys):
+        self.hotkeys = hotkeys
+
+    async def query_map(self, module, storage_function, params=None, block_hash=None, page_size=100):
+        async def entries():
+            for uid, hotkey in enumerate(self.hotkeys):
+                yield uid, hotkey
+
+        return entries()
+
+
+async def measure(name, factory, rounds):
+    """
+    factory()를 rounds번 실행하여 소요 시간을 재고, 한 번 더 실행하여 tracemalloc 최대 메모리를 측정합니다.
+    tracemalloc은 할당마다 비용이 커서 시간 측정과 분리합니다. factory의 출력은 버립니다.
+    """
+    durations = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await factory()
+            durations.append((time.perf_counter() - start) * 1000)
+        tracemalloc.start()
+        result = await factory()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    stats = {
+        "rounds": rounds,
+        "median_ms": statistics.median(durations),
+        "min_ms": min(durations),
+        "peak_mb": peak / 1024 / 1024,
+    }
+    print(f"{name:>10}: {stats['median_ms']:>9.1f} ms (min {stats['min_ms']:.1f}) peak {stats['peak_mb']:>8.2f} MB")
+    return stats, result
+
+
+async def run_benchmark(path, count, rounds):
+    from hotkey_records import WalletLoader, discover_hotkey_records, discover_hotkeys, load_scheduled
+    import register_force_v2 as bot
+
+    start = time.perf_counter()
+    addresses = generate_wallet(path, count)
+    print(f"Synthetic wallet: {count} hotkeys in {path} ({time.perf_counter() - start:.1f}s to prepare)\n")
+
+    # 합성 서브넷: 앞쪽 절반은 fleet hotkey, 나머지는 다른 사람의 hotkey
+    registered = addresses[:BENCH_SCALE_REGISTERED // 2]
+    others = [ss58_encode(hashlib.blake2b(str(i).encode(), digest_size=32).digest())
+              for i in range(BENCH_SCALE_REGISTERED - len(registered))]
+    subtensor = SimpleNamespace(substrate=SyntheticKeysSubstrate(registered + others))
+
+    async def records_path():
+        return discover_hotkey_records(path, COLDKEY_NAME)
+
+    results = {}
+    results["records"], records = await measure("records", records_path, rounds)
+
+    async def status_path():
+        return await bot.get_unregistered_hotkeys(subtensor, records, 1)
+
+    results["status"], unregistered = await measure("status", status_path, rounds)
+
+    try:
+        import bittensor_wallet  # noqa: F401
+        wallets_available = True
+    except ImportError:
+        wallets_available = False
+        print("bittensor_wallet not installed, skipping wallet benchmarks")
+
+    if wallets_available:
+        async def lazy_load_path():
+            # 새 loader: 캐시 없이 처음 로드하는 비용
+            return await asyncio.to_thread(load_scheduled, unregistered[:bot.MAX_SLOTS], WalletLoader())
+
+        results["lazy_load"], _ = await measure("lazy_load", lazy_load_path, rounds)
+
+    if wallets_available and BENCH_SCALE_WALLETS:
+        async def wallets_path():
+            return discover_hotkeys(path, COLDKEY_NAME)
+
+        results["wallets"], wallets = await measure("wallets", wallets_path, 1)
+        consistent = {wallet.hotkey.ss58_address for wallet in wallets} == {record.ss58_address for record in records}
+        print(f"\nrecords vs wallets: {results['wallets']['median_ms'] / max(results['records']['median_ms'], 1e-6):.1f}x "
+              f"faster, {results['wallets']['peak_mb'] / max(results['records']['peak_mb'], 1e-6):.1f}x less memory "
+              f"(same hotkeys: {consistent})")
+
+    print(f"Discovered {len(records)} hotkeys, {len(records) - len(unregistered)} registered, "
+          f"{len(unregistered)} unregistered")
+    return {"hotkeys": count, "registered_uids": BENCH_SCALE_REGISTERED, "discovered": len(records),
+            "unregistered": len(unregistered), "results": results}
+
+
+def main():
+    path = BENCH_SCALE_DIR or tempfile.mkdtemp(prefix="bench-scale-")
+    try:
+        report = asyncio.run(run_benchmark(path, BENCH_SCALE_HOTKEYS, BENCH_ROUNDS))
+    finally:
+        if not BENCH_SCALE_DIR:
+            shutil.rmtree(path, ignore_errors=True)
+    if BENCH_OUTPUT:
+        with open(BENCH_OUTPUT, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {BENCH_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+로컬 시계와 체인 시계(`Timestamp.Now`)의 차이를 지속적으로 추정합니다.
+
+블록마다 헤더 도착 시각(monotonic)과 해당 블록의 `Timestamp.Now`를 비교합니다.
+    lag = 헤더 도착 로컬 시각 - 블록 타임스탬프 = 시계 차이 + 블록 생성/전파 지연 + RPC 지연
+최근 블록 중 가장 작은 lag를 전파 지연이 거의 없던 경우로 보고, 여기서 RPC 지연(왕복 시간의 절반)을 빼서
+시계 차이(offset)를 구합니다. 나머지 평균 지연은 전파 지연, 그 변동폭은 jitter로 추적합니다.
+
+로컬 시각은 시작 시점의 time.time()에 time.monotonic() 경과분을 더해 계산하므로
+NTP 보정 등으로 벽시계가 튀어도 추정값이 흔들리지 않습니다.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+
+from raw_headers import subscribe_raw_new_heads
+
+BLOCK_TIME = 12.0  # 초
+CLOCK_SMOOTHING = float(os.getenv("CLOCK_SMOOTHING", "0.2"))  # EWMA 계수
+CLOCK_WINDOW = int(os.getenv("CLOCK_WINDOW", "50"))  # 최소 lag를 찾을 최근 블록 수
+
+
+def _ewma(previous, sample, alpha):
+    return sample if previous is None else previous + alpha * (sample - previous)
+
+
+class ChainClock:
+    """
+    체인 시계 추정기. 모든 스케줄러는 time.time() 대신 chain_now() / seconds_until_block()을 사용합니다.
+
+    Attributes:
+        offset: 로컬 시계 - 체인 시계 (초)
+        jitter: 헤더 도착 지연의 평균 편차 (초)
+        propagation_delay: 블록 타임스탬프 이후 헤더가 도착하기까지의 평균 지연 (초, 시계 차이 제외)
+        rpc_delay: RPC 단방향 지연 추정 (초)
+    """
+
+    def __init__(self, alpha=CLOCK_SMOOTHING, window=CLOCK_WINDOW):
+        self.alpha = alpha
+        self._wall_anchor = time.time()
+        self._mono_anchor = time.monotonic()
+        self._lags = deque(maxlen=window)
+        self.samples = 0
+        self.offset = None
+        self.jitter = 0.0
+        self.propagation_delay = None
+        self.rpc_delay = None
+        self.smoothed_lag = None
+        self.last_block = None
+        self.last_block_timestamp = None
+
+    def local_now(self, monotonic=None):
+        """monotonic 시계 기준 로컬 벽시계 시각 (unix 초)."""
+        if monotonic is None:
+            monotonic = time.monotonic()
+        return self._wall_anchor + (monotonic - self._mono_anchor)
+
+    def observe(self, block_number, block_timestamp, arrival_monotonic, rpc_rtt=None):
+        """
+        블록 하나의 관측값을 반영합니다.
+
+        Args:
+            block_number: 블록 번호
+            block_timestamp: 블록의 Timestamp.Now (unix 초)
+            arrival_monotonic: 헤더 도착 시점의 time.monotonic()
+            rpc_rtt: 이 관측에 사용한 RPC 왕복 시간 (초, 선택)
+        """
+        lag = self.local_now(arrival_monotonic) - block_timestamp
+        self._lags.append(lag)
+        self.samples += 1
+
+        if rpc_rtt is not None:
+            self.rpc_delay = _ewma(self.rpc_delay, rpc_rtt / 2, self.alpha)
+
+        offset_sample = min(self._lags) - (self.rpc_delay or 0.0)
+        self.offset = _ewma(self.offset, offset_sample, self.alpha)
+        if self.smoothed_lag is not None:
+            self.jitter = _ewma(self.jitter, abs(lag - self.smoothed_lag), self.alpha)
+        self.smoothed_lag = _ewma(self.smoothed_lag, lag, self.alpha)
+        self.propagation_delay = max(0.0, self.smoothed_lag - self.offset)
+
+        if self.last_block is None or block_number >= self.last_block:
+            self.last_block = block_number
+            self.last_block_timestamp = block_timestamp
+
+    @property
+    def ready(self):
+        return self.samples >= 2
+
+    def chain_now(self):
+        """보정된 현재 체인 시각 (unix 초). 추정 전에는 로컬 시각을 그대로 반환합니다."""
+        return self.local_now() - (self.offset or 0.0)
+
+    def block_timestamp(self, block_number):
+        """블록의 예상 체인 타임스탬프 (unix 초). 관측 전이면 None."""
+        if self.last_block is None:
+            return None
+        return self.last_block_timestamp + (block_number - self.last_block) * BLOCK_TIME
+
+    def seconds_until_block(self, block_number):
+        """블록 헤더가 도착할 때까지 남은 예상 시간 (초). 추정 전이면 None."""
+        if not self.ready:
+            return None
+        arrival = self.block_timestamp(block_number) + (self.propagation_delay or 0.0)
+        return arrival - self.chain_now()
+
+    def snapshot(self):
+        """
+        다른 프로세스(제출 워커)에 넘길 추정 상태. 같은 호스트의 벽시계 기준 값만 담습니다.
+
+        Returns:
+            dict: restore()에 넘길 수 있는 상태
+        """
+        return {
+            "samples": self.samples,
+            "offset": self.offset,
+            "jitter": self.jitter,
+            "propagation_delay": self.propagation_delay,
+            "rpc_delay": self.rpc_delay,
+            "smoothed_lag": self.smoothed_lag,
+            "last_block": self.last_block,
+            "last_block_timestamp": self.last_block_timestamp,
+        }
+
+    def restore(self, state):
+        """snapshot()으로 받은 추정 상태를 그대로 적용합니다."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def summary(self):
+        if not self.ready:
+            return f"chain clock: warming up ({self.samples} samples)"
+        return (
+            f"chain clock: offset {self.offset * 1000:+.0f}ms, jitter {self.jitter * 1000:.0f}ms, "
+            f"propagation {self.propagation_delay * 1000:.0f}ms, rpc {(self.rpc_delay or 0) * 1000:.0f}ms "
+            f"({self.samples} samples)"
+        )
+
+
+async def sample_block(substrate, clock, block_number, block_hash, arrival_monotonic):
+    """블록의 Timestamp.Now를 조회하여 clock에 반영합니다."""
+    start = time.monotonic()
+    timestamp = await substrate.query("Timestamp", "Now", block_hash=block_hash)
+    rtt = time.monotonic() - start
+    clock.observe(block_number, int(getattr(timestamp, "value", timestamp)) / 1000, arrival_monotonic, rpc_rtt=rtt)
+
+
+async def track_chain_clock(subtensor, clock, hub=None):
+    """
+    새 블록 헤더를 구독하면서 clock을 계속 갱신하는 백그라운드 작업.
+    hub(HeaderHub)를 넘기면 따로 구독하지 않고 background 구독자로 붙습니다 (취소되면 떨어짐).
+    오류가 나도 잠시 후 다시 구독합니다.
+    """
+    substrate = subtensor.substrate
+
+    async def on_new_block(head):
+        try:
+            await sample_block(substrate, clock, head.number, head.hash, head.arrival)
+        except Exception as e:
+            print(f"\n⚠ Chain clock sample failed: {e}")
+
+    if hub is not None:
+        subscriber = hub.attach(on_new_block, name="chain clock")
+        try:
+            await subscriber.wait()
+        finally:
+            hub.detach(subscriber)
+        return
+
+    while True:
+        try:
+            await subscribe_raw_new_heads(substrate, on_new_block)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"\n⚠ Chain clock subscription failed: {e}, retrying in 5s")
+            await asyncio.sleep(5)
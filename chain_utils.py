@@ -0,0 +1,144 @@
+"""
+체인 데이터 디코딩 공용 유틸리티.
+
+블록/풀에서 읽은 extrinsic 안의 `burned_register` 호출을 찾아내고,
+query 결과의 AccountId 등을 일반 파이썬 값으로 정규화합니다.
+"""
+
+SS58_FORMAT = 42
+
+# burned_register를 감싸고 있을 수 있는 호출들 (call_module, call_function) -> 내부 call 인자 이름
+WRAPPER_CALLS = {
+    ("Utility", "force_batch"): "calls",
+    ("Utility", "batch"): "calls",
+    ("Utility", "batch_all"): "calls",
+    ("Proxy", "proxy"): "call",
+    ("Proxy", "proxy_announced"): "call",
+}
+
+
+def plain(value):
+    """ScaleType/ScaleObj 값이면 `.value`를 꺼내고, 아니면 그대로 반환합니다."""
+    return getattr(value, "value", value)
+
+
+def normalize_account(value):
+    """
+    AccountId 표현(ss58 문자열, 0x hex, bytes, 정수 tuple)을 ss58 문자열로 변환합니다.
+
+    Args:
+        value: 디코딩된 AccountId 값
+
+    Returns:
+        str | None: ss58 주소 (변환할 수 없으면 None)
+    """
+    value = plain(value)
+    if value is None:
+        return None
+    if isinstance(value, dict) and "Id" in value:
+        # MultiAddress::Id(...)
+        value = value["Id"]
+    if isinstance(value, str) and not value.startswith("0x"):
+        return value
+
+    from scalecodec.utils.ss58 import ss58_encode
+
+    if isinstance(value, str):
+        return ss58_encode(value, SS58_FORMAT)
+    if isinstance(value, (tuple, list)) and value and isinstance(value[0], (tuple, list)):
+        value = value[0]
+    try:
+        return ss58_encode(bytes(value).hex(), SS58_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def call_args(call):
+    """call_args를 {name: value} dict로 반환합니다 (list/dict 두 형식 모두 지원)."""
+    args = call.get("call_args") or {}
+    if isinstance(args, dict):
+        return args
+    return {arg["name"]: arg["value"] for arg in args}
+
+
+def iter_burned_registers(call, netuid=None):
+    """
+    call (및 batch/proxy로 감싼 내부 call)에서 `burned_register` 호출을 찾아 반환합니다.
+
+    Args:
+        call: 디코딩된 call dict (call_module, call_function, call_args)
+        netuid: 지정하면 해당 서브넷 호출만 반환
+
+    Yields:
+        dict: {"netuid": int, "hotkey": str}
+    """
+    call = plain(call)
+    if not isinstance(call, dict):
+        return
+    key = (call.get("call_module"), call.get("call_function"))
+    args = call_args(call)
+
+    if key == ("SubtensorModule", "burned_register"):
+        call_netuid = int(plain(args.get("netuid")))
+        if netuid is None or call_netuid == netuid:
+            yield {"netuid": call_netuid, "hotkey": normalize_account(args.get("hotkey"))}
+        return
+
+    inner_name = WRAPPER_CALLS.get(key)
+    if inner_name is None:
+        return
+    inner = plain(args.get(inner_name))
+    inner_calls = inner if isinstance(inner, list) else [inner]
+    for inner_call in inner_calls:
+        yield from iter_burned_registers(inner_call, netuid)
+
+
+def extract_registrations(extrinsic, netuid=None):
+    """
+    디코딩된 extrinsic에서 `burned_register` 시도를 추출합니다.
+
+    Args:
+        extrinsic: GenericExtrinsic 또는 그 `.value` dict
+        netuid: 지정하면 해당 서브넷 호출만 반환
+
+    Returns:
+        List[dict]: {"netuid", "hotkey", "signer", "tip", "nonce"} 리스트
+    """
+    value = plain(extrinsic)
+    if not isinstance(value, dict) or "call" not in value:
+        return []
+
+    signer = normalize_account(value.get("address"))
+    tip = int(plain(value.get("tip")) or 0)
+    nonce = plain(value.get("nonce"))
+
+    return [
+        {**registration, "signer": signer, "tip": tip, "nonce": nonce}
+        for registration in iter_burned_registers(value["call"], netuid)
+    ]
+
+
+def registered_hotkeys_from_events(events, netuid):
+    """
+    블록 이벤트에서 `NeuronRegistered`로 실제 등록된 hotkey 집합을 반환합니다.
+
+    Args:
+        events: substrate.get_events() 결과
+        netuid: 서브넷 ID
+
+    Returns:
+        Set[str]: 등록에 성공한 hotkey ss58 주소
+    """
+    registered = set()
+    for event in events or []:
+        event = plain(event)
+        body = event.get("event", {})
+        if body.get("module_id") != "SubtensorModule" or body.get("event_id") != "NeuronRegistered":
+            continue
+        attributes = body.get("attributes")
+        if isinstance(attributes, dict):
+            attributes = list(attributes.values())
+        event_netuid, _uid, hotkey = attributes
+        if int(plain(event_netuid)) == netuid:
+            registered.add(normalize_account(hotkey))
+    return registered
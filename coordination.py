@@ -0,0 +1,450 @@
+"""
+여러 지역에서 동시에 실행되는 봇 인스턴스 간 slot 조정.
+
+각 인스턴스는 (epoch, offset) slot과 hotkey에 대한 lease를 얻은 경우에만 해당 slot에 제출합니다.
+같은 epoch에서 slot 하나는 한 인스턴스만, hotkey 하나는 한 slot에만 배정되므로
+중복 등록이나 같은 slot에서의 경쟁이 생기지 않습니다. epoch이 끝나면 각 인스턴스는 slot별 제출 결과(outcome)를
+기록하고, slot을 배정할 때 다른 인스턴스가 그 epoch에 이미 제출했거나 거절된 hotkey는 건너뜁니다.
+
+nonce는 coldkey 단위로 증가하고 각 인스턴스는 자기 제출만 보고 nonce를 정하므로, 두 인스턴스가 같은 coldkey로
+제출하면 같은 nonce의 extrinsic이 서로를 밀어냅니다. 그래서 인스턴스는 시작할 때 사용할 coldkey를 코디네이터에
+등록(join)하고, 살아 있는 다른 인스턴스가 이미 등록한 coldkey가 있으면 SharedColdkeyError로 시작하지 않습니다.
+여러 지역에서 동시에 제출하려면 인스턴스마다 다른 coldkey의 hotkey를 나누어 주어야 합니다.
+
+slot 배정은 epoch마다 claim_slots 요청 한 번으로 끝나므로 WAN 너머의 코디네이터도 왕복 한 번만 필요합니다.
+
+백엔드 (COORDINATOR_URL):
+    sqlite:///path/to/coordination.db  같은 호스트의 인스턴스끼리 파일로 공유
+    tcp://host:port                    `python coordination.py`로 띄운 코디네이터 서버 사용
+"""
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+COORDINATOR_URL = os.getenv("COORDINATOR_URL")  # 설정하지 않으면 조정 없이 단독 실행
+INSTANCE_ID = os.getenv("INSTANCE_ID", f"{socket.gethostname()}-{os.getpid()}")
+COORDINATOR_HOST = os.getenv("COORDINATOR_HOST", "127.0.0.1")
+COORDINATOR_PORT = int(os.getenv("COORDINATOR_PORT", "7788"))
+COORDINATOR_DB = os.getenv("COORDINATOR_DB", "coordination.db")
+OUTCOME_RETENTION = 86400  # 제출 결과 보관 기간 (초)
+
+# slot 배정에서 건너뛰는 제출 결과
+SETTLED_OUTCOMES = ("submitted", "rejected")
+
+
+class SharedColdkeyError(RuntimeError):
+    """다른 인스턴스가 이미 사용 중인 coldkey로 참여하려 할 때 발생합니다."""
+
+
+class CoordinationBackend:
+    """slot lease 저장소 인터페이스."""
+
+    async def join(self, instance_id, coldkeys, ttl):
+        """
+        인스턴스가 사용할 coldkey를 등록하거나 등록 기간을 갱신합니다.
+        살아 있는 다른 인스턴스가 이미 등록한 coldkey가 하나라도 있으면 아무것도 등록하지 않습니다.
+
+        Args:
+            instance_id: 이 인스턴스 ID
+            coldkeys: coldkey ss58 리스트
+            ttl: 등록 유지 시간 (초) - 다음 갱신까지
+
+        Returns:
+            List[Tuple[str, str]]: 충돌한 (coldkey, 다른 인스턴스 ID), 없으면 빈 리스트
+        """
+        raise NotImplementedError
+
+    async def leave(self, instance_id):
+        """인스턴스의 coldkey 등록을 해제합니다."""
+        raise NotImplementedError
+
+    async def claim_slots(self, epoch, offsets, hotkeys, instance_id, ttl):
+        """
+        여러 slot의 lease를 한 번에 요청합니다. offsets 순서대로, 비어 있는 slot마다 hotkeys 중
+        아직 배정되지 않은 첫 hotkey를 배정합니다.
+        이 인스턴스가 이미 가진 lease는 갱신되고, 다른 인스턴스가 가진 slot / hotkey는 건너뜁니다.
+
+        Args:
+            epoch: 등록 epoch 블록 번호
+            offsets: 요청할 slot offset 리스트
+            hotkeys: hotkey ss58 리스트 (우선순위 순)
+            instance_id: 이 인스턴스 ID
+            ttl: lease 유지 시간 (초)
+
+        Returns:
+            List[Tuple[int, str]]: 이 인스턴스가 가진 (offset, hotkey) lease
+        """
+        raise NotImplementedError
+
+    async def release(self, epoch, instance_id):
+        """인스턴스가 epoch에서 가진 모든 lease를 반납합니다."""
+        raise NotImplementedError
+
+    async def record_outcomes(self, epoch, instance_id, outcomes):
+        """
+        인스턴스의 epoch 제출 결과를 기록합니다.
+
+        Args:
+            epoch: 등록 epoch 블록 번호
+            instance_id: 이 인스턴스 ID
+            outcomes: [offset, hotkey ss58, outcome] 리스트 (outcome: "submitted", "rejected", "failed")
+        """
+        raise NotImplementedError
+
+    async def outcomes(self, epoch):
+        """
+        Returns:
+            List[dict]: epoch의 모든 인스턴스 제출 결과 {"offset", "hotkey", "instance", "outcome"} (기록 순)
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class SqliteBackend(CoordinationBackend):
+    """
+    SQLite 파일 기반 백엔드. 같은 호스트의 여러 프로세스가 하나의 파일을 공유할 수 있습니다.
+    lease 만료 시각은 이 백엔드를 실행하는 호스트의 시계로만 계산합니다.
+    sqlite3 호출은 다른 프로세스의 잠금을 최대 5초까지 기다리므로 모두 asyncio.to_thread에서 실행하여
+    이벤트 루프(헤더 구독, 제출)를 막지 않습니다.
+    """
+
+    def __init__(self, path=COORDINATOR_DB):
+        self.db = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(leases)")]
+        if "coldkey" in columns:
+            # lease마다 coldkey를 저장하던 이전 형식: lease는 epoch 동안만 유효하므로 버리고 다시 만듦
+            self.db.execute("DROP TABLE leases")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS leases (
+                epoch INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                hotkey TEXT NOT NULL,
+                instance TEXT NOT NULL,
+                expires REAL NOT NULL,
+                PRIMARY KEY (epoch, offset),
+                UNIQUE (epoch, hotkey)
+            );
+            CREATE TABLE IF NOT EXISTS outcomes (
+                epoch INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                hotkey TEXT NOT NULL,
+                instance TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                recorded REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS members (
+                coldkey TEXT PRIMARY KEY,
+                instance TEXT NOT NULL,
+                expires REAL NOT NULL
+            );
+        """)
+
+    async def join(self, instance_id, coldkeys, ttl):
+        return await asyncio.to_thread(self._join, instance_id, list(coldkeys), ttl)
+
+    async def leave(self, instance_id):
+        await asyncio.to_thread(self._leave, instance_id)
+
+    async def claim_slots(self, epoch, offsets, hotkeys, instance_id, ttl):
+        return await asyncio.to_thread(self._claim_slots, epoch, list(offsets), hotkeys, instance_id, ttl)
+
+    async def release(self, epoch, instance_id):
+        await asyncio.to_thread(self._release, epoch, instance_id)
+
+    async def record_outcomes(self, epoch, instance_id, outcomes):
+        await asyncio.to_thread(self._record_outcomes, epoch, instance_id, outcomes)
+
+    async def outcomes(self, epoch):
+        return await asyncio.to_thread(self._outcomes, epoch)
+
+    async def close(self):
+        await asyncio.to_thread(self._close)
+
+    def _join(self, instance_id, coldkeys, ttl):
+        with self._lock:
+            now = time.time()
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.execute("DELETE FROM members WHERE expires < ?", (now,))
+                conflicts = [
+                    (coldkey, instance)
+                    for coldkey, instance in self.db.execute("SELECT coldkey, instance FROM members").fetchall()
+                    if coldkey in coldkeys and instance != instance_id
+                ]
+                if not conflicts:
+                    self.db.executemany(
+                        "INSERT OR REPLACE INTO members (coldkey, instance, expires) VALUES (?, ?, ?)",
+                        [(coldkey, instance_id, now + ttl) for coldkey in coldkeys],
+                    )
+                self.db.execute("COMMIT")
+                return conflicts
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def _leave(self, instance_id):
+        with self._lock:
+            self.db.execute("DELETE FROM members WHERE instance = ?", (instance_id,))
+
+    def _claim_slots(self, epoch, offsets, hotkeys, instance_id, ttl):
+        with self._lock:
+            now = time.time()
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.execute("DELETE FROM leases WHERE expires < ?", (now,))
+                rows = self.db.execute(
+                    "SELECT offset, hotkey, instance FROM leases WHERE epoch = ?", (epoch,)
+                ).fetchall()
+                slot_owners = {offset: (instance, hotkey) for offset, hotkey, instance in rows}
+                taken = {hotkey for _, hotkey, _ in rows}
+                candidates = [hotkey for hotkey in hotkeys if hotkey not in taken]
+                claimed = []
+                for offset in offsets:
+                    owner = slot_owners.get(offset)
+                    if owner is not None:
+                        if owner[0] == instance_id:
+                            claimed.append((offset, owner[1]))
+                        continue
+                    if not candidates:
+                        continue
+                    hotkey = candidates.pop(0)
+                    self.db.execute(
+                        "INSERT INTO leases (epoch, offset, hotkey, instance, expires) VALUES (?, ?, ?, ?, ?)",
+                        (epoch, offset, hotkey, instance_id, now + ttl),
+                    )
+                    claimed.append((offset, hotkey))
+                self.db.execute(
+                    "UPDATE leases SET expires = ? WHERE epoch = ? AND instance = ?", (now + ttl, epoch, instance_id)
+                )
+                self.db.execute("COMMIT")
+                return claimed
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def _release(self, epoch, instance_id):
+        with self._lock:
+            self.db.execute("DELETE FROM leases WHERE epoch = ? AND instance = ?", (epoch, instance_id))
+
+    def _record_outcomes(self, epoch, instance_id, outcomes):
+        now = time.time()
+        with self._lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.execute("DELETE FROM outcomes WHERE recorded < ?", (now - OUTCOME_RETENTION,))
+                self.db.executemany(
+                    "INSERT INTO outcomes (epoch, offset, hotkey, instance, outcome, recorded) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(epoch, offset, hotkey, instance_id, outcome, now) for offset, hotkey, outcome in outcomes],
+                )
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def _outcomes(self, epoch):
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT offset, hotkey, instance, outcome FROM outcomes WHERE epoch = ? ORDER BY recorded, rowid",
+                (epoch,),
+            ).fetchall()
+        return [{"offset": offset, "hotkey": hotkey, "instance": instance, "outcome": outcome}
+                for offset, hotkey, instance, outcome in rows]
+
+    def _close(self):
+        with self._lock:
+            self.db.close()
+
+
+class TcpBackend(CoordinationBackend):
+    """
+    코디네이터 서버에 JSON line 요청을 보내는 클라이언트.
+    요청: {"op": "claim_slots", "args": {...}}  응답: {"ok": true, "result": ...} 또는 {"ok": false, "error": "..."}
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+        self._lock = asyncio.Lock()
+
+    async def _request(self, op, **args):
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._writer.write(json.dumps({"op": op, "args": args}).encode() + b"\n")
+            await self._writer.drain()
+            line = await self._reader.readline()
+        if not line:
+            self._writer = None
+            raise ConnectionError(f"Coordinator {self.host}:{self.port} closed the connection")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise RuntimeError(f"Coordinator error: {response['error']}")
+        return response["result"]
+
+    async def join(self, instance_id, coldkeys, ttl):
+        conflicts = await self._request("join", instance_id=instance_id, coldkeys=list(coldkeys), ttl=ttl)
+        return [(coldkey, instance) for coldkey, instance in conflicts]
+
+    async def leave(self, instance_id):
+        return await self._request("leave", instance_id=instance_id)
+
+    async def claim_slots(self, epoch, offsets, hotkeys, instance_id, ttl):
+        claimed = await self._request("claim_slots", epoch=epoch, offsets=list(offsets), hotkeys=hotkeys,
+                                      instance_id=instance_id, ttl=ttl)
+        return [(offset, hotkey) for offset, hotkey in claimed]
+
+    async def release(self, epoch, instance_id):
+        return await self._request("release", epoch=epoch, instance_id=instance_id)
+
+    async def record_outcomes(self, epoch, instance_id, outcomes):
+        return await self._request("record_outcomes", epoch=epoch, instance_id=instance_id,
+                                   outcomes=[list(outcome) for outcome in outcomes])
+
+    async def outcomes(self, epoch):
+        return await self._request("outcomes", epoch=epoch)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+async def start_coordinator_server(host=COORDINATOR_HOST, port=COORDINATOR_PORT, path=COORDINATOR_DB):
+    """
+    TCP 코디네이터 서버를 시작합니다. 상태는 SqliteBackend(path)에 저장되며,
+    `path=":memory:"`, `port=0`으로 localhost에서 임시 서버를 띄울 수 있습니다.
+
+    Returns:
+        asyncio.Server: 실행 중인 서버 (server.sockets[0].getsockname()으로 포트 확인)
+    """
+    backend = SqliteBackend(path)
+    operations = {
+        "join": backend.join,
+        "leave": backend.leave,
+        "claim_slots": backend.claim_slots,
+        "release": backend.release,
+        "record_outcomes": backend.record_outcomes,
+        "outcomes": backend.outcomes,
+    }
+
+    async def handle(reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    result = await operations[request["op"]](**request["args"])
+                    response = {"ok": True, "result": result}
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+def open_backend(url=COORDINATOR_URL):
+    """
+    COORDINATOR_URL에 맞는 백엔드를 생성합니다.
+
+    Returns:
+        CoordinationBackend | None: url이 비어 있으면 None (단독 실행)
+    """
+    if not url:
+        return None
+    if url.startswith("sqlite:///"):
+        return SqliteBackend(url[len("sqlite:///"):])
+    if url.startswith("tcp://"):
+        host, port = url[len("tcp://"):].rsplit(":", 1)
+        return TcpBackend(host, int(port))
+    raise ValueError(f"Unsupported COORDINATOR_URL: {url}")
+
+
+def coldkey_of(wallet):
+    """지갑의 coldkey 식별자. coldkey 공개키를 모르면(coldkeypub.txt 없음) coldkey 이름으로 구분합니다."""
+    return wallet.coldkeypub.ss58_address if wallet.coldkeypub else wallet.name
+
+
+async def join_fleet(backend, instance_id, wallets, ttl):
+    """
+    wallets의 coldkey로 인스턴스를 등록(또는 갱신)합니다.
+
+    Raises:
+        SharedColdkeyError: 살아 있는 다른 인스턴스가 같은 coldkey를 사용 중인 경우
+    """
+    coldkeys = sorted({coldkey_of(wallet) for wallet in wallets})
+    conflicts = await backend.join(instance_id, coldkeys, ttl)
+    if conflicts:
+        owners = ", ".join(f"{coldkey} (instance {instance})" for coldkey, instance in conflicts)
+        raise SharedColdkeyError(
+            f"Coldkeys already used by another instance: {owners}. Instances submit with their own nonces, "
+            f"so each instance needs its own coldkeys. If that instance is gone, restart with its INSTANCE_ID "
+            f"or wait for its membership to expire."
+        )
+
+
+async def assign_slots(backend, instance_id, epoch, wallets, max_slots, ttl):
+    """
+    epoch의 slot(offset 0..max_slots-1)들에 아직 배정되지 않은 hotkey의 lease를 한 번에 요청합니다.
+    그 epoch에 어느 인스턴스에서든 이미 제출되었거나 거절된 hotkey는 요청하지 않습니다
+    (재시작한 인스턴스나 lease가 만료된 slot을 다시 얻은 인스턴스가 같은 hotkey를 다시 제출하지 않도록).
+
+    Args:
+        backend: CoordinationBackend
+        instance_id: 이 인스턴스 ID
+        epoch: 등록 epoch 블록 번호
+        wallets: 미등록 지갑 리스트 (우선순위 순)
+        max_slots: epoch당 slot 수
+        ttl: lease 유지 시간 (초) - 등록 윈도우가 끝날 때까지
+
+    Returns:
+        List[Wallet | None]: slot별 배정 지갑 (다른 인스턴스가 가진 slot은 None)
+    """
+    outcomes = await backend.outcomes(epoch)
+    settled = {outcome["hotkey"] for outcome in outcomes if outcome["outcome"] in SETTLED_OUTCOMES}
+    by_hotkey = {
+        wallet.hotkey.ss58_address: wallet for wallet in wallets if wallet.hotkey.ss58_address not in settled
+    }
+    claimed = await backend.claim_slots(epoch, range(max_slots), list(by_hotkey), instance_id, ttl)
+
+    assignments = [None] * max_slots
+    for offset, hotkey in claimed:
+        assignments[offset] = by_hotkey.get(hotkey)
+    while assignments and assignments[-1] is None:
+        assignments.pop()
+    return assignments
+
+
+def main():
+    """코디네이터 서버 실행: COORDINATOR_HOST / COORDINATOR_PORT / COORDINATOR_DB"""
+
+    async def serve():
+        server = await start_coordinator_server()
+        print(f"Coordinator listening on {COORDINATOR_HOST}:{COORDINATOR_PORT} (db: {COORDINATOR_DB})")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nCoordinator stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+등록 extrinsic을 미리 여러 버전으로 서명해 두는 캐시.
+
+블록이 도착한 뒤 서명하면 compose/서명/인코딩 시간이 그대로 제출 지연이 됩니다.
+여기서는 윈도우 전에 hotkey마다 다음 조합을 모두 서명해 둡니다.
+
+    mortal era 기준 블록(anchor) x tip 단계(tier) x 가능한 nonce
+
+제출 시점에는 현재 블록에서 유효하고 nonce와 tip 단계가 맞는 버전을 고르기만 하므로 hot path에서 서명하지 않습니다.
+anchor는 최근 블록들로 갱신되며, 오래된 anchor가 재구성(reorg)으로 사라지거나 블록이 늦어져도 다른 anchor가 남습니다.
+"""
+import os
+import time
+
+MIN_ERA_PERIOD = 4
+MAX_ERA_PERIOD = 65536
+MAX_ANCHORS = int(os.getenv("VARIANT_MAX_ANCHORS", "2"))  # hotkey당 유지할 anchor 개수
+
+
+def era_period_for(blocks, minimum=MIN_ERA_PERIOD):
+    """blocks 이상을 덮는 mortal era 기간 (2의 거듭제곱, 4 ~ 65536)."""
+    period = MIN_ERA_PERIOD
+    while period < max(blocks, minimum) and period < MAX_ERA_PERIOD:
+        period *= 2
+    return period
+
+
+class SignedVariant:
+    __slots__ = ("hotkey", "nonce", "tier", "tip", "era_birth", "era_period", "extrinsic")
+
+    def __init__(self, hotkey, nonce, tier, tip, era_birth, era_period, extrinsic):
+        self.hotkey = hotkey
+        self.nonce = nonce
+        self.tier = tier
+        self.tip = tip
+        self.era_birth = era_birth
+        self.era_period = era_period
+        self.extrinsic = extrinsic
+
+    def valid_for(self, block_number):
+        """block_number 블록 헤더를 받고 제출하면 다음 블록에 포함되므로 그 블록까지 유효해야 합니다."""
+        return self.era_birth <= block_number and block_number + 1 < self.era_birth + self.era_period
+
+
+class VariantCache:
+    """
+    hotkey별 미리 서명된 extrinsic 버전 모음.
+
+    Args:
+        tip_tiers: tip 단계 리스트 (rao, 오름차순)
+    """
+
+    def __init__(self, tip_tiers):
+        self.tip_tiers = list(tip_tiers)
+        self._variants = {}  # hotkey -> List[SignedVariant]
+        self.anchors = []
+
+    def add(self, variant):
+        self._variants.setdefault(variant.hotkey, []).append(variant)
+
+    def select(self, hotkey, block_number, nonce, tier):
+        """
+        현재 블록에서 유효하고 nonce/tier가 일치하는 버전 중 가장 최근 anchor를 반환합니다.
+
+        Returns:
+            SignedVariant | None: 맞는 버전이 없으면 None (호출 측에서 직접 서명)
+        """
+        best = None
+        for variant in self._variants.get(hotkey, ()):
+            if variant.nonce != nonce or variant.tier != tier or not variant.valid_for(block_number):
+                continue
+            if best is None or variant.era_birth > best.era_birth:
+                best = variant
+        return best
+
+    def tier_for_competition(self, competitor_tip):
+        """관측된 경쟁자 최고 tip보다 높은 가장 낮은 tier (모두 낮으면 최고 tier)."""
+        if competitor_tip is None:
+            return 0
+        for tier, tip in enumerate(self.tip_tiers):
+            if tip > competitor_tip:
+                return tier
+        return len(self.tip_tiers) - 1
+
+    def drop_anchor(self, anchor):
+        self.anchors.remove(anchor)
+        for hotkey, variants in self._variants.items():
+            self._variants[hotkey] = [variant for variant in variants if variant.era_birth != anchor]
+
+    def __len__(self):
+        return sum(len(variants) for variants in self._variants.values())
+
+
+async def compose_registration_call(substrate, wallet, netuid):
+    """force_batch([burned_register]) 호출을 구성합니다."""
+    call = await substrate.compose_call(
+        call_module="SubtensorModule",
+        call_function="burned_register",
+        call_params={
+            "netuid": netuid,
+            "hotkey": wallet.hotkey.ss58_address,
+        },
+    )
+    return await substrate.compose_call(
+        call_module="Utility",
+        call_function="force_batch",
+        call_params={"calls": [call]},
+    )
+
+
+async def fetch_next_nonces(substrate, wallets):
+    """
+    지갑들의 coldkey별 다음 nonce를 노드에서 가져옵니다 (풀에 대기 중인 트랜잭션 포함).
+
+    Returns:
+        Dict[str, int]: {coldkey ss58: next nonce}
+    """
+    nonces = {}
+    for wallet in wallets:
+        if wallet is None:
+            continue
+        coldkey = wallet.coldkey.ss58_address
+        if coldkey not in nonces:
+            response = await substrate.rpc_request("account_nextIndex", [coldkey])
+            nonces[coldkey] = int(response["result"])
+    return nonces
+
+
+async def presign_registrations(substrate, cache, wallets, netuid, anchor_block, last_block, nonces, calls=None,
+                                era_period=MIN_ERA_PERIOD):
+    """
+    anchor_block을 era 기준으로 slot별 지갑의 등록 extrinsic을 tier/nonce 조합마다 서명해 cache에 추가합니다.
+    서명 도중 실패하면 이 anchor로 이미 추가한 버전을 모두 되돌리고 예외를 다시 발생시킵니다.
+
+    slot k의 지갑은 같은 coldkey의 앞선 slot 제출이 포함되지 않았을 수도 있으므로
+    nonce base ~ base + (그 coldkey의 앞선 slot 수)까지 모두 서명합니다.
+
+    Args:
+        substrate: AsyncSubstrateInterface 인스턴스
+        cache: VariantCache
+        wallets: slot 순서의 지갑 리스트 (None은 건너뜀)
+        netuid: 서브넷 ID
+        anchor_block: era 기준 블록 (이미 생성된 블록이어야 함)
+        last_block: 서명한 extrinsic이 유효해야 하는 마지막 제출 블록
+        nonces: fetch_next_nonces 결과
+        calls: {hotkey ss58: 미리 구성한 call} (재서명 시 compose 생략)
+        era_period: 최소 era 기간 (ERA_PERIOD, 직접 서명할 때와 같은 mortality를 쓰도록)
+
+    Returns:
+        Dict[str, call]: 사용한 call (다음 재서명에 재사용)
+    """
+    start = time.perf_counter()
+    calls = dict(calls or {})
+    period = era_period_for(last_block + 2 - anchor_block, minimum=era_period)
+    era = {"period": period, "current": anchor_block}
+    slots_per_coldkey = {}
+
+    # 서명 전에 anchor를 등록해야 실패해도 drop_anchor로 이 anchor의 버전을 지울 수 있음
+    cache.anchors.append(anchor_block)
+    try:
+        for wallet in wallets:
+            if wallet is None:
+                continue
+            hotkey = wallet.hotkey.ss58_address
+            coldkey = wallet.coldkey.ss58_address
+            earlier_slots = slots_per_coldkey.get(coldkey, 0)
+            slots_per_coldkey[coldkey] = earlier_slots + 1
+
+            if hotkey not in calls:
+                calls[hotkey] = await compose_registration_call(substrate, wallet, netuid)
+            base_nonce = nonces[coldkey]
+            for nonce in range(base_nonce, base_nonce + earlier_slots + 1):
+                for tier, tip in enumerate(cache.tip_tiers):
+                    extrinsic = await substrate.create_signed_extrinsic(
+                        call=calls[hotkey],
+                        keypair=wallet.coldkey,
+                        era=dict(era),
+                        nonce=nonce,
+                        tip=tip,
+                    )
+                    cache.add(SignedVariant(hotkey, nonce, tier, tip, anchor_block, period, extrinsic))
+    except BaseException:
+        cache.drop_anchor(anchor_block)
+        raise
+
+    while len(cache.anchors) > MAX_ANCHORS:
+        cache.drop_anchor(cache.anchors[0])
+
+    print(
+        f"Pre-signed {len(cache)} extrinsic variants (anchor {anchor_block}, era {period}, "
+        f"tiers {cache.tip_tiers}) in {(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return calls
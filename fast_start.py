@@ -0,0 +1,134 @@
+"""
+재시작 직후 빠르게 제출 준비를 마치기 위한 fast-start 경로.
+
+일반 시작은 `bittensor` 전체를 import하고(수 초), 지갑을 탐색한 뒤에야 연결/런타임 동기화를 시작합니다.
+fast-start에서는
+    - `bittensor`를 import하지 않고 async_substrate_interface만으로 노드에 연결합니다.
+    - 웹소켓 연결과 런타임 메타데이터 조회를 지갑 로드와 동시에 진행합니다.
+    - 메타데이터 RPC 응답을 spec version별로 디스크(METADATA_CACHE_DIR)에 저장해 두고 다음 시작부터 재사용합니다.
+    - 등록 call을 한 번 구성해 hot path를 데우고, 시작부터 여기까지의 시간(time-to-ready)을 출력합니다.
+"""
+import asyncio
+import json
+import os
+import re
+import time
+
+from async_substrate_interface import AsyncSubstrateInterface
+from dotenv import load_dotenv
+
+load_dotenv()
+
+METADATA_CACHE_DIR = os.path.expanduser(os.getenv("METADATA_CACHE_DIR", "~/.cache/register-bot/metadata"))
+SS58_FORMAT = 42
+
+# bittensor.core.settings.NETWORK_MAP과 같은 주소 (bittensor를 import하지 않기 위해 복사)
+NETWORK_URLS = {
+    "finney": "wss://entrypoint-finney.opentensor.ai:443",
+    "test": "wss://test.finney.opentensor.ai:443",
+    "archive": "wss://archive.chain.opentensor.ai:443",
+    "local": os.getenv("BT_SUBTENSOR_CHAIN_ENDPOINT") or "ws://127.0.0.1:9944",
+    "subvortex": "ws://subvortex.info:9944",
+    "latent-lite": "wss://lite.sub.latent.to:443",
+}
+
+# spec version이 같으면 응답이 같은 메타데이터 RPC
+METADATA_STATE_CALLS = ("Metadata_metadata_at_version",)
+
+
+def network_url(network):
+    """네트워크 이름 또는 ws(s):// 주소를 웹소켓 주소로 변환합니다."""
+    if network.startswith(("ws://", "wss://")):
+        return network
+    if network not in NETWORK_URLS:
+        raise ValueError(f"Unknown network: {network}")
+    return NETWORK_URLS[network]
+
+
+class MetadataCachedSubstrate(AsyncSubstrateInterface):
+    """
+    메타데이터 RPC(`state_getMetadata`, `state_call Metadata_metadata_at_version`) 응답을
+    (노드 주소, spec version) 기준으로 디스크에 캐시하는 AsyncSubstrateInterface.
+    spec version 확인에는 런타임 초기화가 원래 하는 `state_getRuntimeVersion` 응답을 그대로 사용합니다.
+    """
+
+    def __init__(self, url, cache_dir=METADATA_CACHE_DIR, **kwargs):
+        super().__init__(url, **kwargs)
+        self.cache_dir = cache_dir
+        self.metadata_cache_hits = 0
+
+    def _metadata_cache_path(self, method, spec_version):
+        # 같은 체인 이름을 쓰는 testnet과 섞이지 않도록 노드 주소로 구분
+        endpoint = re.sub(r"[^A-Za-z0-9_-]", "_", self.url)
+        return os.path.join(self.cache_dir, f"{endpoint}-{spec_version}-{method}.json")
+
+    async def rpc_request(self, method, params, result_handler=None, block_hash=None, reuse_block_hash=False,
+                          runtime=None):
+        at = None
+        if method == "state_getMetadata" and params:
+            at = params[0]
+        elif method == "state_call" and params and params[0] in METADATA_STATE_CALLS:
+            at = block_hash
+        if at is None or result_handler is not None:
+            return await super().rpc_request(method, params, result_handler, block_hash, reuse_block_hash, runtime)
+
+        runtime_info = await self.get_block_runtime_info(at)
+        path = self._metadata_cache_path(f"{method}-{params[0]}" if method == "state_call" else method,
+                                         runtime_info["specVersion"])
+        if os.path.exists(path):
+            with open(path) as f:
+                self.metadata_cache_hits += 1
+                return json.load(f)
+
+        response = await super().rpc_request(method, params, result_handler, block_hash, reuse_block_hash, runtime)
+        if "result" in response:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(response, f)
+            os.replace(f"{path}.tmp", path)
+        return response
+
+
+class LightSubtensor:
+    """
+    `bittensor` 없이 substrate 연결만 가진 AsyncSubtensor 대용.
+    register_force_v2는 `subtensor.substrate`만 사용하므로 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self.chain_endpoint = network_url(network)
+        self.substrate = MetadataCachedSubstrate(
+            self.chain_endpoint, ss58_format=SS58_FORMAT, chain_name="Bittensor"
+        )
+
+
+async def fast_start(network, load_wallets, compose_ready_call=None):
+    """
+    노드 연결/런타임 초기화와 지갑 로드를 동시에 진행합니다.
+
+    Args:
+        network: 네트워크 이름 또는 ws(s):// 주소
+        load_wallets: 지갑 리스트를 반환하는 동기 함수 (별도 스레드에서 실행)
+        compose_ready_call: async def f(substrate, wallets) - hot path를 데우는 작업 (선택)
+
+    Returns:
+        Tuple[LightSubtensor, list, dict]: (subtensor, wallets, 단계별 소요 시간(초))
+    """
+    start = time.perf_counter()
+    subtensor = LightSubtensor(network)
+
+    async def connect():
+        await subtensor.substrate.initialize()
+        return time.perf_counter() - start
+
+    async def wallets_in_thread():
+        wallets = await asyncio.to_thread(load_wallets)
+        return wallets, time.perf_counter() - start
+
+    connect_time, (wallets, wallets_time) = await asyncio.gather(connect(), wallets_in_thread())
+    timings = {"connect_and_metadata": connect_time, "wallets": wallets_time}
+    if compose_ready_call is not None and wallets:
+        await compose_ready_call(subtensor.substrate, wallets)
+    timings["ready"] = time.perf_counter() - start
+    return subtensor, wallets, timings
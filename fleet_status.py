@@ -0,0 +1,209 @@
+"""
+여러 coldkey x 여러 서브넷의 hotkey 등록 상태를 한 번에 조회합니다.
+
+coldkey/netuid마다 metagraph를 동기화하는 대신, 한 블록 해시에서 `Keys` 맵을 페이지 단위로 읽어
+모든 서브넷의 hotkey -> UID 매핑을 만들고, 발견한 모든 hotkey와 메모리에서 조인합니다.
+
+결과 (registered/unregistered 행렬, 설정한 경우에만 저장):
+    FLEET_OUTPUT_JSON  스케줄러용. register_force_v2는 같은 경로가 설정되어 있으면 이 파일에서 이미 등록된
+                       hotkey를 상태 확인 대상에서 제외합니다 (load_fleet_status / unregistered_hotkeys)
+    FLEET_OUTPUT_CSV   행: hotkey, 열: netuid, 값: UID (미등록은 빈 칸)
+
+사용법:
+    FLEET_COLDKEYS=cold1,cold2 FLEET_NETUIDS=1,19,64 FLEET_OUTPUT_JSON=fleet_status.json python fleet_status.py
+"""
+import asyncio
+import csv
+import json
+import os
+import time
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from hotkey_records import discover_wallets
+from hotkey_status import fetch_all_hotkey_uids, fetch_hotkey_uids
+
+load_dotenv()
+
+FLEET_COLDKEYS = [
+    name.strip() for name in os.getenv("FLEET_COLDKEYS", os.getenv("COLD_KEY", "")).split(",") if name.strip()
+]
+# 비워 두면 모든 서브넷
+FLEET_NETUIDS = [int(netuid) for netuid in os.getenv("FLEET_NETUIDS", "").split(",") if netuid.strip()]
+FLEET_OUTPUT_JSON = os.getenv("FLEET_OUTPUT_JSON")  # 설정하지 않으면 JSON을 저장하지 않음
+FLEET_OUTPUT_CSV = os.getenv("FLEET_OUTPUT_CSV")  # 설정하지 않으면 CSV를 저장하지 않음
+
+
+def discover_fleet(wallet_path, coldkeys):
+    """
+    coldkey들의 모든 hotkey를 탐색합니다.
+
+    Returns:
+        List[dict]: {"coldkey": coldkey 이름, "hotkey": hotkey 이름, "ss58": hotkey 주소}
+    """
+    fleet = []
+    for coldkey in coldkeys:
+        for wallet in discover_wallets(wallet_path, coldkey):
+            fleet.append({"coldkey": coldkey, "hotkey": wallet.hotkey_str, "ss58": wallet.hotkey.ss58_address})
+    return fleet
+
+
+async def fetch_fleet_status(subtensor, fleet, netuids=None):
+    """
+    한 블록 해시에서 서브넷별 hotkey -> UID 매핑을 읽어 fleet과 조인합니다.
+
+    Args:
+        subtensor: AsyncSubtensor 인스턴스
+        fleet: discover_fleet 결과
+        netuids: 확인할 서브넷 ID 리스트 (None이면 모든 서브넷을 한 번의 query_map으로 조회)
+
+    Returns:
+        dict: {"block", "block_hash", "netuids", "hotkeys": [{"coldkey", "hotkey", "ss58", "uids": {netuid: uid}}]}
+    """
+    substrate = subtensor.substrate
+    block_hash = await substrate.get_chain_head()
+    block = await substrate.get_block_number(block_hash)
+
+    if netuids:
+        mappings = await asyncio.gather(
+            *(fetch_hotkey_uids(substrate, netuid, block_hash=block_hash) for netuid in netuids)
+        )
+        subnet_uids = dict(zip(netuids, mappings))
+    else:
+        subnet_uids = await fetch_all_hotkey_uids(substrate, block_hash=block_hash)
+        netuids = sorted(subnet_uids)
+
+    hotkeys = []
+    for entry in fleet:
+        uids = {
+            netuid: subnet_uids[netuid][entry["ss58"]]
+            for netuid in netuids
+            if entry["ss58"] in subnet_uids[netuid]
+        }
+        hotkeys.append({**entry, "uids": uids})
+    return {"block": block, "block_hash": block_hash, "netuids": list(netuids), "hotkeys": hotkeys}
+
+
+def save_fleet_status(status, json_path=FLEET_OUTPUT_JSON, csv_path=FLEET_OUTPUT_CSV):
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(status, f, indent=2)
+    if csv_path:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["coldkey", "hotkey", "ss58", *status["netuids"]])
+            for entry in status["hotkeys"]:
+                writer.writerow([
+                    entry["coldkey"], entry["hotkey"], entry["ss58"],
+                    *(entry["uids"].get(netuid, "") for netuid in status["netuids"]),
+                ])
+
+
+def load_fleet_status(path=FLEET_OUTPUT_JSON):
+    """
+    저장된 fleet 상태를 읽습니다. JSON 키로 문자열이 된 netuid는 정수로 되돌립니다.
+
+    Returns:
+        dict | None: 경로가 없거나 파일이 없으면 None
+    """
+    if not path or not os.path.exists(path):
+        return None
+    with open(path) as f:
+        status = json.load(f)
+    for entry in status["hotkeys"]:
+        entry["uids"] = {int(netuid): uid for netuid, uid in entry["uids"].items()}
+    return status
+
+
+def unregistered_hotkeys(status, netuid, coldkey=None):
+    """
+    fleet 상태에서 netuid에 등록되지 않은 hotkey 주소를 반환합니다.
+
+    Args:
+        status: fetch_fleet_status / load_fleet_status 결과
+        netuid: 서브넷 ID
+        coldkey: 지정하면 해당 coldkey의 hotkey만
+
+    Returns:
+        Set[str]: 미등록 hotkey ss58 주소
+    """
+    return {
+        entry["ss58"]
+        for entry in status["hotkeys"]
+        if netuid not in entry["uids"] and (coldkey is None or entry["coldkey"] == coldkey)
+    }
+
+
+def skip_registered(wallets, status, netuid):
+    """
+    fleet 상태에서 netuid에 이미 등록된 것으로 나온 지갑을 뺍니다. fleet 상태에 없는 hotkey는 그대로 둡니다.
+    상태가 만들어진 뒤 등록이 해제된 hotkey는 fleet_status.py를 다시 실행할 때까지 빠지므로 주기적으로 갱신해야 합니다.
+
+    Args:
+        wallets: 지갑 (또는 HotkeyRecord) 리스트
+        status: fetch_fleet_status / load_fleet_status 결과
+        netuid: 서브넷 ID
+
+    Returns:
+        List[Wallet]: 상태 확인이 필요한 지갑 리스트 (순서 유지)
+    """
+    known = {entry["ss58"] for entry in status["hotkeys"]}
+    pending = unregistered_hotkeys(status, netuid)
+    return [
+        wallet for wallet in wallets
+        if wallet.hotkey.ss58_address not in known or wallet.hotkey.ss58_address in pending
+    ]
+
+
+def print_summary(status):
+    """coldkey x netuid별 등록 수를 출력합니다. 모든 서브넷 조회 시에는 하나 이상 등록된 서브넷만 표시합니다."""
+    coldkeys = sorted({entry["coldkey"] for entry in status["hotkeys"]})
+    netuids = status["netuids"]
+    if not FLEET_NETUIDS:
+        netuids = [netuid for netuid in netuids if any(netuid in entry["uids"] for entry in status["hotkeys"])]
+
+    print(f"\nRegistered hotkeys per coldkey/netuid at block {status['block']}:")
+    print(f"{'coldkey':>16} " + " ".join(f"{netuid:>7}" for netuid in netuids))
+    for coldkey in coldkeys:
+        entries = [entry for entry in status["hotkeys"] if entry["coldkey"] == coldkey]
+        counts = (sum(1 for entry in entries if netuid in entry["uids"]) for netuid in netuids)
+        print(f"{coldkey:>16} " + " ".join(f"{f'{count}/{len(entries)}':>7}" for count in counts))
+    if not netuids:
+        print("  (no fleet hotkeys are registered on any subnet)")
+
+
+def main():
+    from bittensor.core.async_subtensor import AsyncSubtensor
+
+    network = os.getenv("NETWORK", "finney")
+    wallet_path = os.getenv("WALLET_PATH", "~/.bittensor/wallets")
+    if not FLEET_COLDKEYS:
+        raise ValueError("FLEET_COLDKEYS (or COLD_KEY) must be set in .env file")
+
+    fleet = discover_fleet(wallet_path, FLEET_COLDKEYS)
+    print(f"\nChecking {len(fleet)} hotkeys from {len(FLEET_COLDKEYS)} coldkeys on "
+          f"{', '.join(map(str, FLEET_NETUIDS)) if FLEET_NETUIDS else 'all subnets'} ({network})...")
+
+    async def fetch():
+        subtensor = AsyncSubtensor(network=network)
+        try:
+            return await fetch_fleet_status(subtensor, fleet, FLEET_NETUIDS or None)
+        finally:
+            await subtensor.close()
+
+    start = time.perf_counter()
+    status = asyncio.run(fetch())
+    status.update({"network": network, "generated_at": datetime.now().isoformat(timespec="seconds")})
+    elapsed = time.perf_counter() - start
+
+    print_summary(status)
+    save_fleet_status(status)
+    print(f"\nFetched {len(status['netuids'])} subnets in {elapsed:.1f}s")
+    for path in (FLEET_OUTPUT_JSON, FLEET_OUTPUT_CSV):
+        if path:
+            print(f"Saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+프로세스 전체에서 새 블록 헤더 구독 하나를 공유하는 fan-out.
+
+epoch마다 `subscribe_raw_new_heads`를 새로 호출하면 윈도우 직전에 구독 설정 지연이 생기고,
+핸들러가 끝내 None이 아닌 값을 반환하지 않으면 구독이 남아 계속 쌓입니다.
+HeaderHub는 `chain_subscribeNewHeads`를 한 번만 구독하고(오류가 나면 다시 구독) 도착한 헤더를
+붙어 있는 구독자들에게 나눠 줍니다. epoch, 체인 시계, 기록기는 hub에 attach/detach만 합니다.
+
+    priority 구독자:   헤더 도착 즉시 attach 순서대로 await (epoch 제출 경로, 기록기)
+    background 구독자: 구독자마다 task 하나에서 실행, 이전 헤더를 아직 처리 중이면 새 헤더는 버림 (체인 시계 등)
+
+핸들러가 None이 아닌 값을 반환하면 `subscribe_raw_new_heads`와 같이 구독자가 떨어지고 wait()가 그 값을 반환합니다.
+핸들러가 예외를 던지면 구독자가 떨어지고 wait()가 그 예외를 던집니다.
+
+async_substrate_interface는 구독 알림마다 핸들러 반환값을 요청 결과 리스트에 쌓으므로,
+HUB_ROTATE_BLOCKS 블록마다 priority 구독자가 없을 때(윈도우 밖) 구독을 새로 만들어 메모리가 늘지 않게 합니다.
+"""
+import asyncio
+import os
+
+from dotenv import load_dotenv
+
+from raw_headers import subscribe_raw_new_heads
+
+load_dotenv()
+
+HUB_RECONNECT_DELAY = float(os.getenv("HUB_RECONNECT_DELAY", "1"))  # 구독 오류 후 다시 구독하기까지 (초)
+HUB_ROTATE_BLOCKS = int(os.getenv("HUB_ROTATE_BLOCKS", "7200"))  # 구독을 새로 만드는 간격 (블록, 약 하루)
+
+_ROTATE = object()
+
+
+class SubscriptionEnded(Exception):
+    """헤더 스트림이 영구히 끝남. substrate가 이 예외를 던지면 hub는 다시 구독하지 않고 멈춥니다."""
+
+
+class HeadSubscriber:
+    """
+    hub에 붙은 구독자 하나.
+
+    Attributes:
+        name: 로그용 이름
+        priority: True면 헤더 도착 즉시 await, False면 백그라운드 task에서 실행
+        delivered: 처리한 헤더 수
+        dropped: 이전 헤더를 처리 중이라 버린 헤더 수 (background만)
+    """
+
+    def __init__(self, hub, handler, priority, name):
+        self.name = name
+        self.priority = priority
+        self.delivered = 0
+        self.dropped = 0
+        self._hub = hub
+        self._handler = handler
+        self._task = None
+        self._done = asyncio.get_running_loop().create_future()
+
+    @property
+    def attached(self):
+        return not self._done.done()
+
+    async def wait(self):
+        """구독자가 떨어질 때까지 기다립니다. 핸들러가 반환한 값 (detach/hub 정지면 None)."""
+        return await self._done
+
+    def _finish(self, result=None, error=None):
+        if self._done.done():
+            return
+        if error is not None:
+            self._done.set_exception(error)
+        else:
+            self._done.set_result(result)
+
+    async def _call(self, head):
+        try:
+            result = await self._handler(head)
+        except Exception as e:
+            print(f"\n⚠ Header handler {self.name} failed at block {head.number}: {e}")
+            self._hub.detach(self, error=e)
+            return
+        self.delivered += 1
+        if result is not None:
+            self._hub.detach(self, result)
+
+    def _deliver(self, head):
+        if self._task is not None and not self._task.done():
+            self.dropped += 1
+            return
+        self._task = asyncio.create_task(self._call(head))
+
+
+class HeaderHub:
+    """
+    Args:
+        substrate: AsyncSubstrateInterface 인스턴스
+        reconnect_delay: 구독 오류 후 다시 구독하기까지 (초)
+        rotate_blocks: 구독을 새로 만드는 간격 (블록)
+
+    Attributes:
+        latest: 마지막으로 받은 RawHead
+        received: 받은 헤더 수
+        subscriptions: 구독을 만든 횟수 (시작 + 재구독 + 교체)
+    """
+
+    def __init__(self, substrate, reconnect_delay=HUB_RECONNECT_DELAY, rotate_blocks=HUB_ROTATE_BLOCKS):
+        self.substrate = substrate
+        self.reconnect_delay = reconnect_delay
+        self.rotate_blocks = rotate_blocks
+        self.latest = None
+        self.received = 0
+        self.subscriptions = 0
+        self._subscribers = []
+        self._task = None
+        self._subscribed_at = None
+
+    def attach(self, handler, priority=False, name=None):
+        """
+        Args:
+            handler: async def handler(head: RawHead)
+            priority: 제출 경로처럼 헤더 도착 즉시 실행해야 하는 핸들러면 True
+            name: 로그용 이름 (기본: 함수 이름)
+
+        Returns:
+            HeadSubscriber
+        """
+        subscriber = HeadSubscriber(self, handler, priority, name or getattr(handler, "__name__", "handler"))
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def detach(self, subscriber, result=None, error=None):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+        subscriber._finish(result, error)
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscriber in list(self._subscribers):
+            self.detach(subscriber)
+
+    async def _dispatch(self, head):
+        previous = self.latest
+        if previous is not None and head.number > previous.number + 1:
+            print(f"\n⚠ Header hub missed blocks {previous.number + 1}..{head.number - 1}")
+        self.latest = head
+        self.received += 1
+        if self._subscribed_at is None:
+            self._subscribed_at = head.number
+
+        subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.priority and subscriber.attached:
+                await subscriber._call(head)
+        for subscriber in subscribers:
+            if not subscriber.priority and subscriber.attached:
+                subscriber._deliver(head)
+
+        # 윈도우 밖에서만 구독 교체 (subscribe_raw_new_heads가 구독을 해제하고 반환)
+        if (
+            head.number - self._subscribed_at >= self.rotate_blocks
+            and not any(subscriber.priority for subscriber in self._subscribers)
+        ):
+            return _ROTATE
+        return None
+
+    async def _run(self):
+        while True:
+            self.subscriptions += 1
+            self._subscribed_at = None
+            try:
+                await subscribe_raw_new_heads(self.substrate, self._dispatch)
+            except asyncio.CancelledError:
+                raise
+            except SubscriptionEnded as e:
+                for subscriber in list(self._subscribers):
+                    self.detach(subscriber, error=e)
+                return
+            except Exception as e:
+                print(f"\n⚠ Header subscription failed: {e}, resubscribing in {self.reconnect_delay:.0f}s")
+                await asyncio.sleep(self.reconnect_delay)
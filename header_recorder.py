@@ -0,0 +1,141 @@
+"""
+실행 중 헤더 스트림과 RPC 응답 기록.
+
+register_miner_epoch의 타이밍 버그(idx 계산, 완료 조건, 늦게 도착한 헤더)는 메인넷에서 재현할 수 없으므로
+epoch 하나의 입력을 파일 하나에 기록해 두고 replay_harness.py로 그대로 다시 실행합니다.
+
+기록 파일 (gzip JSON lines):
+    {"type": "meta", ...}                         epoch 계획 (지갑, START_OFFSET, MAX_SLOTS, tip 단계, mempool 감시,
+                                                  fallback 엔드포인트 수 등)
+    {"t": 0.0123, "type": "head", "header": {...}} 헤더 알림 (t: 기록 시작부터 도착까지의 monotonic 초)
+    {"t": ..., "type": "rpc", "method", "params", "result"}
+    {"t": ..., "type": "block", "block_number", "extrinsics"}
+    {"t": ..., "type": "submit", "endpoint", "response": {...}}        endpoint 0: 주 연결, 1~: FALLBACK_ENDPOINTS
+    {"t": ..., "type": "submit", "endpoint", "exception", "message"}   응답 없이 실패한 제출 (연결 오류 등)
+    {"t": ..., "type": "pool", "refresh", "competitors": {...}}        mempool watcher가 디코딩한 풀 상태
+    {"t": ..., "type": "pool_refresh", "refresh", "fresh"}             새 블록에서 다시 조회한 결과를 썼는지
+    {"t": ..., "type": "pool_defer", "block", "idx", "pool_tip"}       풀 경쟁 때문에 slot을 미룸 (MEMPOOL_DEFER)
+    {"t": ..., "type": "pool_bump", "block", "idx", "tier", "pool_tip"} 풀 경쟁자 때문에 더 높은 tier로 재제출
+    {"t": ..., "type": "fallback_submit", "block", "idx", "endpoint"}   FALLBACK_ENDPOINTS 노드로 제출
+    {"type": "result", "attempts": [...], "completed": bool}
+
+mempool watcher는 author_pendingExtrinsics 응답 대신 디코딩한 풀 상태(pool)를 기록하므로 재생할 때 메타데이터가
+필요 없습니다. pool_defer / pool_bump / fallback_submit은 결정을 확인하기 위한 기록이며 재생 입력은 아닙니다.
+
+기록은 메모리에 쌓았다가 epoch가 끝날 때 한 번에 쓰므로 제출 경로에서는 파일 I/O가 없습니다.
+"""
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from chain_utils import plain
+
+load_dotenv()
+
+RECORD_DIR = os.getenv("RECORD_DIR")  # 설정하면 epoch마다 기록 파일 생성
+
+
+class StreamRecorder:
+    """
+    Args:
+        path: 기록 파일 경로 (.jsonl.gz)
+        meta: 첫 줄에 기록할 epoch 계획
+    """
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        self.started = time.monotonic()
+        self.events = []
+
+    def record(self, kind, monotonic=None, **fields):
+        if monotonic is None:
+            monotonic = time.monotonic()
+        self.events.append({"t": round(monotonic - self.started, 6), "type": kind, **fields})
+
+    async def on_head(self, head):
+        """HeaderHub priority 구독자. 헤더를 도착 시각 그대로 기록합니다."""
+        self.record("head", head.arrival, header=head.raw)
+
+    def close(self, **result):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with gzip.open(self.path, "wt") as f:
+            for line in ({"type": "meta", **self.meta}, *self.events, {"type": "result", **result}):
+                f.write(json.dumps(line, separators=(",", ":"), default=str) + "\n")
+        print(f"Recorded {len(self.events)} events to {self.path}")
+        return self.path
+
+
+class RecordingSubstrate:
+    """
+    substrate 호출을 그대로 전달하면서 epoch 스케줄러가 사용하는 응답을 recorder에 기록하는 프록시.
+    기록하지 않는 메서드(compose_call, create_signed_extrinsic 등)는 원래 substrate로 바로 전달됩니다.
+    헤더는 구독을 감싸지 않고 HeaderHub에 recorder.on_head를 붙여 기록합니다.
+
+    Args:
+        substrate: 감쌀 substrate
+        recorder: StreamRecorder
+        endpoint: 제출 기록에 남길 엔드포인트 번호 (0: 주 연결, 1~: FALLBACK_ENDPOINTS 순서)
+    """
+
+    def __init__(self, substrate, recorder, endpoint=0):
+        self._substrate = substrate
+        self._recorder = recorder
+        self._endpoint = endpoint
+
+    def __getattr__(self, name):
+        return getattr(self._substrate, name)
+
+    async def get_block_number(self, block_hash=None):
+        result = await self._substrate.get_block_number(block_hash)
+        self._recorder.record("rpc", method="get_block_number", params=[block_hash], result=result)
+        return result
+
+    async def rpc_request(self, method, params, *args, **kwargs):
+        response = await self._substrate.rpc_request(method, params, *args, **kwargs)
+        self._recorder.record("rpc", method=method, params=params, result=response.get("result"))
+        return response
+
+    async def get_block(self, block_hash=None, block_number=None, **kwargs):
+        block = await self._substrate.get_block(block_hash=block_hash, block_number=block_number, **kwargs)
+        self._recorder.record(
+            "block",
+            block_number=block_number,
+            extrinsics=[plain(extrinsic) for extrinsic in block["extrinsics"]],
+        )
+        return block
+
+    def _record_failure(self, error):
+        self._recorder.record("submit", endpoint=self._endpoint, exception=type(error).__name__, message=str(error))
+
+    async def submit_extrinsic(self, extrinsic, *args, **kwargs):
+        try:
+            receipt = await self._substrate.submit_extrinsic(extrinsic, *args, **kwargs)
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._recorder.record("submit", endpoint=self._endpoint, response={"result": receipt.extrinsic_hash})
+        return receipt
+
+    async def _make_rpc_request(self, payloads, *args, **kwargs):
+        methods = {payload["payload"]["method"] for payload in payloads}
+        try:
+            result = await self._substrate._make_rpc_request(payloads, *args, **kwargs)
+        except Exception as e:
+            if "author_submitExtrinsic" in methods:
+                self._record_failure(e)
+            raise
+        if "author_submitExtrinsic" in methods:
+            for payload in payloads:
+                self._recorder.record("submit", endpoint=self._endpoint, response=result[payload["id"]][0])
+        return result
+
+
+def open_recorder(directory, epoch, meta):
+    """epoch 기록을 시작합니다. 파일 이름: epoch-<epoch 블록>-<시각>.jsonl.gz"""
+    name = f"epoch-{epoch}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl.gz"
+    return StreamRecorder(os.path.join(directory, name), meta)
@@ -0,0 +1,322 @@
+"""
+hotkey가 수천 개인 coldkey를 위한 가벼운 hotkey 레코드.
+
+`discover_hotkeys`는 hotkey마다 `Wallet`을 만들고 keypair를 로드합니다. 상태 확인과 slot 배정에는
+hotkey 이름과 ss58 주소만 필요하므로, 여기서는 키파일 JSON의 `ss58Address` / `publicKey`만 읽어
+HotkeyRecord로 보관하고 실제로 slot에 배정된 hotkey만 keypair를 로드합니다.
+
+HotkeyRecord는 `wallet.name`, `wallet.hotkey_str`, `wallet.path`, `wallet.hotkey.ss58_address`, `wallet.coldkeypub`를
+Wallet과 같은 이름으로 제공하므로 get_unregistered_hotkeys / assign_slots / 제출 워커 계획에 그대로 넘길 수 있습니다.
+제출할 지갑은 WalletLoader가 keypair를 한 번만 읽어 LoadedWallet으로 캐시합니다.
+"""
+import getpass
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SCALE_MODE = os.getenv("SCALE_MODE", "0") == "1"  # hotkey를 HotkeyRecord로 보관하고 배정 시에만 keypair 로드
+HOTKEY_LOG_LIMIT = int(os.getenv("HOTKEY_LOG_LIMIT", "20"))  # hotkey가 이보다 많으면 hotkey별 로그 대신 요약만 출력
+
+
+# Wallet.coldkeypub 호환 (ss58_address만 사용)
+PublicKey = namedtuple("PublicKey", ["ss58_address", "public_key"])
+
+
+def is_hotkey_file(name):
+    """공개키 파일(.pub, .pub.txt, .txt)과 숨김 파일을 제외한 hotkey 키파일 이름인지."""
+    return not (name.startswith(".") or name.endswith((".pub", ".pub.txt", ".txt")))
+
+
+class HotkeyRecord:
+    """
+    Wallet 대신 보관하는 hotkey 레코드.
+
+    Attributes:
+        name: coldkey 이름 (Wallet.name)
+        hotkey_str: hotkey 이름
+        path: 지갑 디렉토리 경로
+        ss58_address: hotkey ss58 주소
+        public_key: hotkey 공개키 (bytes)
+        coldkeypub: coldkey 공개키 PublicKey (coldkeypub.txt가 없으면 None)
+    """
+
+    __slots__ = ("name", "hotkey_str", "path", "ss58_address", "public_key", "coldkeypub")
+
+    def __init__(self, name, hotkey_str, path, ss58_address, public_key, coldkeypub=None):
+        self.name = name
+        self.hotkey_str = hotkey_str
+        self.path = path
+        self.ss58_address = ss58_address
+        self.public_key = public_key
+        self.coldkeypub = coldkeypub
+
+    @property
+    def hotkey(self):
+        # wallet.hotkey.ss58_address 호환
+        return self
+
+    @classmethod
+    def from_keyfile(cls, name, hotkey_str, path, keyfile, coldkeypub=None):
+        """
+        hotkey 키파일(또는 공개키 파일) JSON에서 레코드를 만듭니다.
+
+        Raises:
+            ValueError: JSON이 아니거나(암호화된 키파일 등) ss58Address/publicKey가 없는 경우
+        """
+        public = read_public_key(keyfile)
+        return cls(name, hotkey_str, path, public.ss58_address, public.public_key, coldkeypub)
+
+    def __repr__(self):
+        return f"HotkeyRecord({self.name}/{self.hotkey_str} {self.ss58_address})"
+
+
+def read_public_key(keyfile):
+    """
+    키파일(또는 공개키 파일) JSON의 ss58Address / publicKey를 읽습니다.
+
+    Raises:
+        ValueError: JSON이 아니거나(암호화된 키파일 등) ss58Address/publicKey가 없는 경우
+    """
+    with open(keyfile, "rb") as f:
+        data = json.loads(f.read())
+    try:
+        return PublicKey(data["ss58Address"], bytes.fromhex(data["publicKey"][2:]))
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"missing {e} in keyfile") from e
+
+
+class LoadedWallet:
+    """
+    keypair를 미리 읽어 둔 지갑. 제출 경로에서 Wallet 대신 사용합니다.
+    bittensor_wallet의 Wallet.coldkey는 접근할 때마다 키파일을 다시 읽고 복호화하므로 keypair를 직접 보관합니다.
+
+    Attributes:
+        name: coldkey 이름
+        hotkey_str: hotkey 이름
+        path: 지갑 디렉토리 경로
+        hotkey: hotkey Keypair
+        coldkey: coldkey Keypair (같은 coldkey의 지갑끼리 공유)
+    """
+
+    __slots__ = ("name", "hotkey_str", "path", "hotkey", "coldkey")
+
+    def __init__(self, name, hotkey_str, path, hotkey, coldkey):
+        self.name = name
+        self.hotkey_str = hotkey_str
+        self.path = path
+        self.hotkey = hotkey
+        self.coldkey = coldkey
+
+    def __repr__(self):
+        return f"LoadedWallet({self.name}/{self.hotkey_str} {self.hotkey.ss58_address})"
+
+
+class WalletLoader:
+    """
+    지갑 keypair를 한 번만 읽어 캐시합니다. coldkey는 (경로, 이름)마다 한 번만 복호화하여 모든 hotkey가 공유하고,
+    로드한 지갑은 epoch가 바뀌어도 다시 읽지 않습니다.
+
+    Args:
+        password: 암호화된 coldkey의 비밀번호 (None이면 bittensor의 BT_PW_* 환경 변수, 그것도 없으면 프롬프트)
+    """
+
+    def __init__(self, password=None):
+        self.password = password
+        self._coldkeys = {}
+        self._wallets = {}
+
+    def coldkey(self, name, path):
+        key = (os.path.expanduser(path), name)
+        if key not in self._coldkeys:
+            from bittensor_wallet import Wallet
+
+            self._coldkeys[key] = Wallet(name=name, path=key[0]).coldkey_file.get_keypair(password=self.password)
+        return self._coldkeys[key]
+
+    def load(self, name, hotkey_str, path):
+        """
+        Returns:
+            LoadedWallet: 캐시된 지갑 (처음이면 hotkey 키파일을 읽고 coldkey는 공유)
+        """
+        key = (os.path.expanduser(path), name, hotkey_str)
+        if key not in self._wallets:
+            from bittensor_wallet import Wallet
+
+            hotkey = Wallet(name=name, hotkey=hotkey_str, path=key[0]).hotkey
+            self._wallets[key] = LoadedWallet(name, hotkey_str, path, hotkey, self.coldkey(name, path))
+        return self._wallets[key]
+
+
+def coldkey_password(name, path, password=None):
+    """
+    암호화된 coldkey의 비밀번호를 확인하여 반환합니다. 제출 워커처럼 stdin이 없는 프로세스에 넘길 때 사용합니다.
+    password가 없으면 한 번 묻습니다.
+
+    Returns:
+        str | None: 확인된 비밀번호 (암호화되지 않은 coldkey면 None)
+
+    Raises:
+        KeyFileError: 비밀번호가 틀린 경우
+    """
+    from bittensor_wallet import Wallet
+
+    keyfile = Wallet(name=name, path=os.path.expanduser(path)).coldkey_file
+    if not keyfile.is_encrypted():
+        return None
+    if password is None:
+        password = getpass.getpass(f"Password for coldkey {name}: ")
+    keyfile.get_keypair(password=password)
+    return password
+
+
+def discover_hotkey_records(wallet_path, coldkey_name):
+    """
+    coldkey의 모든 hotkey를 HotkeyRecord로 탐색합니다. 로그는 hotkey별이 아니라 요약으로 출력합니다.
+
+    Args:
+        wallet_path: 지갑 디렉토리 경로
+        coldkey_name: coldkey 이름
+
+    Returns:
+        List[HotkeyRecord]: 이름 순으로 정렬된 레코드 (같은 주소는 처음 것만)
+    """
+    expanded_path = os.path.expanduser(wallet_path)
+    hotkeys_path = os.path.join(expanded_path, coldkey_name, "hotkeys")
+    if not os.path.isdir(hotkeys_path):
+        print(f"Warning: Hotkeys directory not found: {hotkeys_path}")
+        return []
+
+    try:
+        coldkeypub = read_public_key(os.path.join(expanded_path, coldkey_name, "coldkeypub.txt"))
+    except (OSError, ValueError) as e:
+        print(f"⚠ Could not read coldkeypub.txt for {coldkey_name}: {e}")
+        coldkeypub = None
+
+    records = []
+    seen_addresses = set()
+    skipped = duplicates = 0
+    failures = []
+    with os.scandir(hotkeys_path) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if not entry.is_file():
+                continue
+            if not is_hotkey_file(entry.name):
+                skipped += 1
+                continue
+            try:
+                record = HotkeyRecord.from_keyfile(coldkey_name, entry.name, expanded_path, entry.path, coldkeypub)
+            except ValueError:
+                # 암호화된 hotkey는 같이 저장된 <이름>pub.txt 공개키 파일에서 읽음
+                try:
+                    record = HotkeyRecord.from_keyfile(
+                        coldkey_name, entry.name, expanded_path, os.path.join(hotkeys_path, f"{entry.name}pub.txt"),
+                        coldkeypub,
+                    )
+                except (OSError, ValueError) as e:
+                    failures.append((entry.name, e))
+                    continue
+            except OSError as e:
+                failures.append((entry.name, e))
+                continue
+            if record.ss58_address in seen_addresses:
+                duplicates += 1
+                continue
+            seen_addresses.add(record.ss58_address)
+            records.append(record)
+
+    print(f"✓ Discovered {len(records)} hotkeys for {coldkey_name} "
+          f"(skipped {skipped} public key files, {duplicates} duplicates, {len(failures)} unreadable)")
+    for name, error in failures[:HOTKEY_LOG_LIMIT]:
+        print(f"✗ Failed to read hotkey {name}: {error}")
+    if len(failures) > HOTKEY_LOG_LIMIT:
+        print(f"✗ ... and {len(failures) - HOTKEY_LOG_LIMIT} more unreadable hotkeys")
+    return records
+
+
+def discover_hotkeys(wallet_path, coldkey_name):
+    """
+    지정된 coldkey에 연결된 모든 hotkey를 자동으로 탐색합니다.
+    공개키 파일(.pub, .pub.txt 등)은 제외하고 실제 개인키 파일만 탐색합니다.
+    hotkey가 HOTKEY_LOG_LIMIT개보다 많으면 파일별 로그 대신 요약만 출력합니다.
+    
+    Args:
+        wallet_path: 지갑 디렉토리 경로
+        coldkey_name: coldkey 이름
+    
+    Returns:
+        List[Wallet]: 발견된 모든 지갑 리스트
+    """
+    from bittensor_wallet import Wallet
+
+    expanded_path = Path(os.path.expanduser(wallet_path))
+    coldkey_path = expanded_path / coldkey_name / "hotkeys"
+    
+    if not coldkey_path.exists():
+        print(f"Warning: Hotkeys directory not found: {coldkey_path}")
+        return []
+    
+    wallets = []
+    seen_addresses = set()  # 중복 방지
+    hotkey_files = [hotkey_file for hotkey_file in coldkey_path.iterdir() if hotkey_file.is_file()]
+    verbose = len(hotkey_files) <= HOTKEY_LOG_LIMIT
+    skipped = duplicates = failed = 0
+    
+    for hotkey_file in hotkey_files:
+        hotkey_name = hotkey_file.name
+        
+        # 공개키 파일 제외 (.pub, .pub.txt, .txt 등)
+        if hotkey_name.endswith('.pub') or hotkey_name.endswith('.pub.txt') or hotkey_name.endswith('.txt'):
+            skipped += 1
+            if verbose:
+                print(f"Skipping public key file: {hotkey_name}")
+            continue
+        
+        # 숨김 파일이나 시스템 파일 제외
+        if hotkey_name.startswith('.'):
+            continue
+        
+        try:
+            wallet = Wallet(name=coldkey_name, hotkey=hotkey_name, path=str(expanded_path))
+            hotkey_address = wallet.hotkey.ss58_address
+            
+            # 중복된 주소 확인 (같은 hotkey를 다른 이름으로 가진 경우)
+            if hotkey_address in seen_addresses:
+                duplicates += 1
+                if verbose:
+                    print(f"Skipping duplicate hotkey: {hotkey_name} ({hotkey_address})")
+                continue
+            
+            seen_addresses.add(hotkey_address)
+            wallets.append(wallet)
+            if verbose:
+                print(f"✓ Discovered hotkey: {hotkey_name} ({hotkey_address[:10]}...)")
+        except Exception as e:
+            failed += 1
+            if verbose or failed <= HOTKEY_LOG_LIMIT:
+                print(f"✗ Failed to load hotkey {hotkey_name}: {e}")
+            continue
+    
+    if not verbose:
+        print(f"Skipped {skipped} public key files, {duplicates} duplicates, {failed} failed to load")
+    print(f"\nTotal valid hotkeys discovered: {len(wallets)}")
+    return wallets
+
+
+def discover_wallets(wallet_path, coldkey_name):
+    """SCALE_MODE이면 HotkeyRecord, 아니면 keypair를 로드한 Wallet으로 coldkey의 hotkey를 탐색합니다."""
+    if SCALE_MODE:
+        return discover_hotkey_records(wallet_path, coldkey_name)
+    return discover_hotkeys(wallet_path, coldkey_name)
+
+
+def load_scheduled(wallets, loader):
+    """
+    slot 리스트의 HotkeyRecord / Wallet을 loader(WalletLoader)로 LoadedWallet으로 바꿉니다.
+    loader를 epoch마다 재사용하면 이미 로드한 지갑은 다시 읽지 않습니다. None(다른 인스턴스 slot)은 그대로 둡니다.
+    """
+    return [None if wallet is None else loader.load(wallet.name, wallet.hotkey_str, wallet.path) for wallet in wallets]
@@ -0,0 +1,88 @@
+"""
+hotkey 등록 상태만 가볍게 조회하는 API.
+
+`AsyncMetagraph(lite=False).sync()`는 weights/bonds 행렬과 모든 neuron 필드를 디코딩하지만,
+등록 여부 확인에는 hotkey -> UID 매핑만 필요합니다. 여기서는 `SubtensorModule` 스토리지 맵을 직접 읽습니다.
+
+- `Keys`  (netuid, uid) -> hotkey : 서브넷 전체 매핑을 페이지 단위 query_map으로 한 번에 조회
+                                    (netuid 없이 조회하면 모든 서브넷을 한 번에 가져옴)
+- `Uids`  (netuid, hotkey) -> uid : 확인할 hotkey가 적을 때 state_queryStorageAt 한 번으로 조회
+"""
+from chain_utils import normalize_account, plain
+
+KEYS_PAGE_SIZE = 256  # 서브넷당 최대 UID 수 - 보통 한 페이지로 끝남
+ALL_KEYS_PAGE_SIZE = 1000  # 전체 서브넷 조회 시 페이지 크기
+
+
+async def fetch_hotkey_uids(subtensor, netuid, block_hash=None):
+    """
+    서브넷에 등록된 전체 hotkey -> UID 매핑을 `Keys` 맵에서 가져옵니다.
+
+    Args:
+        subtensor: AsyncSubtensor 또는 AsyncSubstrateInterface 인스턴스
+        netuid: 서브넷 ID
+        block_hash: 조회할 블록 해시 (None이면 최신 블록)
+
+    Returns:
+        Dict[str, int]: {hotkey ss58: uid}
+    """
+    substrate = getattr(subtensor, "substrate", subtensor)
+    result = await substrate.query_map(
+        "SubtensorModule", "Keys", [netuid], block_hash=block_hash, page_size=KEYS_PAGE_SIZE
+    )
+    hotkey_uids = {}
+    async for uid, hotkey in result:
+        hotkey_uids[normalize_account(hotkey)] = int(plain(uid))
+    return hotkey_uids
+
+
+async def fetch_all_hotkey_uids(subtensor, block_hash=None):
+    """
+    모든 서브넷의 hotkey -> UID 매핑을 `Keys` 맵 전체 query_map으로 가져옵니다.
+
+    Args:
+        subtensor: AsyncSubtensor 또는 AsyncSubstrateInterface 인스턴스
+        block_hash: 조회할 블록 해시 (None이면 최신 블록)
+
+    Returns:
+        Dict[int, Dict[str, int]]: {netuid: {hotkey ss58: uid}}
+    """
+    substrate = getattr(subtensor, "substrate", subtensor)
+    result = await substrate.query_map(
+        "SubtensorModule", "Keys", block_hash=block_hash, page_size=ALL_KEYS_PAGE_SIZE
+    )
+    subnet_uids = {}
+    async for key, hotkey in result:
+        netuid, uid = (int(plain(part)) for part in plain(key))
+        subnet_uids.setdefault(netuid, {})[normalize_account(hotkey)] = uid
+    return subnet_uids
+
+
+async def fetch_uids_for_hotkeys(subtensor, netuid, hotkeys, block_hash=None):
+    """
+    지정한 hotkey들의 UID만 `Uids` 맵에서 한 번의 요청으로 가져옵니다.
+
+    Args:
+        subtensor: AsyncSubtensor 또는 AsyncSubstrateInterface 인스턴스
+        netuid: 서브넷 ID
+        hotkeys: 확인할 hotkey ss58 주소 리스트
+        block_hash: 조회할 블록 해시 (None이면 최신 블록)
+
+    Returns:
+        Dict[str, int]: 등록된 hotkey만 포함한 {hotkey ss58: uid}
+    """
+    substrate = getattr(subtensor, "substrate", subtensor)
+    if not hotkeys:
+        return {}
+    if block_hash is None:
+        block_hash = await substrate.get_chain_head()
+    storage_keys = [
+        await substrate.create_storage_key("SubtensorModule", "Uids", [netuid, hotkey], block_hash=block_hash)
+        for hotkey in hotkeys
+    ]
+    hotkey_uids = {}
+    for storage_key, uid in await substrate.query_multi(storage_keys, block_hash=block_hash):
+        uid = plain(uid)
+        if uid is not None:
+            hotkey_uids[storage_key.params[1]] = int(uid)
+    return hotkey_uids
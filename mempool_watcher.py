@@ -0,0 +1,208 @@
+"""
+트랜잭션 풀(pending extrinsics) 감시.
+
+블록에 포함된 뒤에야 경쟁자를 확인하면 같은 slot에는 대응할 수 없습니다.
+여기서는 노드의 `author_pendingExtrinsics`를 짧은 간격으로 조회하여 아직 블록에 들어가지 않은
+다른 coldkey의 `burned_register` 호출(force_batch/proxy로 감싼 경우 포함)을 바로 디코딩합니다.
+
+`author_pendingExtrinsics`는 unsafe RPC라 공개 노드에서는 막혀 있으므로
+`register-burned.py`처럼 로컬/프라이빗 노드(MEMPOOL_NETWORK)를 사용해야 합니다.
+"""
+import asyncio
+import os
+import time
+
+from dotenv import load_dotenv
+from scalecodec.base import ScaleBytes
+
+from chain_utils import extract_registrations
+
+load_dotenv()
+
+MEMPOOL_NETWORK = os.getenv("MEMPOOL_NETWORK")  # 설정하지 않으면 풀 감시 비활성화
+MEMPOOL_POLL_INTERVAL = float(os.getenv("MEMPOOL_POLL_INTERVAL", "0.2"))  # 초
+MEMPOOL_REFRESH_TIMEOUT = float(os.getenv("MEMPOOL_REFRESH_TIMEOUT", "0.1"))  # 새 블록마다 풀 재조회를 기다리는 최대 시간 (초)
+
+
+class MempoolWatcher:
+    """
+    풀에 대기 중인 경쟁 등록을 추적합니다.
+
+    Args:
+        substrate: author_pendingExtrinsics를 허용하는 노드의 AsyncSubstrateInterface
+        netuid: 감시할 서브넷 ID
+        own_coldkeys: 무시할 자신의 coldkey ss58 주소들
+        on_competitor: async def on_competitor(registrations) - 새 경쟁 등록이 풀에 나타날 때 호출
+        interval: 조회 간격 (초)
+        recorder: header_recorder.StreamRecorder - 조회 결과(pool)와 refresh 결과(pool_refresh)를 기록
+
+    Attributes:
+        competitors: {extrinsic hex: [registration]} 현재 풀에 있는 경쟁 등록
+        refreshes: 지금까지 호출된 refresh 수 (기록의 refresh 번호)
+    """
+
+    def __init__(self, substrate, netuid, own_coldkeys=(), on_competitor=None, interval=MEMPOOL_POLL_INTERVAL,
+                 recorder=None):
+        self.substrate = substrate
+        self.netuid = netuid
+        self.own_coldkeys = set(own_coldkeys)
+        self.on_competitor = on_competitor
+        self.interval = interval
+        self.recorder = recorder
+        self.competitors = {}
+        self.refreshes = 0
+        self._decoded = {}  # extrinsic hex -> [registration] (풀에 남아 있는 동안만 보관)
+        self._poll_lock = asyncio.Lock()
+        self._task = None
+
+    def max_tip(self):
+        """풀에 있는 경쟁 등록의 최고 tip. 없으면 None."""
+        tips = [registration["tip"] for registrations in self.competitors.values() for registration in registrations]
+        return max(tips) if tips else None
+
+    def count(self):
+        return sum(len(registrations) for registrations in self.competitors.values())
+
+    async def decode(self, extrinsic_hex):
+        """풀의 extrinsic 하나를 디코딩해 netuid 등록 시도를 반환합니다. 디코딩할 수 없으면 빈 리스트."""
+        try:
+            extrinsic = await self.substrate.create_scale_object("Extrinsic", data=ScaleBytes(extrinsic_hex))
+            extrinsic.decode()
+        except Exception:
+            return []
+        return extract_registrations(extrinsic, self.netuid)
+
+    async def poll_once(self, refresh=None):
+        """
+        풀을 한 번 조회하여 competitors를 갱신합니다.
+
+        Args:
+            refresh: refresh()가 시작한 조회이면 그 refresh 번호 (기록용)
+
+        Returns:
+            List[dict]: 이번 조회에서 새로 나타난 경쟁 등록
+        """
+        async with self._poll_lock:
+            return await self._poll(refresh)
+
+    async def _poll(self, refresh):
+        response = await self.substrate.rpc_request("author_pendingExtrinsics", [])
+        pending = response["result"]
+
+        decoded = {}
+        competitors = {}
+        for extrinsic_hex in pending:
+            registrations = self._decoded.get(extrinsic_hex)
+            if registrations is None:
+                registrations = await self.decode(extrinsic_hex)
+            decoded[extrinsic_hex] = registrations
+
+            competing = [r for r in registrations if r["signer"] not in self.own_coldkeys]
+            if competing:
+                competitors[extrinsic_hex] = competing
+
+        # 블록에 포함되거나 교체되어 풀에서 빠진 extrinsic은 버림
+        self._decoded = decoded
+        return await self.update(competitors, refresh)
+
+    async def update(self, competitors, refresh=None):
+        """
+        competitors를 새 풀 상태로 바꾸고, 새로 나타난 경쟁 등록을 on_competitor로 알립니다.
+        디코딩된 상태를 기록하므로 재생할 때는 노드와 메타데이터 없이 이 메서드로 같은 상태를 다시 적용합니다.
+
+        Returns:
+            List[dict]: 새로 나타난 경쟁 등록
+        """
+        new_registrations = [
+            registration
+            for extrinsic_hex, registrations in competitors.items()
+            if extrinsic_hex not in self.competitors
+            for registration in registrations
+        ]
+        changed = competitors != self.competitors
+        self.competitors = competitors
+        # 상태가 그대로인 주기 조회는 재생 결과에 영향이 없으므로 기록하지 않음
+        if self.recorder is not None and (changed or refresh is not None):
+            self.recorder.record("pool", refresh=refresh, competitors=competitors)
+        if new_registrations and self.on_competitor is not None:
+            await self.on_competitor(new_registrations)
+        return new_registrations
+
+    async def refresh(self, timeout=MEMPOOL_REFRESH_TIMEOUT):
+        """
+        지금 풀을 다시 조회합니다. 새 블록이 도착하면 그 블록에 포함된 extrinsic이 이전 조회 결과에
+        남아 있으므로, max_tip()을 판단에 쓰기 전에 호출해야 합니다.
+        timeout 안에 끝나지 않으면 조회는 백그라운드에서 계속되고 False를 반환합니다.
+
+        Returns:
+            bool: competitors가 지금 시점의 풀을 반영하는지 여부
+        """
+        self.refreshes += 1
+        refresh = self.refreshes
+        poll = asyncio.ensure_future(self.poll_once(refresh))
+        done, _ = await asyncio.wait({poll}, timeout=timeout)
+        if done:
+            fresh = poll.exception() is None
+        else:
+            poll.add_done_callback(lambda task: task.cancelled() or task.exception())
+            fresh = False
+        if self.recorder is not None:
+            self.recorder.record("pool_refresh", refresh=refresh, fresh=fresh)
+        return fresh
+
+    async def run(self):
+        """interval마다 poll_once를 반복합니다. 오류가 나면 잠시 후 다시 시도합니다."""
+        while True:
+            start = time.monotonic()
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"\n⚠ Mempool poll failed: {e}, retrying in 1s")
+                await asyncio.sleep(1)
+                continue
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - start)))
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def main():
+    """풀에 나타나는 경쟁 등록을 출력합니다: MEMPOOL_NETWORK / NETUID"""
+    from bittensor.core.async_subtensor import AsyncSubtensor
+
+    netuid = int(os.getenv("NETUID", "1"))
+    network = MEMPOOL_NETWORK or os.getenv("NETWORK", "finney")
+
+    async def on_competitor(registrations):
+        for registration in registrations:
+            print(f"[{time.strftime('%H:%M:%S')}] pending burned_register {registration['hotkey']} "
+                  f"by {registration['signer']} tip {registration['tip']:,} nonce {registration['nonce']}")
+
+    async def watch():
+        subtensor = AsyncSubtensor(network=network)
+        watcher = MempoolWatcher(subtensor.substrate, netuid, on_competitor=on_competitor)
+        print(f"Watching pending registrations for netuid {netuid} on {network}...")
+        await watcher.run()
+
+    try:
+        asyncio.run(watch())
+    except KeyboardInterrupt:
+        print("\nMempool watcher stopped")
+
+
+if __name__ == "__main__":
+    main()
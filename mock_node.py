@@ -0,0 +1,168 @@
+"""
+벤치마크/재현용 로컬 mock 노드.
+
+실제 노드의 JSON-RPC 응답을 파일(capture)에 기록해 두었다가 웹소켓 서버로 다시 돌려줍니다.
+런타임 메타데이터(state_getMetadata 등)도 capture에 포함되므로 네트워크 없이
+compose_call / create_signed_extrinsic / submit_extrinsic 경로를 그대로 실행할 수 있습니다.
+
+모드:
+    기록: MOCK_NODE_UPSTREAM=wss://... 이면 요청을 upstream 노드로 전달하고 응답을 capture에 기록
+    재생: upstream이 없으면 capture에서 같은 (method, params) 응답을 찾아 반환
+
+capture에 없는 요청 중 일부는 합성 응답을 반환합니다.
+    author_submitExtrinsic : extrinsic의 blake2b-256 해시 (실제로 전파하지 않음)
+    account_nextIndex      : 0
+
+사용법:
+    MOCK_NODE_UPSTREAM=wss://entrypoint-finney.opentensor.ai:443 python mock_node.py   # 기록 (Ctrl+C로 저장)
+    python mock_node.py                                                                  # 재생
+"""
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+
+import websockets
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MOCK_NODE_HOST = os.getenv("MOCK_NODE_HOST", "127.0.0.1")
+MOCK_NODE_PORT = int(os.getenv("MOCK_NODE_PORT", "9955"))
+MOCK_NODE_CAPTURE = os.getenv("MOCK_NODE_CAPTURE", "mock_node_capture.json")
+MOCK_NODE_UPSTREAM = os.getenv("MOCK_NODE_UPSTREAM")
+
+
+def request_key(method, params):
+    return f"{method} {json.dumps(params, sort_keys=True)}"
+
+
+def synthetic_result(method, params):
+    """capture에 없는 요청의 합성 응답. 합성할 수 없으면 KeyError."""
+    if method == "author_submitExtrinsic":
+        return "0x" + hashlib.blake2b(bytes.fromhex(params[0][2:]), digest_size=32).hexdigest()
+    if method in ("account_nextIndex", "system_accountNextIndex"):
+        return 0
+    raise KeyError(method)
+
+
+class MockNode:
+    """
+    capture 파일 기반 JSON-RPC 웹소켓 서버.
+
+    Args:
+        capture_path: 응답을 읽고 저장할 JSON 파일
+        upstream: 기록 모드에서 요청을 전달할 노드 URL (None이면 재생 모드)
+
+    Attributes:
+        responses: {request_key: result} 기록된 응답 (같은 요청은 처음 응답만 유지)
+        requests: 처리한 요청 수
+        misses: 재생 모드에서 capture에 없어 오류로 응답한 요청 {request_key: 횟수}
+    """
+
+    def __init__(self, capture_path=MOCK_NODE_CAPTURE, upstream=MOCK_NODE_UPSTREAM):
+        self.capture_path = capture_path
+        self.upstream = upstream
+        self.responses = {}
+        self.requests = 0
+        self.misses = {}
+        if os.path.exists(capture_path):
+            with open(capture_path) as f:
+                self.responses = json.load(f)["responses"]
+        self._server = None
+        self._subscription_ids = itertools.count(1)
+
+    @property
+    def url(self):
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    async def start(self, host=MOCK_NODE_HOST, port=MOCK_NODE_PORT):
+        """서버를 시작합니다. port=0이면 빈 포트를 사용하며 url 속성으로 주소를 확인합니다."""
+        handler = self._proxy if self.upstream else self._replay
+        self._server = await websockets.serve(handler, host, port, max_size=None)
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.upstream:
+            self.save()
+
+    def save(self):
+        with open(self.capture_path, "w") as f:
+            json.dump({"upstream": self.upstream, "responses": self.responses}, f)
+        print(f"Saved {len(self.responses)} captured responses to {self.capture_path}")
+
+    def resolve(self, method, params):
+        """재생 모드 응답 메시지 본문 ({"result": ...} 또는 {"error": ...})."""
+        key = request_key(method, params)
+        if key in self.responses:
+            return {"result": self.responses[key]}
+        try:
+            return {"result": synthetic_result(method, params)}
+        except KeyError:
+            pass
+        if "subscribe" in method.lower():
+            # 구독은 ID만 돌려주고 알림은 보내지 않음
+            return {"result": f"mock-{next(self._subscription_ids)}"}
+        self.misses[key] = self.misses.get(key, 0) + 1
+        return {"error": {"code": -32601, "message": f"Not captured: {key[:200]}"}}
+
+    async def _replay(self, websocket):
+        async for message in websocket:
+            request = json.loads(message)
+            self.requests += 1
+            body = self.resolve(request["method"], request.get("params", []))
+            await websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], **body}))
+
+    async def _proxy(self, websocket):
+        pending = {}  # request id -> request_key
+
+        async with websockets.connect(self.upstream, max_size=None) as upstream:
+
+            async def forward_responses():
+                async for message in upstream:
+                    response = json.loads(message)
+                    key = pending.pop(response.get("id"), None)
+                    if key is not None and "result" in response:
+                        self.responses.setdefault(key, response["result"])
+                    await websocket.send(message)
+
+            reader = asyncio.create_task(forward_responses())
+            try:
+                async for message in websocket:
+                    request = json.loads(message)
+                    self.requests += 1
+                    if request["method"] == "author_submitExtrinsic":
+                        # 기록 중에도 실제 체인에는 제출하지 않음
+                        body = {"result": synthetic_result(request["method"], request["params"])}
+                        await websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], **body}))
+                        continue
+                    pending[request["id"]] = request_key(request["method"], request.get("params", []))
+                    await upstream.send(message)
+            finally:
+                reader.cancel()
+
+
+def main():
+    async def serve():
+        node = await MockNode().start()
+        mode = f"capturing from {node.upstream}" if node.upstream else f"replaying {len(node.responses)} responses"
+        print(f"Mock node listening on {node.url} ({mode}, capture: {node.capture_path})")
+        try:
+            await asyncio.Future()
+        finally:
+            await node.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nMock node stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+가벼운 새 블록 헤더 구독.
+
+`substrate.subscribe_block_headers`는 헤더마다 런타임을 확인하고 digest 로그를 모두 SCALE 디코딩한 뒤
+핸들러를 호출합니다. 봇은 블록 번호(와 해시)만 필요하므로, 여기서는 `chain_subscribeNewHeads` 알림의
+JSON에서 번호만 꺼내 바로 핸들러로 넘깁니다.
+
+블록 해시는 알림에 포함되지 않으므로 필요할 때만 헤더를 SCALE 인코딩하여 blake2b-256으로 계산합니다.
+(digest 로그는 RPC에서 이미 SCALE 인코딩된 hex로 오므로 디코딩할 필요가 없습니다.)
+"""
+import hashlib
+import time
+
+
+def compact_encode(value):
+    """SCALE compact 정수 인코딩."""
+    if value < 1 << 6:
+        return bytes([value << 2])
+    if value < 1 << 14:
+        return ((value << 2) | 0b01).to_bytes(2, "little")
+    if value < 1 << 30:
+        return ((value << 2) | 0b10).to_bytes(4, "little")
+    length = (value.bit_length() + 7) // 8
+    return bytes([((length - 4) << 2) | 0b11]) + value.to_bytes(length, "little")
+
+
+def header_hash(header):
+    """
+    RPC JSON 헤더의 블록 해시를 계산합니다.
+
+    Args:
+        header: chain_subscribeNewHeads / chain_getHeader 결과 dict
+
+    Returns:
+        str: 0x 접두사가 붙은 블록 해시
+    """
+    logs = header["digest"]["logs"]
+    encoded = b"".join((
+        bytes.fromhex(header["parentHash"][2:]),
+        compact_encode(int(header["number"], 16)),
+        bytes.fromhex(header["stateRoot"][2:]),
+        bytes.fromhex(header["extrinsicsRoot"][2:]),
+        compact_encode(len(logs)),
+        *(bytes.fromhex(log[2:]) for log in logs),
+    ))
+    return "0x" + hashlib.blake2b(encoded, digest_size=32).hexdigest()
+
+
+class RawHead:
+    """
+    새 블록 헤더 알림의 최소 표현.
+
+    Attributes:
+        number: 블록 번호
+        parent_hash: 부모 블록 해시
+        arrival: 알림 수신 시점의 time.monotonic()
+        hash: 블록 해시 (처음 접근할 때 계산)
+    """
+
+    __slots__ = ("number", "parent_hash", "arrival", "_header", "_hash")
+
+    def __init__(self, header, arrival):
+        self.number = int(header["number"], 16)
+        self.parent_hash = header["parentHash"]
+        self.arrival = arrival
+        self._header = header
+        self._hash = None
+
+    @property
+    def raw(self):
+        """RPC JSON 헤더 그대로 (기록용)."""
+        return self._header
+
+    @property
+    def hash(self):
+        if self._hash is None:
+            self._hash = header_hash(self._header)
+        return self._hash
+
+    def __getitem__(self, key):
+        # 기존 핸들러의 block["header"]["number"] 접근 호환
+        if key == "header":
+            return {"number": self.number, "parentHash": self.parent_hash}
+        raise KeyError(key)
+
+
+def parse_new_head(message, arrival=None):
+    """
+    chain_subscribeNewHeads 알림 메시지에서 RawHead를 만듭니다.
+
+    Returns:
+        RawHead | None: 구독 ID 응답 등 헤더 알림이 아니면 None
+    """
+    params = message.get("params")
+    if not params:
+        return None
+    return RawHead(params["result"], time.monotonic() if arrival is None else arrival)
+
+
+async def subscribe_raw_new_heads(substrate, handler):
+    """
+    새 블록 헤더를 최소 파싱으로 구독합니다. `subscribe_block_headers`와 같이
+    handler(head)가 None이 아닌 값을 반환하면 구독을 끝내고 그 값을 반환합니다.
+
+    Args:
+        substrate: AsyncSubstrateInterface 인스턴스
+        handler: async def handler(head: RawHead)
+
+    Returns:
+        handler가 반환한 값
+    """
+
+    async def result_handler(message, subscription_id):
+        arrival = time.monotonic()
+        head = parse_new_head(message, arrival)
+        if head is None:
+            return None, False
+        result = await handler(head)
+        if result is None:
+            return None, False
+        async with substrate.ws as ws:
+            await ws.unsubscribe(subscription_id, method="chain_unsubscribeNewHeads")
+        return result, True
+
+    result = await substrate._make_rpc_request(
+        [substrate.make_payload("raw_new_heads", "chain_subscribeNewHeads", [])],
+        result_handler=result_handler,
+    )
+    return result["raw_new_heads"][-1]
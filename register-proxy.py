@@ -143,14 +143,16 @@ async def register_miner(wallets, network, netuid):
         print(f"New block received: {block_number} {datetime.now()}", end="\r")
         if block_number >= next_registration_block - 2:
             idx = block_number - next_registration_block + 2
-            await register_single_miner(
-                subtensor=subtensor,
-                wallet=wallets[idx],
-                netuid=netuid,
-                idx=idx,
-                block_id=block_number
-            )
-            if idx == 2:
+            # 지갑이 부족하거나 블록을 건너뛰어도 구독이 남지 않도록 idx 2를 지나면 끝냄
+            if idx < len(wallets):
+                await register_single_miner(
+                    subtensor=subtensor,
+                    wallet=wallets[idx],
+                    netuid=netuid,
+                    idx=idx,
+                    block_id=block_number
+                )
+            if idx >= 2:
                 return True
         # await asyncio.sleep(10)
         # if (block_number >= next_registration_block - 1) and (
@@ -2,117 +2,167 @@ import asyncio
 import math
 import time
 import traceback
+
+# fast-start time-to-ready 측정 기준 (bittensor 등 무거운 모듈은 필요한 함수 안에서 import)
+STARTED_AT = time.perf_counter()
+
 from datetime import timedelta, datetime
-from bittensor import Balance
-from bittensor_wallet import Wallet
-from bittensor.core.async_subtensor import AsyncSubtensor
-from bittensor.core.metagraph import AsyncMetagraph
-from bittensor.core.config import Config
 from dotenv import load_dotenv
 import os
-from pathlib import Path
+from types import SimpleNamespace
+from chain_clock import ChainClock, track_chain_clock
+from chain_utils import extract_registrations
+from coordination import INSTANCE_ID, SharedColdkeyError, assign_slots, join_fleet, open_backend
+from extrinsic_variants import VariantCache, compose_registration_call, fetch_next_nonces, presign_registrations
+from fast_start import fast_start
+from fleet_status import FLEET_OUTPUT_JSON, load_fleet_status, skip_registered
+from header_hub import HeaderHub
+from header_recorder import RECORD_DIR, RecordingSubstrate, open_recorder
+from hotkey_records import (
+    HOTKEY_LOG_LIMIT, SCALE_MODE, WalletLoader, coldkey_password, discover_wallets, load_scheduled,
+)
+from hotkey_status import fetch_hotkey_uids
+from mempool_watcher import MEMPOOL_NETWORK, MempoolWatcher
+from submission_worker import SubmissionWorkerClient
+from submit_retry import (
+    ALREADY_IMPORTED, RETRY_BUDGET_MS, RETRY_ENDPOINT, RETRY_ERA, RETRY_NONCE, RETRY_TIP,
+    classify_submit_error, fallback_substrates, submit_raw, warm_up,
+)
+from window_analyzer import WINDOW_STATS_PATH, load_window_stats
 
 load_dotenv()
 
-REGISTER_COST_LIMIT = Balance(float(os.getenv("REGISTER_COST_LIMIT", "1.0")))
+REGISTER_COST_LIMIT = float(os.getenv("REGISTER_COST_LIMIT", "1.0"))  # TAO
 WALLET_PWD = os.getenv("WALLET_PASSWORD")
 MAX_SLOTS = int(os.getenv("MAX_SLOTS", "6"))  # Subnet 1에서 한 epoch당 등록 가능한 slot 개수
 REGISTRATION_TIP = int(os.getenv("REGISTRATION_TIP", "1000000"))  # 등록 시 tip (rao 단위)
 ERA_PERIOD = int(os.getenv("ERA_PERIOD", "5"))  # Extrinsic 유효 기간
+# 미리 서명해 둘 tip 단계 (rao, 쉼표 구분). 경쟁자 tip이 관측되면 그보다 높은 단계로 올림
+TIP_TIERS = [int(tip) for tip in os.getenv("TIP_TIERS", "").split(",") if tip.strip()] or [
+    REGISTRATION_TIP, REGISTRATION_TIP * 5, REGISTRATION_TIP * 20
+]
+VARIANT_REFRESH_BLOCKS = int(os.getenv("VARIANT_REFRESH_BLOCKS", "3"))  # 윈도우 전 era anchor 갱신 간격 (블록)
+VARIANT_REFRESH_LEAD = int(os.getenv("VARIANT_REFRESH_LEAD", "10"))  # 윈도우 몇 블록 전부터 anchor를 갱신할지
 START_OFFSET = int(os.getenv("START_OFFSET", "1"))  # Epoch 몇 블록 전부터 시작할지 (기본: 2)
+# 로컬 시계 대신 체인 시계 기준으로 대기 시간을 계산 (track_chain_clock이 백그라운드에서 갱신)
+CHAIN_CLOCK = ChainClock()
+AUTO_WINDOW = os.getenv("AUTO_WINDOW", "0") == "1"  # window_analyzer 통계로 START_OFFSET/MAX_SLOTS 자동 선택
+WINDOW_STATS_MAX_AGE_HOURS = float(os.getenv("WINDOW_STATS_MAX_AGE_HOURS", "24"))  # 이보다 오래된 통계는 무시
+SPLIT_PROCESS = os.getenv("SPLIT_PROCESS", "0") == "1"  # 제출을 별도 워커 프로세스에서 실행
+# 풀의 경쟁자 tip이 최고 tier 이상이면 그 slot을 포기하고 hotkey를 다음 slot으로 미룸
+MEMPOOL_DEFER = os.getenv("MEMPOOL_DEFER", "1") == "1"
+# bittensor import 없이 연결/메타데이터 조회를 지갑 로드와 동시에 진행 (재시작 직후 빠른 준비)
+FAST_START = os.getenv("FAST_START", "0") == "1"
+_mempool_subtensor = None
+
+# submit_slot 결과
+SUBMITTED = "submitted"
+EXHAUSTED = "exhausted"
+REJECTED = "rejected"
+
+
+def get_mempool_substrate():
+    """MEMPOOL_NETWORK 노드 연결 (설정하지 않았으면 None). 한 번 만든 연결을 재사용합니다."""
+    global _mempool_subtensor
+    if not MEMPOOL_NETWORK:
+        return None
+    if _mempool_subtensor is None:
+        from bittensor.core.async_subtensor import AsyncSubtensor
+
+        _mempool_subtensor = AsyncSubtensor(network=MEMPOOL_NETWORK)
+    return _mempool_subtensor.substrate
+
 
-def discover_hotkeys(wallet_path, coldkey_name):
+def open_mempool_watcher(netuid, own_coldkeys, on_competitor, recorder=None):
     """
-    지정된 coldkey에 연결된 모든 hotkey를 자동으로 탐색합니다.
-    공개키 파일(.pub, .pub.txt 등)은 제외하고 실제 개인키 파일만 탐색합니다.
-    
-    Args:
-        wallet_path: 지갑 디렉토리 경로
-        coldkey_name: coldkey 이름
-    
-    Returns:
-        List[Wallet]: 발견된 모든 지갑 리스트
+    MEMPOOL_NETWORK 노드의 풀을 감시하는 MempoolWatcher를 만듭니다 (설정하지 않았으면 None).
+    replay_harness는 이 함수를 기록된 풀 상태를 돌려주는 watcher로 바꿔 재생합니다.
     """
-    expanded_path = Path(os.path.expanduser(wallet_path))
-    coldkey_path = expanded_path / coldkey_name / "hotkeys"
-    
-    if not coldkey_path.exists():
-        print(f"Warning: Hotkeys directory not found: {coldkey_path}")
-        return []
-    
-    wallets = []
-    seen_addresses = set()  # 중복 방지
-    
-    for hotkey_file in coldkey_path.iterdir():
-        if hotkey_file.is_file():
-            hotkey_name = hotkey_file.name
-            
-            # 공개키 파일 제외 (.pub, .pub.txt, .txt 등)
-            if hotkey_name.endswith('.pub') or hotkey_name.endswith('.pub.txt') or hotkey_name.endswith('.txt'):
-                print(f"Skipping public key file: {hotkey_name}")
-                continue
-            
-            # 숨김 파일이나 시스템 파일 제외
-            if hotkey_name.startswith('.'):
-                continue
-            
-            try:
-                wallet = Wallet(name=coldkey_name, hotkey=hotkey_name, path=str(expanded_path))
-                hotkey_address = wallet.hotkey.ss58_address
-                
-                # 중복된 주소 확인 (같은 hotkey를 다른 이름으로 가진 경우)
-                if hotkey_address in seen_addresses:
-                    print(f"Skipping duplicate hotkey: {hotkey_name} ({hotkey_address})")
-                    continue
-                
-                seen_addresses.add(hotkey_address)
-                wallets.append(wallet)
-                print(f"✓ Discovered hotkey: {hotkey_name} ({hotkey_address[:10]}...)")
-            except Exception as e:
-                print(f"✗ Failed to load hotkey {hotkey_name}: {e}")
-                continue
-    
-    print(f"\nTotal valid hotkeys discovered: {len(wallets)}")
-    return wallets
+    substrate = get_mempool_substrate()
+    if substrate is None:
+        return None
+    return MempoolWatcher(substrate, netuid, own_coldkeys, on_competitor=on_competitor, recorder=recorder)
+
+def apply_window_stats(netuid, path=WINDOW_STATS_PATH, max_age_hours=WINDOW_STATS_MAX_AGE_HOURS):
+    """
+    window_analyzer가 저장한 통계에서 추천 윈도우를 읽어 START_OFFSET / MAX_SLOTS를 설정합니다.
+    MAX_SLOTS는 env에 설정된 값을 넘지 않습니다.
+    다른 서브넷의 통계이거나 max_age_hours보다 오래된 통계는 사용하지 않습니다.
+    """
+    global START_OFFSET, MAX_SLOTS
+
+    stats = load_window_stats(path)
+    if not stats or not stats.get("recommended"):
+        print(f"Window stats not available ({path}), using START_OFFSET={START_OFFSET} MAX_SLOTS={MAX_SLOTS}")
+        return
+    if stats.get("netuid") != netuid:
+        print(f"⚠ Window stats in {path} are for netuid {stats.get('netuid')}, not {netuid}; "
+              f"using START_OFFSET={START_OFFSET} MAX_SLOTS={MAX_SLOTS}")
+        return
+    age = datetime.now() - datetime.fromisoformat(stats["generated_at"])
+    if age > timedelta(hours=max_age_hours):
+        print(f"⚠ Window stats in {path} are {age.total_seconds() / 3600:.0f}h old (limit {max_age_hours}h); "
+              f"using START_OFFSET={START_OFFSET} MAX_SLOTS={MAX_SLOTS}")
+        return
+
+    recommended = stats["recommended"]
+    START_OFFSET = recommended["start_offset"]
+    MAX_SLOTS = min(MAX_SLOTS, recommended["max_slots"])
+    print(
+        f"Window from {path} (generated {stats['generated_at']}): "
+        f"START_OFFSET={START_OFFSET} MAX_SLOTS={MAX_SLOTS}"
+    )
 
 
 async def get_unregistered_hotkeys(subtensor, wallets, netuid):
     """
     미등록된 hotkey들을 찾아 반환합니다.
+    전체 metagraph 대신 `Keys` 맵의 hotkey -> UID 매핑만 조회합니다.
+    지갑이 HOTKEY_LOG_LIMIT개보다 많으면 hotkey별 로그 대신 요약만 출력합니다.
     
     Args:
         subtensor: AsyncSubtensor 인스턴스
-        wallets: 확인할 지갑 리스트
+        wallets: 확인할 지갑 (또는 HotkeyRecord) 리스트
         netuid: 서브넷 ID
     
     Returns:
         List[Wallet]: 미등록된 지갑 리스트
     """
     print(f"\nChecking registration status for {len(wallets)} hotkeys...")
-    metagraph = AsyncMetagraph(subtensor=subtensor, netuid=netuid, lite=False)
-    await metagraph.sync()
+    hotkey_uids = await fetch_hotkey_uids(subtensor, netuid)
+    verbose = len(wallets) <= HOTKEY_LOG_LIMIT
     
     unregistered = []
     registered = []
     
     for wallet in wallets:
         hotkey_ss58 = wallet.hotkey.ss58_address
-        if hotkey_ss58 in metagraph.hotkeys:
+        if hotkey_ss58 in hotkey_uids:
             registered.append(wallet.hotkey_str)
-            print(f"✓ Already registered: {wallet.hotkey_str} ({hotkey_ss58})")
+            if verbose:
+                print(f"✓ Already registered: {wallet.hotkey_str} ({hotkey_ss58}) uid {hotkey_uids[hotkey_ss58]}")
         else:
             unregistered.append(wallet)
-            print(f"✗ Not registered: {wallet.hotkey_str} ({hotkey_ss58})")
+            if verbose:
+                print(f"✗ Not registered: {wallet.hotkey_str} ({hotkey_ss58})")
     
     print(f"\nSummary: {len(registered)} registered, {len(unregistered)} unregistered")
     return unregistered
 
 
 async def wait_until_timestamp(timestamp):
-    while datetime.now().timestamp() <= timestamp.timestamp():
+    while CHAIN_CLOCK.chain_now() <= timestamp.timestamp():
         await asyncio.sleep(0.5)
 
 
+def seconds_until_block(block_number, current_block_number, clock=CHAIN_CLOCK):
+    """체인 시계 추정값으로 블록까지 남은 시간을 계산합니다. 추정 전이면 블록당 12초로 계산합니다."""
+    seconds = clock.seconds_until_block(block_number)
+    if seconds is None:
+        seconds = (block_number - current_block_number) * 12
+    return max(0, seconds)
+
+
 async def register_single_miner(subtensor, wallet, netuid, idx, block_id):
     try:
         print(f"{idx} Start track time: {time.time()}")
@@ -126,12 +176,12 @@ async def register_single_miner(subtensor, wallet, netuid, idx, block_id):
         #     param_name="Burn", netuid=netuid, block_hash=block_hash
         # )
         # curret_register_cost = (
-        #     Balance.from_rao(int(current_register_rao))
+        #     Balance.from_rao(int(current_register_rao))  # from bittensor import Balance
         #     if current_register_rao
         #     else Balance(0)
         # )
 
-        # if curret_register_cost > REGISTER_COST_LIMIT:
+        # if curret_register_cost > Balance(REGISTER_COST_LIMIT):
         #     print(
         #         f"Register costs over the limit {curret_register_cost} > {REGISTER_COST_LIMIT}"
         #     )
@@ -184,10 +234,11 @@ async def register_single_miner(subtensor, wallet, netuid, idx, block_id):
         )
 
 
-async def prepare_and_submit_extrinsic(subtensor, wallet, netuid, block_id, idx):
+async def prepare_and_submit_extrinsic(subtensor, wallet, netuid, block_id, idx, tip=None, nonce=None):
     """
     Extrinsic을 준비하고 즉시 제출합니다.
     최적화: 준비 시간을 최소화하여 빠르게 제출
+    미리 서명된 버전이 없을 때의 fallback 경로입니다.
     """
     try:
         start_time = time.time()
@@ -218,8 +269,10 @@ async def prepare_and_submit_extrinsic(subtensor, wallet, netuid, block_id, idx)
             "call": force_batch_call,
             "keypair": signing_keypair,
             "era": {"period": ERA_PERIOD, "current": block_id - 1},
-            "tip": REGISTRATION_TIP,
+            "tip": REGISTRATION_TIP if tip is None else tip,
         }
+        if nonce is not None:
+            extrinsic_data["nonce"] = nonce
 
         extrinsic = await subtensor.substrate.create_signed_extrinsic(**extrinsic_data)
         prep_time = (time.time() - start_time) * 1000
@@ -245,49 +298,329 @@ async def prepare_and_submit_extrinsic(subtensor, wallet, netuid, block_id, idx)
 
 
 
-async def register_miner_epoch(subtensor, wallets_to_register, netuid, next_registration_block):
+async def submit_variant(subtensor, variant, idx):
+    """
+    미리 서명된 extrinsic을 바로 제출합니다 (hot path에서 서명 없음).
+    """
+    try:
+        start_time = time.time()
+        response = await subtensor.substrate.submit_extrinsic(
+            variant.extrinsic,
+            wait_for_inclusion=False,
+            wait_for_finalization=False,
+        )
+        total_time = (time.time() - start_time) * 1000
+        print(f"{idx} ✓ Submitted pre-signed (tip {variant.tip:,}, nonce {variant.nonce}, "
+              f"era {variant.era_birth}/{variant.era_period}) in {total_time:.1f}ms: {response}")
+        return response
+
+    except Exception as e:
+        elapsed = (time.time() - start_time) * 1000
+        print(f"{idx} ✗ Failed after {elapsed:.1f}ms: {e}")
+        traceback.print_exc()
+        return None
+
+
+async def register_miner_epoch(subtensor, wallets_to_register, netuid, next_registration_block, extend_slots=False,
+                               hub=None, start_offset=None, max_slots=None, tip_tiers=None):
     """
     단일 epoch에서 지정된 지갑들을 등록합니다.
-    개선: 블록 도착 즉시 준비+제출하여 지연 시간 최소화
+    개선: 윈도우 전에 era anchor/tip/nonce별로 미리 서명해 두고, 블록 도착 시 유효한 버전을 골라 바로 제출
+    MEMPOOL_NETWORK가 설정되면 풀의 경쟁 등록을 보고 같은 slot 안에서 tip 단계를 올리거나 다음 slot으로 미룹니다.
+    제출이 거절되면 RETRY_BUDGET_MS 안에서 바로 복구해 다시 제출하고, 끝내 실패한 지갑은 다음 slot으로 미룹니다.
+    RECORD_DIR이 설정되면 헤더 스트림과 RPC 응답을 기록하여 replay_harness.py로 다시 실행할 수 있게 합니다.
     
     Args:
         subtensor: AsyncSubtensor 인스턴스
-        wallets_to_register: 등록할 지갑 리스트 (최대 MAX_SLOTS개)
+        wallets_to_register: slot 순서의 지갑 리스트 (최대 max_slots개, 다른 인스턴스가 맡은 slot은 None)
         netuid: 서브넷 ID
         next_registration_block: 다음 등록 블록 번호
+        extend_slots: 미룬 hotkey가 max_slots 안의 빈 뒤쪽 slot을 사용할 수 있는지 (단독 실행일 때만)
+        hub: 프로세스 전체에서 공유하는 HeaderHub (None이면 이 epoch 동안만 구독)
+        start_offset: epoch 몇 블록 전부터 제출할지 (None이면 START_OFFSET)
+        max_slots: epoch당 slot 개수 (None이면 MAX_SLOTS)
+        tip_tiers: 미리 서명할 tip 단계 (None이면 TIP_TIERS)
+
+    Returns:
+        List[dict]: slot별 제출 결과 {"idx", "block", "hotkey", "submitted", "rejected"}
     """
+    start_offset = START_OFFSET if start_offset is None else start_offset
+    max_slots = MAX_SLOTS if max_slots is None else max_slots
+    tip_tiers = TIP_TIERS if tip_tiers is None else tip_tiers
     registration_complete = asyncio.Event()
-    wallets_count = len(wallets_to_register)
+    # slot별 지갑 (풀 경쟁 때문에 미룬 hotkey는 뒤 slot으로 이동)
+    slot_wallets = list(wallets_to_register[:max_slots])
+    wallets_count = len(slot_wallets)
+    assigned_count = sum(1 for wallet in slot_wallets if wallet is not None)
     registered_count = 0
+    attempts = []
     
-    start_block = next_registration_block - START_OFFSET
+    start_block = next_registration_block - start_offset
     # 실제로 등록할 수 있는 최대 개수
-    actual_registration_count = min(wallets_count, MAX_SLOTS)
+    actual_registration_count = max_slots if extend_slots else min(wallets_count, max_slots)
     # 마지막 블록 계산
     end_block = start_block + actual_registration_count - 1
     total_blocks = actual_registration_count
     
     print(f"\n{'='*60}")
-    print(f"Starting registration for {actual_registration_count} hotkeys")
+    print(f"Starting registration for {assigned_count} hotkeys")
     print(f"Epoch block: {next_registration_block}")
     print(f"Registration window: {start_block} to {end_block} ({total_blocks} blocks)")
-    print(f"Tip: {REGISTRATION_TIP:,} rao ({REGISTRATION_TIP/1e9:.6f} TAO)")
+    print(f"Tip tiers: {', '.join(f'{tip:,}' for tip in tip_tiers)} rao")
     print(f"{'='*60}\n")
     
-    async def on_new_block(block):
-        nonlocal registered_count
-        block_number = block["header"]["number"]
+    recorder = None
+    if RECORD_DIR:
+        recorder = open_recorder(RECORD_DIR, next_registration_block, {
+            "netuid": netuid,
+            "next_registration_block": next_registration_block,
+            "start_offset": start_offset,
+            "max_slots": max_slots,
+            "tip_tiers": tip_tiers,
+            "extend_slots": extend_slots,
+            "mempool_defer": MEMPOOL_DEFER,
+            "wallets": [
+                None if wallet is None else {
+                    "name": wallet.hotkey_str,
+                    "hotkey": wallet.hotkey.ss58_address,
+                    "coldkey": wallet.coldkey.ss58_address,
+                }
+                for wallet in slot_wallets
+            ],
+        })
+        subtensor = SimpleNamespace(substrate=RecordingSubstrate(subtensor.substrate, recorder))
+    
+    # 윈도우 전에 미리 서명 (hot path에서는 선택만)
+    substrate = subtensor.substrate
+    assigned_wallets = list(slot_wallets)
+    cache = VariantCache(tip_tiers)
+    nonces = await fetch_next_nonces(substrate, assigned_wallets)
+    anchor_block = await substrate.get_block_number(None)
+    calls = await presign_registrations(
+        substrate, cache, assigned_wallets, netuid, anchor_block, end_block, nonces, era_period=ERA_PERIOD
+    )
+    own_coldkeys = set(nonces)
+    competitor_tip = None
+    refresh_task = None
+    background_tasks = set()
+    last_submission = None  # 현재 열린 slot에 제출한 extrinsic {"idx", "block", "wallet", "nonce", "tier"}
+    
+    async def on_pool_competitor(registrations):
+        # 열린 slot에 우리 tip 이상인 경쟁 등록이 나타나면 같은 nonce로 더 높은 tier를 다시 제출 (풀에서 교체)
+        submission = last_submission
+        if submission is None:
+            return
+        pool_tip = watcher.max_tip()
+        tier = cache.tier_for_competition(pool_tip)
+        if pool_tip is None or pool_tip < tip_tiers[submission["tier"]] or tier <= submission["tier"]:
+            return
+        submission["tier"] = tier
+        wallet = submission["wallet"]
+        idx = submission["idx"]
+        print(f"\n{idx} ⬆ Pool competitor tip {pool_tip:,} ({len(registrations)} new), "
+              f"bumping {wallet.hotkey_str} to tier {tier}")
+        if recorder is not None:
+            recorder.record("pool_bump", block=submission["block"], idx=idx, tier=tier, pool_tip=pool_tip)
+        variant = cache.select(wallet.hotkey.ss58_address, submission["block"], submission["nonce"], tier)
+        if variant is not None:
+            await submit_variant(subtensor, variant, idx)
+        else:
+            await prepare_and_submit_extrinsic(
+                subtensor=subtensor,
+                wallet=wallet,
+                netuid=netuid,
+                block_id=submission["block"],
+                idx=idx,
+                tip=tip_tiers[tier],
+                nonce=submission["nonce"],
+            )
+    
+    watcher = open_mempool_watcher(netuid, own_coldkeys, on_pool_competitor, recorder)
+    if recorder is not None:
+        recorder.meta["mempool"] = watcher is not None
+    if watcher is not None:
+        watcher.start()
+    
+    def defer_slot(idx):
+        """
+        idx slot의 지갑을 다음 자기 slot으로 미루고 뒤 지갑들을 한 칸씩 밉니다.
+        더 밀 slot이 없으면 마지막 지갑은 다음 epoch로 넘어가며 그 지갑을 반환합니다.
+        """
+        positions = [i for i in range(idx, len(slot_wallets)) if slot_wallets[i] is not None]
+        shifted = [slot_wallets[i] for i in positions]
+        if extend_slots and len(slot_wallets) < max_slots:
+            slot_wallets.append(None)
+            positions.append(len(slot_wallets) - 1)
+        slot_wallets[idx] = None
+        for position, wallet in zip(positions[1:], shifted):
+            slot_wallets[position] = wallet
+        return shifted[-1] if len(positions) == len(shifted) else None
+    
+    async def refresh_variants(anchor):
+        nonlocal calls
+        try:
+            calls = await presign_registrations(
+                substrate, cache, assigned_wallets, netuid, anchor, end_block, nonces, calls, era_period=ERA_PERIOD
+            )
+        except Exception as e:
+            print(f"\n⚠ Failed to refresh pre-signed variants at {anchor}: {e}")
+    
+    async def observe_competition(block_number):
+        # 이 블록에 포함된 다른 coldkey의 등록 tip을 확인하여 다음 slot의 tip 단계를 결정
+        nonlocal competitor_tip
+        try:
+            block = await substrate.get_block(block_number=block_number)
+            tips = [
+                registration["tip"]
+                for extrinsic in block["extrinsics"]
+                for registration in extract_registrations(extrinsic, netuid)
+                if registration["signer"] not in own_coldkeys
+            ]
+            if tips:
+                competitor_tip = max(tips + ([competitor_tip] if competitor_tip is not None else []))
+                print(f"\n[Block {block_number}] {len(tips)} competing registrations, max tip {competitor_tip:,}")
+        except Exception as e:
+            print(f"\n⚠ Failed to observe competition at {block_number}: {e}")
+    
+    def run_in_background(coroutine):
+        task = asyncio.create_task(coroutine)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        return task
+    
+    # 주 연결이 거절/끊길 때 사용할 엔드포인트를 윈도우 전에 미리 연결
+    fallbacks = fallback_substrates()
+    if recorder is not None:
+        fallbacks = [RecordingSubstrate(fallback, recorder, endpoint) for endpoint, fallback in enumerate(fallbacks, 1)]
+        recorder.meta["fallback_endpoints"] = len(fallbacks)
+    endpoints = [substrate, *fallbacks]
+    if len(endpoints) > 1:
+        run_in_background(warm_up(endpoints[1:]))
+    
+    async def sign_registration(wallet, block_number, nonce, tip):
+        call = calls.get(wallet.hotkey.ss58_address)
+        if call is None:
+            call = await compose_registration_call(substrate, wallet, netuid)
+        return await substrate.create_signed_extrinsic(
+            call=call,
+            keypair=wallet.coldkey,
+            era={"period": ERA_PERIOD, "current": block_number},
+            nonce=nonce,
+            tip=tip,
+        )
+    
+    async def submit_slot(wallet, block_number, idx, tier):
+        """
+        slot 하나를 제출합니다. 거절되면 RETRY_BUDGET_MS 안에서 오류 종류에 따라 바로 복구해 다시 제출합니다.
+        
+        Returns:
+            Tuple[str, int, int]: (결과, nonce, tier)
+                SUBMITTED - 제출 성공
+                EXHAUSTED - 복구 가능한 오류였지만 시간/tier/엔드포인트가 남지 않음 (다음 slot에서 다시 시도)
+                REJECTED  - 복구할 수 없는 오류 (잔액 부족, 이미 등록 등: 다음 slot에서도 실패)
+        """
+        deadline = time.perf_counter() + RETRY_BUDGET_MS / 1000
+        hotkey = wallet.hotkey.ss58_address
+        coldkey = wallet.coldkey.ss58_address
+        nonce = nonces[coldkey]
+        endpoint = 0
+        resign = False
+        attempt = 0
+        while True:
+            attempt += 1
+            start_time = time.perf_counter()
+            variant = None if resign else cache.select(hotkey, block_number, nonce, tier)
+            try:
+                if variant is not None:
+                    extrinsic = variant.extrinsic
+                else:
+                    print(f"{idx} ⚠ No valid pre-signed variant (nonce {nonce}, tier {tier}), signing now")
+                    extrinsic = await sign_registration(wallet, block_number, nonce, tip_tiers[tier])
+                if endpoint > 0 and recorder is not None:
+                    recorder.record("fallback_submit", block=block_number, idx=idx, endpoint=endpoint)
+                extrinsic_hash = await submit_raw(endpoints[endpoint], extrinsic)
+                print(f"{idx} ✓ Submitted {'pre-signed' if variant is not None else 'signed'} "
+                      f"(tip {tip_tiers[tier]:,}, nonce {nonce}, attempt {attempt}, endpoint {endpoint}) "
+                      f"in {(time.perf_counter() - start_time) * 1000:.1f}ms: {extrinsic_hash}")
+                return SUBMITTED, nonce, tier
+            except Exception as e:
+                kind = classify_submit_error(e)
+                print(f"{idx} ✗ Attempt {attempt} rejected after {(time.perf_counter() - start_time) * 1000:.1f}ms "
+                      f"({kind or 'unrecoverable'}): {e}")
+                if kind == ALREADY_IMPORTED:
+                    return SUBMITTED, nonce, tier
+                if kind is None:
+                    return REJECTED, nonce, tier
+                if time.perf_counter() >= deadline:
+                    return EXHAUSTED, nonce, tier
+                
+                if kind == RETRY_TIP:
+                    if tier + 1 >= len(tip_tiers):
+                        return EXHAUSTED, nonce, tier
+                    tier += 1
+                elif kind == RETRY_NONCE:
+                    synced = (await fetch_next_nonces(substrate, [wallet]))[coldkey]
+                    if synced == nonce:
+                        return EXHAUSTED, nonce, tier
+                    nonce = synced
+                elif kind == RETRY_ERA:
+                    if resign:
+                        return EXHAUSTED, nonce, tier
+                    resign = True
+                elif kind == RETRY_ENDPOINT:
+                    if endpoint + 1 >= len(endpoints):
+                        return EXHAUSTED, nonce, tier
+                    endpoint += 1
+    
+    async def on_new_block(head):
+        nonlocal registered_count, assigned_count, refresh_task, last_submission
+        block_number = head.number
+        # 새 블록이 왔으므로 이전 slot은 닫힘
+        last_submission = None
         print(f"New block received: {block_number} {datetime.now()}", end="\r")
         
-        # Epoch START_OFFSET블록 전부터 시작 (더 집중된 전략)
-        # 로그 분석 결과: 마지막 2-3개 블록이 성공률이 높음
-        start_offset = START_OFFSET
+        # 윈도우 직전에는 가장 최근 블록을 anchor로 다시 서명 (백그라운드)
+        if (
+            0 < start_block - block_number <= VARIANT_REFRESH_LEAD
+            and block_number - cache.anchors[-1] >= VARIANT_REFRESH_BLOCKS
+            and (refresh_task is None or refresh_task.done())
+        ):
+            refresh_task = run_in_background(refresh_variants(block_number))
         
+        # Epoch start_offset블록 전부터 시작 (더 집중된 전략)
+        # 로그 분석 결과: 마지막 2-3개 블록이 성공률이 높음
         if block_number >= next_registration_block - start_offset:
             idx = block_number - next_registration_block + start_offset
             
-            if idx < wallets_count and idx < MAX_SLOTS:
-                wallet = wallets_to_register[idx]
+            # 이전 조회에는 이 블록에 이미 포함된 등록이 남아 있으므로 풀을 다시 조회한 결과만 사용
+            pool_tip = None
+            if (
+                watcher is not None
+                and idx < len(slot_wallets)
+                and slot_wallets[idx] is not None
+                and await watcher.refresh()
+            ):
+                pool_tip = watcher.max_tip()
+            if (
+                MEMPOOL_DEFER
+                and pool_tip is not None
+                and pool_tip >= tip_tiers[-1]
+                and idx < len(slot_wallets)
+                and slot_wallets[idx] is not None
+            ):
+                # 최고 tier로도 이길 수 없는 경쟁 등록이 풀에 있으면 이 slot을 포기하고 다음 slot으로 미룸
+                deferred = slot_wallets[idx]
+                dropped = defer_slot(idx)
+                print(f"\n[Block {block_number}] ⏭ Pool competitor tip {pool_tip:,} >= top tier, "
+                      f"moving {deferred.hotkey_str} to the next slot")
+                if recorder is not None:
+                    recorder.record("pool_defer", block=block_number, idx=idx, pool_tip=pool_tip)
+                if dropped is not None:
+                    assigned_count -= 1
+                    print(f"→ {dropped.hotkey_str} moved to a future epoch")
+            
+            if idx < len(slot_wallets) and slot_wallets[idx] is not None:
+                wallet = slot_wallets[idx]
                 
                 # Epoch까지의 거리 표시
                 distance = next_registration_block - block_number
@@ -295,109 +628,290 @@ async def register_miner_epoch(subtensor, wallets_to_register, netuid, next_regi
                 
                 print(f"\n[Block {block_number}] ({position}) 🚀 REGISTERING #{idx}: {wallet.hotkey_str}")
                 
-                # 블록 도착 즉시 준비+제출
-                await prepare_and_submit_extrinsic(
-                    subtensor=subtensor,
-                    wallet=wallet,
-                    netuid=netuid,
-                    block_id=block_number,
-                    idx=idx
-                )
-                registered_count += 1
+                # 유효한 미리 서명된 버전 선택 후 즉시 제출 (지난 블록과 현재 풀의 경쟁자 tip 중 높은 쪽 기준)
+                coldkey = wallet.coldkey.ss58_address
+                observed_tips = [tip for tip in (competitor_tip, pool_tip) if tip is not None]
+                tier = cache.tier_for_competition(max(observed_tips) if observed_tips else None)
+                result, nonce, tier = await submit_slot(wallet, block_number, idx, tier)
+                if result == SUBMITTED:
+                    last_submission = {
+                        "idx": idx, "block": block_number, "wallet": wallet, "nonce": nonce, "tier": tier,
+                    }
+                    nonces[coldkey] = nonce + 1
+                    registered_count += 1
+                elif result == EXHAUSTED:
+                    # 복구하지 못한 시도는 slot을 쓰지 않음: 지갑을 다음 slot으로 미룸
+                    dropped = defer_slot(idx)
+                    print(f"{idx} ⏭ Moving {wallet.hotkey_str} to the next slot after failed submission")
+                    if dropped is not None:
+                        assigned_count -= 1
+                        print(f"→ {dropped.hotkey_str} moved to a future epoch")
+                else:
+                    # 다음 slot에서도 같은 이유로 거절되므로 이 epoch에서는 제외 (뒤 지갑의 slot을 빼앗지 않음)
+                    slot_wallets[idx] = None
+                    assigned_count -= 1
+                    print(f"{idx} ✗ Dropping {wallet.hotkey_str} for this epoch after unrecoverable rejection")
+                attempts.append({
+                    "idx": idx,
+                    "block": block_number,
+                    "hotkey": wallet.hotkey.ss58_address,
+                    "submitted": result == SUBMITTED,
+                    "rejected": result == REJECTED,
+                })
+            
+            run_in_background(observe_competition(block_number))
         
         # 모든 slot 처리 완료 확인
-        # 마지막 블록 = 시작 블록 + MAX_SLOTS - 1
-        last_registration_block = next_registration_block - start_offset + MAX_SLOTS - 1
+        # 마지막 블록 = 시작 블록 + max_slots - 1
+        last_registration_block = next_registration_block - start_offset + max_slots - 1
         
         # 모든 등록 완료 조건:
         # 1. 마지막 블록을 넘어섬
         # 2. 또는 모든 지갑 등록 완료
-        if block_number > last_registration_block or registered_count >= min(wallets_count, MAX_SLOTS):
+        if block_number > last_registration_block or registered_count >= assigned_count:
             print(f"\n{'='*60}")
-            print(f"Registration epoch completed: {registered_count}/{wallets_count} hotkeys attempted")
+            print(f"Registration epoch completed: {registered_count}/{assigned_count} hotkeys submitted")
             print(f"Last block processed: {block_number}, Target was: {last_registration_block}")
             print(f"{'='*60}\n")
             registration_complete.set()
             return True
     
-    await subtensor.substrate.subscribe_block_headers(on_new_block)
-    await registration_complete.wait()
+    # 이미 열려 있는 헤더 구독에 붙기만 함 (헤더 전체 디코딩 없이 번호만 꺼내 바로 처리)
+    owned_hub = None
+    if hub is None:
+        hub = owned_hub = HeaderHub(subtensor.substrate).start()
+    subscribers = []
+    if recorder is not None:
+        subscribers.append(hub.attach(recorder.on_head, priority=True, name="recorder"))
+    subscribers.append(hub.attach(on_new_block, priority=True, name=f"epoch {next_registration_block}"))
+    try:
+        await subscribers[-1].wait()
+    finally:
+        for subscriber in subscribers:
+            hub.detach(subscriber)
+        if owned_hub is not None:
+            await owned_hub.stop()
+        if watcher is not None:
+            await watcher.stop()
+        if recorder is not None:
+            recorder.close(attempts=attempts, completed=registration_complete.is_set())
+    return attempts
+
+
+def attempt_outcome(attempt):
+    """register_miner_epoch의 시도 결과를 코디네이터 outcome 값으로 변환합니다."""
+    if attempt["submitted"]:
+        return "submitted"
+    return "rejected" if attempt.get("rejected") else "failed"
+
+
+async def release_slots(coordinator, epoch, attempts):
+    """
+    epoch가 끝나면 이 인스턴스의 제출 결과를 다른 인스턴스와 공유하고 slot lease를 반납합니다.
+    다른 인스턴스는 같은 epoch의 slot을 배정할 때 이 결과로 이미 제출/거절된 hotkey를 건너뜁니다.
+    """
+    if coordinator is None:
+        return
+    if attempts:
+        await coordinator.record_outcomes(epoch, INSTANCE_ID, [
+            [attempt["idx"], attempt["hotkey"], attempt_outcome(attempt)] for attempt in attempts
+        ])
+    await coordinator.release(epoch, INSTANCE_ID)
 
 
-async def register_miner(all_wallets, network, netuid):
+async def register_miner(all_wallets, network, netuid, subtensor=None):
     """
     메인 등록 루프: 무한 반복하며 매 epoch마다 미등록 hotkey를 자동으로 등록합니다.
+    SPLIT_PROCESS 모드에서는 이 루프가 제어 프로세스가 되어 상태 조회와 계획만 담당하고,
+    실제 제출은 SubmissionWorkerClient가 띄운 워커 프로세스에서 실행됩니다.
+    COORDINATOR_URL이 설정되면 다른 인스턴스와 slot lease를 나누어 가진 slot에만 제출합니다.
+    다른 인스턴스가 같은 coldkey를 사용 중이면 SharedColdkeyError로 종료합니다.
+    subtensor를 넘기면 (fast-start의 LightSubtensor 등) 새로 연결하지 않고 그대로 사용합니다.
     """
-    subtensor = AsyncSubtensor(network=network)
+    if subtensor is None:
+        from bittensor.core.async_subtensor import AsyncSubtensor
+
+        subtensor = AsyncSubtensor(network=network)
+    # 프로세스 전체에서 헤더 구독은 하나만 유지하고 체인 시계/epoch가 붙었다 떨어짐
+    hub = HeaderHub(subtensor.substrate).start()
+    clock_task = asyncio.create_task(track_chain_clock(subtensor, CHAIN_CLOCK, hub=hub))
+    loader = WalletLoader(WALLET_PWD)
+    coordinator = open_backend()
+    if coordinator is not None:
+        print(f"Coordinating as instance {INSTANCE_ID}")
+    worker = None
+    if SPLIT_PROCESS:
+        # 워커는 stdin이 없으므로 암호화된 coldkey 비밀번호를 여기서 한 번 확인하여 넘김
+        password = await asyncio.to_thread(coldkey_password, all_wallets[0].name, all_wallets[0].path, WALLET_PWD)
+        worker = SubmissionWorkerClient(network, netuid, password)
+        worker.start()
+        await worker.wait_for("ready")
+        print("✓ Submission worker ready")
     
-    while True:  # 무한 루프
-        try:
-            print(f"\n{'#'*60}")
-            print(f"# NEW REGISTRATION CYCLE - {datetime.now()}")
-            print(f"{'#'*60}\n")
-            
-            # 1. 현재 블록 및 epoch 정보 조회
-            current_block_number = await subtensor.get_current_block()
-            hyperparams = await subtensor.get_subnet_hyperparameters(netuid=netuid)
-            last_adjustment_block = await subtensor.substrate.query(
-                "SubtensorModule", "LastAdjustmentBlock", [netuid]
-            )
-            next_registration_block = (
-                last_adjustment_block.value + hyperparams.adjustment_interval
-            )
-            
-            blocks_until_next_epoch = next_registration_block - current_block_number
-            time_until_next_epoch = blocks_until_next_epoch * 12  # 12초 per block
-            
-            print(f"Current block: {current_block_number}")
-            print(f"Last adjustment block: {last_adjustment_block.value}")
-            print(f"Next registration block: {next_registration_block}")
-            print(f"Blocks until next epoch: {blocks_until_next_epoch}")
-            print(f"Time until next epoch: ~{time_until_next_epoch}s ({time_until_next_epoch/60:.1f} min)")
-            
-            # 2. 미등록 hotkey 찾기
-            unregistered_wallets = await get_unregistered_hotkeys(subtensor, all_wallets, netuid)
-            
-            if not unregistered_wallets:
-                print("\n✓ All hotkeys are already registered!")
-                print(f"Waiting until next epoch to check again...")
-                # 다음 epoch까지 대기
-                await asyncio.sleep(time_until_next_epoch + 30)  # 30초 버퍼
-                continue
-            
-            # 3. 등록할 지갑 선별 (최대 MAX_SLOTS개)
-            wallets_to_register = unregistered_wallets[:MAX_SLOTS]
-            remaining = len(unregistered_wallets) - len(wallets_to_register)
-            
-            print(f"\n→ Will register {len(wallets_to_register)} hotkeys in next epoch")
-            if remaining > 0:
-                print(f"→ {remaining} hotkeys will be registered in future epochs")
-            
-            for i, wallet in enumerate(wallets_to_register):
-                print(f"  [{i}] {wallet.hotkey_str} - {wallet.hotkey.ss58_address}")
-            
-            # 4. 다음 epoch까지 대기 (여유를 두고 조금 일찍 준비)
-            if blocks_until_next_epoch > MAX_SLOTS + 5:
-                wait_time = time_until_next_epoch - (MAX_SLOTS + 5) * 12
-                print(f"\nWaiting {wait_time}s until registration window...")
-                await asyncio.sleep(wait_time)
-            
-            # 5. 등록 실행
-            await register_miner_epoch(
-                subtensor=subtensor,
-                wallets_to_register=wallets_to_register,
-                netuid=netuid,
-                next_registration_block=next_registration_block
-            )
-            
-            # 6. 다음 사이클까지 대기
-            print(f"\nWaiting before next cycle...")
-            await asyncio.sleep(60)  # 1분 대기 후 다시 확인
-            
-        except Exception as e:
-            print(f"\n❌ Error in registration cycle: {e}")
-            print("Retrying in 60 seconds...")
-            await asyncio.sleep(60)
+    try:
+        while True:  # 무한 루프
+            try:
+                print(f"\n{'#'*60}")
+                print(f"# NEW REGISTRATION CYCLE - {datetime.now()}")
+                print(f"{'#'*60}\n")
+                
+                # 1. 현재 블록 및 epoch 정보 조회
+                # 전체 하이퍼파라미터 대신 필요한 스토리지 값만 조회
+                current_block_number = await subtensor.substrate.get_block_number(None)
+                adjustment_interval = await subtensor.substrate.query(
+                    "SubtensorModule", "AdjustmentInterval", [netuid]
+                )
+                last_adjustment_block = await subtensor.substrate.query(
+                    "SubtensorModule", "LastAdjustmentBlock", [netuid]
+                )
+                next_registration_block = (
+                    last_adjustment_block.value + adjustment_interval.value
+                )
+                
+                blocks_until_next_epoch = next_registration_block - current_block_number
+                time_until_next_epoch = seconds_until_block(next_registration_block, current_block_number)
+                
+                print(f"Current block: {current_block_number}")
+                print(f"Last adjustment block: {last_adjustment_block.value}")
+                print(f"Next registration block: {next_registration_block}")
+                print(f"Blocks until next epoch: {blocks_until_next_epoch}")
+                print(f"Time until next epoch: ~{time_until_next_epoch:.0f}s ({time_until_next_epoch/60:.1f} min)")
+                print(CHAIN_CLOCK.summary())
+                
+                if coordinator is not None:
+                    # 같은 coldkey를 쓰는 다른 인스턴스가 있으면 여기서 멈춤 (다음 사이클까지 등록 유지)
+                    await join_fleet(
+                        coordinator, INSTANCE_ID, all_wallets, time_until_next_epoch + (MAX_SLOTS + 2) * 12 + 300
+                    )
+                
+                # 2. 미등록 hotkey 찾기 (fleet_status.py 결과가 있으면 이미 등록된 hotkey는 확인에서 제외)
+                candidates = all_wallets
+                fleet_status = await asyncio.to_thread(load_fleet_status, FLEET_OUTPUT_JSON)
+                if fleet_status is not None:
+                    candidates = skip_registered(all_wallets, fleet_status, netuid)
+                    print(f"Fleet status at block {fleet_status['block']}: "
+                          f"{len(all_wallets) - len(candidates)} hotkeys already registered on netuid {netuid}")
+                unregistered_wallets = await get_unregistered_hotkeys(subtensor, candidates, netuid)
+                
+                if not unregistered_wallets:
+                    print("\n✓ All hotkeys are already registered!")
+                    print(f"Waiting until next epoch to check again...")
+                    # 다음 epoch까지 대기
+                    await asyncio.sleep(time_until_next_epoch + 30)  # 30초 버퍼
+                    continue
+                
+                # 3. 등록할 지갑 선별 (최대 MAX_SLOTS개)
+                if coordinator is not None:
+                    # 등록 윈도우가 끝날 때까지 lease 유지
+                    lease_ttl = time_until_next_epoch + (MAX_SLOTS + 2) * 12
+                    wallets_to_register = await assign_slots(
+                        coordinator, INSTANCE_ID, next_registration_block, unregistered_wallets, MAX_SLOTS, lease_ttl
+                    )
+                else:
+                    wallets_to_register = unregistered_wallets[:MAX_SLOTS]
+                assigned = [wallet for wallet in wallets_to_register if wallet is not None]
+                remaining = len(unregistered_wallets) - len(assigned)
+                
+                print(f"\n→ Will register {len(assigned)} hotkeys in next epoch")
+                if remaining > 0:
+                    print(f"→ {remaining} hotkeys will be registered in future epochs")
+                
+                for i, wallet in enumerate(wallets_to_register):
+                    if wallet is None:
+                        print(f"  [{i}] (assigned to another instance)")
+                    else:
+                        print(f"  [{i}] {wallet.hotkey_str} - {wallet.hotkey.ss58_address}")
+                
+                if not assigned:
+                    print("\nAll slots are owned by other instances, waiting until next epoch...")
+                    await asyncio.sleep(time_until_next_epoch + 30)
+                    continue
+                
+                if worker is not None:
+                    # 워커가 지갑 로드와 윈도우 대기를 직접 처리하므로 계획(slot 설정, 체인 시계 포함)만 바로 전달
+                    if not worker.is_alive():
+                        print("⚠ Submission worker died, restarting...")
+                        worker.start()
+                        await worker.wait_for("ready")
+                    worker.submit_plan(
+                        next_registration_block, current_block_number, wallets_to_register, START_OFFSET, MAX_SLOTS,
+                        TIP_TIERS, coordinator is None, CHAIN_CLOCK,
+                    )
+                    attempts = []
+                    try:
+                        result = await worker.wait_for("epoch_done")
+                        attempts = result["attempts"]
+                        print(f"Submission worker finished epoch {result['next_registration_block']}: "
+                              f"{len(attempts)} attempted")
+                    finally:
+                        # 워커가 죽거나 오류를 보내도 lease는 반납 (다른 인스턴스가 남은 slot을 쓰도록)
+                        await release_slots(coordinator, next_registration_block, attempts)
+                    print(f"\nWaiting before next cycle...")
+                    await asyncio.sleep(60)
+                    continue
+                
+                # 배정된 hotkey만 keypair 로드 (coldkey는 한 번만 복호화, 로드한 지갑은 epoch 간 캐시)
+                wallets_to_register = await asyncio.to_thread(load_scheduled, wallets_to_register, loader)
+                
+                # 4. 다음 epoch까지 대기 (여유를 두고 조금 일찍 준비)
+                if blocks_until_next_epoch > MAX_SLOTS + 5:
+                    wait_time = seconds_until_block(next_registration_block - (MAX_SLOTS + 5), current_block_number)
+                    print(f"\nWaiting {wait_time:.0f}s until registration window...")
+                    await asyncio.sleep(wait_time)
+                
+                # 5. 등록 실행
+                attempts = []
+                try:
+                    attempts = await register_miner_epoch(
+                        subtensor=subtensor,
+                        wallets_to_register=wallets_to_register,
+                        netuid=netuid,
+                        next_registration_block=next_registration_block,
+                        extend_slots=coordinator is None,
+                        hub=hub,
+                    )
+                finally:
+                    await release_slots(coordinator, next_registration_block, attempts)
+                
+                # 6. 다음 사이클까지 대기
+                print(f"\nWaiting before next cycle...")
+                await asyncio.sleep(60)  # 1분 대기 후 다시 확인
+                
+            except SharedColdkeyError:
+                raise
+            except Exception as e:
+                print(f"\n❌ Error in registration cycle: {e}")
+                print("Retrying in 60 seconds...")
+                await asyncio.sleep(60)
+
+    finally:
+        if coordinator is not None:
+            await coordinator.leave(INSTANCE_ID)
+            await coordinator.close()
+
+async def run_fast_start(wallet_path, coldkey_name, network, netuid):
+    """
+    FAST_START 모드: 노드 연결/메타데이터 조회와 지갑 탐색을 동시에 진행하고,
+    등록 call을 한 번 구성해 둔 시점까지의 시간(time-to-ready)을 출력한 뒤 등록 루프를 시작합니다.
+    """
+    imports_done = time.perf_counter() - STARTED_AT
+
+    async def warm_up_wallets(substrate, wallets):
+        await compose_registration_call(substrate, wallets[0], netuid)
+
+    subtensor, all_wallets, timings = await fast_start(
+        network, lambda: discover_wallets(wallet_path, coldkey_name), warm_up_wallets
+    )
+    print(
+        f"\n⚡ Ready to submit {imports_done + timings['ready']:.2f}s after start "
+        f"(imports {imports_done:.2f}s, connect+metadata {timings['connect_and_metadata']:.2f}s, "
+        f"wallets {timings['wallets']:.2f}s, cached metadata hits {subtensor.substrate.metadata_cache_hits})"
+    )
+    if not all_wallets:
+        print(f"❌ No hotkeys found for coldkey '{coldkey_name}'")
+        print(f"Please check your wallet path: {wallet_path}/{coldkey_name}/hotkeys/")
+        return
+    await register_miner(all_wallets, network, netuid, subtensor=subtensor)
 
 
 def main():
@@ -420,15 +934,29 @@ def main():
     print(f"Netuid: {netuid}")
     print(f"Coldkey: {coldkey_name}")
     print(f"Wallet path: {wallet_path}")
+    if AUTO_WINDOW:
+        apply_window_stats(netuid)
     print(f"\n--- Competition Settings ---")
     print(f"Max slots per epoch: {MAX_SLOTS}")
     print(f"Registration tip: {REGISTRATION_TIP:,} rao ({REGISTRATION_TIP/1e9:.6f} TAO)")
+    print(f"Tip tiers: {', '.join(f'{tip:,}' for tip in TIP_TIERS)} rao")
     print(f"Era period: {ERA_PERIOD} blocks")
+    print(f"Start offset: {START_OFFSET} blocks before epoch")
+    print(f"Mempool watcher: {MEMPOOL_NETWORK or 'disabled'}")
+    print(f"Scale mode: {'on (wallets loaded when scheduled)' if SCALE_MODE else 'off'}")
     print(f"Strategy: PRE-PREPARED EXTRINSICS (Fast Submit)")
     print(f"{'='*60}\n")
     
-    # Coldkey에서 모든 hotkey 자동 탐색
-    all_wallets = discover_hotkeys(wallet_path, coldkey_name)
+    if FAST_START:
+        print(f"🚀 Fast start: connecting and loading wallets in parallel...")
+        try:
+            asyncio.run(run_fast_start(wallet_path, coldkey_name, network, netuid))
+        except KeyboardInterrupt:
+            print("\n\n⏹️  Bot stopped by user")
+        return
+    
+    # Coldkey에서 모든 hotkey 자동 탐색 (SCALE_MODE에서는 키파일의 주소만 읽어 둠)
+    all_wallets = discover_wallets(wallet_path, coldkey_name)
     
     if not all_wallets:
         print(f"❌ No hotkeys found for coldkey '{coldkey_name}'")
@@ -444,6 +972,9 @@ def main():
     print(f"\n🚀 Starting automated registration process...")
     print(f"This bot will run continuously and register unregistered hotkeys every epoch.\n")
     
+    if SPLIT_PROCESS:
+        print(f"Submission runs in a separate worker process (SPLIT_PROCESS=1)")
+    
     try:
         asyncio.run(register_miner(all_wallets, network, netuid))
     except KeyboardInterrupt:
@@ -0,0 +1,372 @@
+"""
+header_recorder.py 기록을 네트워크 없이 다시 실행하는 재현 하네스.
+
+기록된 헤더를 원래 도착 간격(REPLAY_SPEED 배속)으로 register_miner_epoch에 그대로 전달하고,
+nonce/블록/제출 응답은 기록된 값을 돌려줍니다. 서명은 입력(call, era, nonce, tip)의 해시로 대신하므로
+지갑 키 없이도 같은 기록은 항상 같은 slot 결정을 만듭니다.
+
+mempool watcher가 기록한 풀 상태는 기록 당시와 같은 헤더/제출 사이에 다시 적용하고(새 블록에서의 refresh 포함),
+fallback 엔드포인트로 보낸 제출은 엔드포인트별로 기록된 응답을 돌려줍니다.
+
+재생 결과의 slot별 제출(attempts)을 기록 당시 결과와 비교하여 다르면 종료 코드 1을 반환하므로
+idx 계산, 완료 조건, 재시도/미루기, 풀 경쟁 대응 로직을 고친 뒤 회귀 검사로 사용할 수 있습니다.
+
+사용법:
+    RECORD_DIR=recordings python register_force_v2.py                         # 기록
+    REPLAY_PATH=recordings/epoch-...jsonl.gz REPLAY_SPEED=0 python replay_harness.py  # 재생
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+from header_hub import SubscriptionEnded
+from mempool_watcher import MempoolWatcher
+
+load_dotenv()
+
+REPLAY_PATH = os.getenv("REPLAY_PATH")
+REPLAY_SPEED = float(os.getenv("REPLAY_SPEED", "1"))  # 1: 기록 당시 간격, 10: 10배속, 0: 대기 없이
+REPLAY_OUTPUT = os.getenv("REPLAY_OUTPUT")  # 재생 결과 JSON (선택)
+
+
+class ReplayExhausted(SubscriptionEnded):
+    """기록된 헤더를 모두 전달했는데도 epoch가 끝나지 않음."""
+
+
+def load_recording(path):
+    """
+    Returns:
+        Tuple[dict, list, dict | None]: (meta, events, result) - 기록이 중간에 끊겼으면 result는 None
+    """
+    meta, events, result = None, [], None
+    with gzip.open(path, "rt") as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry["type"] == "meta":
+                meta = entry
+            elif entry["type"] == "result":
+                result = entry
+            else:
+                events.append(entry)
+    if meta is None:
+        raise ValueError(f"{path} has no meta line")
+    return meta, events, result
+
+
+def request_key(method, params):
+    return f"{method} {json.dumps(params, sort_keys=True, default=str)}"
+
+
+class _ReplayWebsocket:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def unsubscribe(self, subscription_id, method=None):
+        pass
+
+
+class ReplaySubstrate:
+    """
+    기록된 응답을 돌려주는 AsyncSubstrateInterface 대용.
+
+    같은 요청이 여러 번 기록되었으면 순서대로 돌려주고, 다 쓰면 마지막 응답을 재사용합니다.
+    제출 응답은 엔드포인트별로 기록 순서대로 돌려주며, 기록보다 제출이 많으면 extrinsic 해시로 성공 응답을 합성합니다.
+
+    Attributes:
+        delivered: 재생 중 전달한 헤더 [{"t", "number"}] (t: 첫 헤더부터의 초)
+        submitted: 재생 중 제출한 extrinsic [{"t", "endpoint", "extrinsic"}]
+        watcher: 재생 중인 ReplayMempoolWatcher (기록에 mempool 감시가 없으면 None)
+    """
+
+    def __init__(self, events, speed=REPLAY_SPEED):
+        self.speed = speed
+        self.heads = [event for event in events if event["type"] == "head"]
+        self.responses = {}
+        self.blocks = {}
+        self.submits = {}
+        self.submit_times = []
+        for event in events:
+            if event["type"] == "rpc":
+                self.responses.setdefault(request_key(event["method"], event["params"]), deque()).append(
+                    event["result"]
+                )
+            elif event["type"] == "block":
+                self.blocks[event["block_number"]] = event["extrinsics"]
+            elif event["type"] == "submit":
+                self.submits.setdefault(event.get("endpoint", 0), deque()).append(event)
+                self.submit_times.append(event["t"])
+        self.delivered = []
+        self.submitted = []
+        self.watcher = None
+        self.ws = _ReplayWebsocket()
+        self._started = time.monotonic()
+
+    @staticmethod
+    def make_payload(id_, method, params):
+        return {"id": id_, "payload": {"jsonrpc": "2.0", "method": method, "params": params}}
+
+    def _recorded(self, method, params):
+        key = request_key(method, params)
+        queue = self.responses.get(key)
+        if not queue:
+            raise KeyError(f"No recorded response for {key[:200]}")
+        return queue.popleft() if len(queue) > 1 else queue[0]
+
+    async def get_block_number(self, block_hash=None):
+        return self._recorded("get_block_number", [block_hash])
+
+    async def rpc_request(self, method, params, *args, **kwargs):
+        return {"result": self._recorded(method, params)}
+
+    async def get_block(self, block_hash=None, block_number=None, **kwargs):
+        return {"extrinsics": self.blocks.get(block_number, [])}
+
+    async def compose_call(self, call_module, call_function, call_params=None, block_hash=None):
+        return {"call_module": call_module, "call_function": call_function, "call_args": call_params or {}}
+
+    async def create_signed_extrinsic(self, call, keypair, era=None, nonce=None, tip=0, **kwargs):
+        payload = json.dumps([call, era, nonce, tip], sort_keys=True, default=str).encode()
+        return SimpleNamespace(data="0x" + hashlib.blake2b(payload, digest_size=32).hexdigest())
+
+    async def _submit(self, data, endpoint=0):
+        """
+        기록된 제출 응답을 돌려줍니다. 기록 당시 이 제출 전에 적용된 풀 상태를 먼저 적용합니다.
+
+        Returns:
+            dict: JSON-RPC 응답, 또는 응답 없이 실패한 제출이면 {"exception", "message"}
+        """
+        if self.watcher is not None and len(self.submitted) < len(self.submit_times):
+            await self.watcher.deliver_until(self.submit_times[len(self.submitted)])
+        self.submitted.append({"t": round(time.monotonic() - self._started, 6), "endpoint": endpoint, "extrinsic": data})
+        queue = self.submits.get(endpoint)
+        if queue:
+            event = queue.popleft()
+            return event["response"] if "response" in event else event
+        return {"result": "0x" + hashlib.blake2b(data.encode(), digest_size=32).hexdigest()}
+
+    async def submit_extrinsic(self, extrinsic, wait_for_inclusion=False, wait_for_finalization=False):
+        response = await self._submit(str(extrinsic.data))
+        if "exception" in response:
+            raise RuntimeError(response["message"])
+        if "error" in response:
+            raise RuntimeError(response["error"].get("message"))
+        return SimpleNamespace(extrinsic_hash=response["result"])
+
+    async def _make_rpc_request(self, payloads, *args, result_handler=None, endpoint=0, **kwargs):
+        payload = payloads[0]
+        method = payload["payload"]["method"]
+        if method == "author_submitExtrinsic":
+            response = await self._submit(payload["payload"]["params"][0], endpoint)
+            if "exception" in response:
+                # 응답 없이 실패한 제출은 연결 오류로 다시 발생 (RETRY_ENDPOINT로 분류됨)
+                raise ConnectionError(response["message"])
+            return {payload["id"]: [response]}
+        if method == "chain_subscribeNewHeads" and result_handler is not None:
+            return {payload["id"]: [await self._replay_heads(result_handler)]}
+        raise NotImplementedError(f"Replay does not support {method}")
+
+    async def _replay_heads(self, result_handler):
+        if not self.heads:
+            raise ReplayExhausted("Recording has no headers")
+        self._started = time.monotonic()
+        first = self.heads[0]["t"]
+        for event in self.heads:
+            if self.speed > 0:
+                delay = self._started + (event["t"] - first) / self.speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            # 백그라운드 작업(observe_competition 등)이 헤더 사이에 실행될 기회를 줌
+            await asyncio.sleep(0)
+            if self.watcher is not None:
+                await self.watcher.deliver_until(event["t"])
+            self.delivered.append({"t": round(time.monotonic() - self._started, 6), "number": event["header"]["number"]})
+            message = {"params": {"subscription": "replay", "result": event["header"]}}
+            result, done = await result_handler(message, "replay")
+            if done:
+                return result
+        raise ReplayExhausted(f"Epoch did not complete after {len(self.heads)} recorded headers")
+
+
+class ReplayEndpoint:
+    """FALLBACK_ENDPOINTS 연결 대용. 제출은 엔드포인트 번호와 함께 ReplaySubstrate로 전달합니다."""
+
+    def __init__(self, replay_substrate, endpoint):
+        self.replay_substrate = replay_substrate
+        self.endpoint = endpoint
+        self.url = f"replay://fallback-{endpoint}"
+
+    make_payload = staticmethod(ReplaySubstrate.make_payload)
+
+    async def initialize(self):
+        pass
+
+    async def _make_rpc_request(self, payloads, *args, **kwargs):
+        return await self.replay_substrate._make_rpc_request(payloads, *args, endpoint=self.endpoint, **kwargs)
+
+
+class ReplayMempoolWatcher(MempoolWatcher):
+    """
+    기록된 풀 상태(pool 이벤트)를 다시 적용하는 MempoolWatcher.
+
+    제시간에 끝난 refresh의 상태는 같은 번호의 refresh() 호출에서 적용하고, 나머지(주기 조회, 늦게 끝난 refresh)는
+    기록 시각(t)이 지난 다음 헤더/제출 직전에 deliver_until로 적용합니다.
+    """
+
+    def __init__(self, events, netuid, own_coldkeys=(), on_competitor=None):
+        super().__init__(None, netuid, own_coldkeys, on_competitor)
+        fresh = {event["refresh"] for event in events if event["type"] == "pool_refresh" and event["fresh"]}
+        pools = [event for event in events if event["type"] == "pool"]
+        self.refreshed = {event["refresh"]: event for event in pools if event["refresh"] in fresh}
+        self.background = deque(event for event in pools if event["refresh"] not in fresh)
+
+    def start(self):
+        return None
+
+    async def stop(self):
+        pass
+
+    async def refresh(self, timeout=None):
+        self.refreshes += 1
+        event = self.refreshed.get(self.refreshes)
+        if event is None:
+            return False
+        await self.update(event["competitors"], self.refreshes)
+        return True
+
+    async def deliver_until(self, t):
+        """기록 시각이 t 이전인 주기 조회 결과를 순서대로 적용합니다."""
+        while self.background and self.background[0]["t"] <= t:
+            await self.update(self.background.popleft()["competitors"])
+
+
+def submission_latencies(heads, submits):
+    """제출 시각 - 직전 헤더 도착 시각 (ms). heads/submits는 같은 기준의 t를 가진 이벤트."""
+    latencies = []
+    arrivals = [head["t"] for head in heads]
+    for submit in submits:
+        previous = [t for t in arrivals if t <= submit["t"]]
+        if previous:
+            latencies.append((submit["t"] - previous[-1]) * 1000)
+    return latencies
+
+
+async def replay(path, speed=REPLAY_SPEED):
+    """
+    기록 하나를 재생하고 결과를 기록 당시와 비교합니다.
+
+    Returns:
+        dict: {"path", "completed", "attempts", "recorded_attempts", "matches", "heads_delivered", "submitted",
+               "latencies_ms", "recorded_latencies_ms"}
+    """
+    meta, events, recorded = load_recording(path)
+
+    # 재생 중에는 실제 노드 연결과 다시 기록하는 것을 막음 (load_dotenv는 이미 있는 값을 덮어쓰지 않음)
+    os.environ["MEMPOOL_NETWORK"] = ""
+    os.environ["FALLBACK_ENDPOINTS"] = ""
+    os.environ["RECORD_DIR"] = ""
+    import register_force_v2 as bot
+
+    bot.MEMPOOL_NETWORK = None
+    bot.RECORD_DIR = None
+    bot.MEMPOOL_DEFER = meta.get("mempool_defer", False)
+    wallets = [
+        None if entry is None else SimpleNamespace(
+            hotkey_str=entry["name"],
+            hotkey=SimpleNamespace(ss58_address=entry["hotkey"]),
+            coldkey=SimpleNamespace(ss58_address=entry["coldkey"]),
+        )
+        for entry in meta["wallets"]
+    ]
+
+    substrate = ReplaySubstrate(events, speed)
+
+    def open_replay_watcher(netuid, own_coldkeys, on_competitor, recorder=None):
+        if not meta.get("mempool"):
+            return None
+        substrate.watcher = ReplayMempoolWatcher(events, netuid, own_coldkeys, on_competitor)
+        return substrate.watcher
+
+    bot.open_mempool_watcher = open_replay_watcher
+    endpoints = [ReplayEndpoint(substrate, endpoint) for endpoint in range(1, meta.get("fallback_endpoints", 0) + 1)]
+    bot.fallback_substrates = lambda: endpoints
+    completed = True
+    try:
+        attempts = await bot.register_miner_epoch(
+            SimpleNamespace(substrate=substrate),
+            wallets,
+            meta["netuid"],
+            meta["next_registration_block"],
+            extend_slots=meta["extend_slots"],
+            start_offset=meta["start_offset"],
+            max_slots=meta["max_slots"],
+            tip_tiers=meta["tip_tiers"],
+        )
+    except ReplayExhausted as e:
+        print(f"\n⚠ {e}")
+        completed = False
+        attempts = None
+
+    recorded_attempts = recorded.get("attempts") if recorded else None
+    return {
+        "path": path,
+        "completed": completed,
+        "attempts": attempts,
+        "recorded_attempts": recorded_attempts,
+        "matches": completed and recorded_attempts is not None and attempts == recorded_attempts,
+        "heads_delivered": len(substrate.delivered),
+        "submitted": substrate.submitted,
+        "latencies_ms": submission_latencies(substrate.delivered, substrate.submitted),
+        "recorded_latencies_ms": submission_latencies(
+            substrate.heads, [event for event in events if event["type"] == "submit"]
+        ),
+    }
+
+
+def print_report(report):
+    print(f"\n{'='*60}")
+    print(f"Replay of {report['path']}")
+    recorded = report["recorded_attempts"]
+    replayed = report["attempts"] or []
+    for label, attempts in (("recorded", recorded or []), ("replayed", replayed)):
+        print(f"  {label:>8}: " + (", ".join(
+            f"#{attempt['idx']}@{attempt['block']}{'✓' if attempt['submitted'] else '✗'}"
+            f"{' (rejected)' if attempt.get('rejected') else ''}" for attempt in attempts
+        ) or "(no attempts)"))
+    for label, key in (("recorded", "recorded_latencies_ms"), ("replayed", "latencies_ms")):
+        latencies = report[key]
+        if latencies:
+            print(f"  {label} head→submit: max {max(latencies):.1f}ms, mean {sum(latencies) / len(latencies):.1f}ms")
+    if recorded is None:
+        print("  ⚠ Recording has no result line (interrupted), nothing to compare")
+    elif report["matches"]:
+        print("  ✓ Replay matches the recorded slot decisions")
+    else:
+        print("  ✗ Replay differs from the recorded slot decisions")
+    print(f"{'='*60}")
+
+
+def main():
+    if not REPLAY_PATH:
+        raise ValueError("REPLAY_PATH must be set")
+    report = asyncio.run(replay(REPLAY_PATH))
+    print_report(report)
+    if REPLAY_OUTPUT:
+        with open(REPLAY_OUTPUT, "w") as f:
+            json.dump(report, f, indent=2)
+    if report["recorded_attempts"] is not None and not report["matches"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+지연 시간에 민감한 제출 작업을 별도 프로세스로 분리합니다.
+
+제출 워커 프로세스는 웹소켓 연결, 블록 헤더 구독, 서명/제출을 전담하고,
+제어 프로세스(register_force_v2.register_miner)는 metagraph 상태 조회, 상태 출력, 계획 수립을 담당합니다.
+두 프로세스는 multiprocessing Pipe(로컬 소켓 쌍)로 작은 dict 메시지를 주고받습니다.
+
+제어 -> 워커:
+    {"type": "plan", "next_registration_block", "current_block", "start_offset", "max_slots", "tip_tiers",
+     "extend_slots", "clock": ChainClock.snapshot(), "hotkeys": [(name, hotkey, path) | None]}
+    {"type": "stop"}
+
+워커는 module 전역을 바꾸지 않고 계획의 값을 그대로 register_miner_epoch에 넘기며,
+제어 프로세스의 체인 시계 추정값으로 등록 윈도우 직전까지 직접 대기합니다.
+암호화된 coldkey는 워커의 stdin이 없으므로 제어 프로세스에서 확인한 비밀번호를 프로세스 인자로 받아 한 번만 복호화합니다.
+워커 -> 제어:
+    {"type": "ready"}
+    {"type": "epoch_done", "next_registration_block", "attempts"}
+    {"type": "error", "error"}
+"""
+import asyncio
+import multiprocessing
+import traceback
+
+
+def load_wallets(loader, hotkeys):
+    """
+    (coldkey 이름, hotkey 이름, 경로) 목록을 loader(WalletLoader)로 로드합니다. 이미 로드한 지갑은 캐시를 사용합니다.
+    다른 인스턴스가 맡은 slot(None)은 그대로 None으로 둡니다.
+    이벤트 루프를 막지 않도록 워커에서 asyncio.to_thread로 호출합니다.
+    """
+    return [None if entry is None else loader.load(*entry) for entry in hotkeys]
+
+
+async def _recv(conn):
+    """Pipe에 도착한 메시지를 이벤트 루프를 막지 않고 읽습니다."""
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    loop.add_reader(conn.fileno(), ready.set)
+    try:
+        while not conn.poll():
+            ready.clear()
+            await ready.wait()
+        return conn.recv()
+    finally:
+        loop.remove_reader(conn.fileno())
+
+
+async def _worker_main(conn, network, netuid, coldkey_password):
+    import register_force_v2 as bot
+    from bittensor.core.async_subtensor import AsyncSubtensor
+    from chain_clock import ChainClock
+    from header_hub import HeaderHub
+    from hotkey_records import WalletLoader
+
+    subtensor = AsyncSubtensor(network=network)
+    # 웹소켓 연결 및 런타임 메타데이터를 미리 준비
+    await subtensor.substrate.init_runtime()
+    # epoch마다 구독하지 않도록 헤더 구독을 미리 열어 둠
+    hub = HeaderHub(subtensor.substrate).start()
+    loader = WalletLoader(coldkey_password)
+    clock = ChainClock()
+    conn.send({"type": "ready"})
+
+    while True:
+        message = await _recv(conn)
+        if message["type"] == "stop":
+            break
+        if message["type"] != "plan":
+            continue
+
+        try:
+            wallets = await asyncio.to_thread(load_wallets, loader, message["hotkeys"])
+            next_registration_block = message["next_registration_block"]
+            max_slots = message["max_slots"]
+            clock.restore(message["clock"])
+            # 등록 윈도우 직전까지 대기 (제어 프로세스와 같은 기준)
+            prepare_block = next_registration_block - (max_slots + 5)
+            if prepare_block > message["current_block"]:
+                await asyncio.sleep(bot.seconds_until_block(prepare_block, message["current_block"], clock))
+            attempts = await bot.register_miner_epoch(
+                subtensor=subtensor,
+                wallets_to_register=wallets,
+                netuid=netuid,
+                next_registration_block=next_registration_block,
+                extend_slots=message["extend_slots"],
+                hub=hub,
+                start_offset=message["start_offset"],
+                max_slots=max_slots,
+                tip_tiers=message["tip_tiers"],
+            )
+            conn.send({
+                "type": "epoch_done",
+                "next_registration_block": next_registration_block,
+                "attempts": attempts,
+            })
+        except Exception as e:
+            traceback.print_exc()
+            conn.send({"type": "error", "error": str(e)})
+
+
+def run_submission_worker(conn, network, netuid, coldkey_password=None):
+    """제출 워커 프로세스 진입점."""
+    try:
+        asyncio.run(_worker_main(conn, network, netuid, coldkey_password))
+    except KeyboardInterrupt:
+        pass
+
+
+class SubmissionWorkerClient:
+    """
+    제어 프로세스 쪽에서 제출 워커 프로세스를 시작하고 계획을 전달합니다.
+
+    Args:
+        network: 네트워크 이름 또는 엔드포인트
+        netuid: 서브넷 ID
+        coldkey_password: 암호화된 coldkey의 비밀번호 (hotkey_records.coldkey_password로 확인한 값)
+    """
+
+    def __init__(self, network, netuid, coldkey_password=None):
+        self.network = network
+        self.netuid = netuid
+        self.coldkey_password = coldkey_password
+        self.process = None
+        self._conn = None
+
+    def start(self):
+        # 재시작: 죽은 워커의 파이프와 프로세스 자원을 먼저 정리
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.process is not None and not self.process.is_alive():
+            self.process.join()
+            self.process.close()
+            self.process = None
+        # fork는 부모의 이벤트 루프/소켓 상태를 복제하므로 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=run_submission_worker,
+            args=(child_conn, self.network, self.netuid, self.coldkey_password),
+            name="submission-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    async def wait_for(self, message_type):
+        """지정한 종류의 메시지가 올 때까지 기다립니다. 워커 오류는 RuntimeError로 전달됩니다."""
+        while True:
+            message = await _recv(self._conn)
+            if message["type"] == message_type:
+                return message
+            if message["type"] == "error":
+                raise RuntimeError(f"Submission worker error: {message['error']}")
+
+    def submit_plan(self, next_registration_block, current_block, wallets, start_offset, max_slots, tip_tiers,
+                    extend_slots, clock):
+        """
+        epoch 계획을 워커에 보냅니다.
+
+        Args:
+            next_registration_block: 다음 등록(epoch) 블록 번호
+            current_block: 계획을 세운 시점의 블록 번호
+            wallets: slot 순서의 지갑 리스트 (다른 인스턴스가 맡은 slot은 None)
+            start_offset: epoch 몇 블록 전부터 제출할지
+            max_slots: epoch당 slot 개수
+            tip_tiers: 미리 서명할 tip 단계
+            extend_slots: 미룬 hotkey가 빈 뒤쪽 slot을 사용할 수 있는지
+            clock: 제어 프로세스의 ChainClock (추정 상태만 전달)
+        """
+        self._conn.send({
+            "type": "plan",
+            "next_registration_block": next_registration_block,
+            "current_block": current_block,
+            "start_offset": start_offset,
+            "max_slots": max_slots,
+            "tip_tiers": tip_tiers,
+            "extend_slots": extend_slots,
+            "clock": clock.snapshot(),
+            "hotkeys": [
+                (wallet.name, wallet.hotkey_str, wallet.path) if wallet is not None else None
+                for wallet in wallets
+            ],
+        })
+
+    def stop(self):
+        if not self.is_alive():
+            return
+        try:
+            self._conn.send({"type": "stop"})
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
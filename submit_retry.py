@@ -0,0 +1,106 @@
+"""
+등록 extrinsic 제출 오류 분류와 fallback 엔드포인트.
+
+`submit_extrinsic`은 JSON-RPC 오류의 message만 남기므로("Invalid Transaction" 등) 원인을 구분할 수 없습니다.
+여기서는 `author_submitExtrinsic`을 직접 호출하여 code/message/data를 모두 받고,
+같은 블록 안에서 바로 복구할 수 있도록 복구 방법별로 분류합니다.
+
+    RETRY_TIP        1014 Priority is too low / 1012 banned  → 같은 nonce로 다음 tip 단계
+    RETRY_NONCE      1010 outdated(Stale) / future           → account_nextIndex로 nonce 다시 맞춤
+    RETRY_ERA        1010 ancient birth block / bad proof    → 새 era anchor로 다시 서명
+    RETRY_ENDPOINT   1016 pool full / 연결 오류                → 미리 연결해 둔 다른 엔드포인트로 전송
+    ALREADY_IMPORTED 1013                                    → 이미 풀에 있으므로 성공으로 처리
+"""
+import asyncio
+import os
+
+from dotenv import load_dotenv
+from websockets.exceptions import ConnectionClosed
+
+from fast_start import SS58_FORMAT, MetadataCachedSubstrate
+
+load_dotenv()
+
+# 주 연결이 거절/끊겼을 때 제출할 엔드포인트 (쉼표 구분 ws(s):// 주소)
+FALLBACK_ENDPOINTS = [url.strip() for url in os.getenv("FALLBACK_ENDPOINTS", "").split(",") if url.strip()]
+RETRY_BUDGET_MS = float(os.getenv("RETRY_BUDGET_MS", "2000"))  # slot 하나에서 재시도에 쓸 수 있는 최대 시간
+
+RETRY_TIP = "tip"
+RETRY_NONCE = "nonce"
+RETRY_ERA = "era"
+RETRY_ENDPOINT = "endpoint"
+ALREADY_IMPORTED = "imported"
+
+_fallback_substrates = None
+
+
+class SubmitError(Exception):
+    """author_submitExtrinsic JSON-RPC 오류."""
+
+    def __init__(self, code, message, data=None):
+        self.code = code
+        self.message = message
+        self.data = data
+        super().__init__(f"{code} {message}" + (f": {data}" if data else ""))
+
+
+def classify_submit_error(error):
+    """
+    제출 오류를 복구 방법으로 분류합니다.
+
+    Returns:
+        str | None: RETRY_* / ALREADY_IMPORTED, 같은 블록 안에서 복구할 수 없으면 None
+    """
+    if isinstance(error, (OSError, asyncio.TimeoutError, ConnectionClosed)):
+        return RETRY_ENDPOINT
+    code = getattr(error, "code", None)
+    text = str(error).lower()
+    if code == 1013 or "already imported" in text:
+        return ALREADY_IMPORTED
+    if code in (1012, 1014) or "priority is too low" in text or "temporarily banned" in text:
+        return RETRY_TIP
+    if code == 1016 or "immediately dropped" in text or "because of the limit" in text:
+        return RETRY_ENDPOINT
+    if "outdated" in text or "stale" in text or "will be valid in the future" in text:
+        return RETRY_NONCE
+    if "ancient birth block" in text or "bad signature" in text or "badproof" in text:
+        return RETRY_ERA
+    return None
+
+
+async def submit_raw(substrate, extrinsic):
+    """
+    서명된 extrinsic을 author_submitExtrinsic으로 제출합니다 (포함 대기 없음).
+
+    Returns:
+        str: extrinsic 해시
+
+    Raises:
+        SubmitError: 노드가 거절한 경우
+    """
+    result = await substrate._make_rpc_request(
+        [substrate.make_payload("submit", "author_submitExtrinsic", [str(extrinsic.data)])]
+    )
+    response = result["submit"][0]
+    if "error" in response:
+        error = response["error"]
+        raise SubmitError(error.get("code"), error.get("message"), error.get("data"))
+    return response["result"]
+
+
+def fallback_substrates(urls=FALLBACK_ENDPOINTS):
+    """FALLBACK_ENDPOINTS 연결 리스트. 한 번 만든 연결을 재사용합니다."""
+    global _fallback_substrates
+    if _fallback_substrates is None:
+        _fallback_substrates = [
+            MetadataCachedSubstrate(url, ss58_format=SS58_FORMAT, chain_name="Bittensor") for url in urls
+        ]
+    return _fallback_substrates
+
+
+async def warm_up(substrates):
+    """연결과 런타임을 미리 준비해 둡니다. 실패한 엔드포인트는 경고만 출력합니다 (제출 시 다시 연결)."""
+    results = await asyncio.gather(*(substrate.initialize() for substrate in substrates), return_exceptions=True)
+    for substrate, result in zip(substrates, results):
+        if isinstance(result, Exception):
+            print(f"\n⚠ Failed to warm up fallback endpoint {substrate.url}: {result}")
@@ -0,0 +1,106 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from coordination import (
+    SharedColdkeyError, SqliteBackend, TcpBackend, assign_slots, join_fleet, start_coordinator_server,
+)
+
+
+def wallet(hotkey, coldkey="CK"):
+    return SimpleNamespace(
+        name=coldkey, hotkey_str=hotkey, hotkey=SimpleNamespace(ss58_address=hotkey),
+        coldkeypub=SimpleNamespace(ss58_address=coldkey),
+    )
+
+
+def run(coroutine_function):
+    return asyncio.run(coroutine_function())
+
+
+def test_claim_slots_gives_each_slot_and_hotkey_to_one_instance():
+    async def scenario():
+        backend = SqliteBackend(":memory:")
+        first = await backend.claim_slots(1000, range(2), ["A", "B", "C"], "i1", 60)
+        second = await backend.claim_slots(1000, range(4), ["A", "B", "C", "D"], "i2", 60)
+        # 이미 가진 lease는 다시 요청해도 그대로
+        again = await backend.claim_slots(1000, range(2), ["A", "B", "C"], "i1", 60)
+        await backend.release(1000, "i1")
+        after_release = await backend.claim_slots(1000, range(2), ["A"], "i2", 60)
+        await backend.close()
+        return first, second, again, after_release
+
+    first, second, again, after_release = run(scenario)
+    assert first == [(0, "A"), (1, "B")]
+    assert second == [(2, "C"), (3, "D")]
+    assert again == first
+    assert after_release == [(0, "A")]
+
+
+def test_expired_leases_are_reclaimed():
+    async def scenario():
+        backend = SqliteBackend(":memory:")
+        await backend.claim_slots(1000, range(1), ["A"], "i1", -1)
+        claimed = await backend.claim_slots(1000, range(1), ["A"], "i2", 60)
+        await backend.close()
+        return claimed
+
+    assert run(scenario) == [(0, "A")]
+
+
+def test_join_rejects_a_coldkey_used_by_another_live_instance():
+    async def scenario():
+        backend = SqliteBackend(":memory:")
+        await join_fleet(backend, "i1", [wallet("A", "CK1")], 60)
+        with pytest.raises(SharedColdkeyError):
+            await join_fleet(backend, "i2", [wallet("B", "CK2"), wallet("C", "CK1")], 60)
+        # 거절된 인스턴스는 아무 coldkey도 등록하지 않음
+        await join_fleet(backend, "i3", [wallet("D", "CK2")], 60)
+        # 같은 인스턴스의 갱신과 종료 후 재사용
+        await join_fleet(backend, "i1", [wallet("A", "CK1")], 60)
+        await backend.leave("i1")
+        await join_fleet(backend, "i2", [wallet("C", "CK1")], 60)
+        await backend.close()
+
+    run(scenario)
+
+
+def test_assign_slots_skips_hotkeys_settled_by_peers():
+    async def scenario():
+        backend = SqliteBackend(":memory:")
+        await backend.record_outcomes(1000, "peer", [[0, "A", "submitted"], [1, "B", "failed"], [2, "C", "rejected"]])
+        outcomes = await backend.outcomes(1000)
+        assignments = await assign_slots(backend, "me", 1000, [wallet(h) for h in "ABCD"], 3, 60)
+        await backend.close()
+        return outcomes, assignments
+
+    outcomes, assignments = run(scenario)
+    assert [(o["offset"], o["hotkey"], o["instance"], o["outcome"]) for o in outcomes] == [
+        (0, "A", "peer", "submitted"), (1, "B", "peer", "failed"), (2, "C", "peer", "rejected"),
+    ]
+    assert [assigned.hotkey_str for assigned in assignments] == ["B", "D"]
+
+
+def test_tcp_backend_round_trip():
+    async def scenario():
+        server = await start_coordinator_server("127.0.0.1", 0, ":memory:")
+        port = server.sockets[0].getsockname()[1]
+        first, second = TcpBackend("127.0.0.1", port), TcpBackend("127.0.0.1", port)
+        try:
+            await join_fleet(first, "i1", [wallet("A", "CK1")], 60)
+            with pytest.raises(SharedColdkeyError):
+                await join_fleet(second, "i2", [wallet("B", "CK1")], 60)
+            assigned = await assign_slots(first, "i1", 1000, [wallet("A", "CK1"), wallet("B", "CK1")], 1, 60)
+            await first.record_outcomes(1000, "i1", [[0, "A", "submitted"]])
+            peer_view = await second.outcomes(1000)
+        finally:
+            await first.close()
+            await second.close()
+            server.close()
+            await server.wait_closed()
+        return assigned, peer_view
+
+    assigned, peer_view = run(scenario)
+    assert [w.hotkey_str for w in assigned] == ["A"]
+    assert peer_view == [{"offset": 0, "hotkey": "A", "instance": "i1", "outcome": "submitted"}]
@@ -0,0 +1,55 @@
+from extrinsic_variants import SignedVariant, VariantCache, era_period_for
+
+
+def variant(hotkey="HK", nonce=5, tier=0, era_birth=100, era_period=8):
+    extrinsic = f"{hotkey}-{nonce}-{tier}-{era_birth}"
+    return SignedVariant(hotkey, nonce, tier, [1, 5, 20][tier], era_birth, era_period, extrinsic)
+
+
+def test_valid_for_requires_the_inclusion_block_inside_the_era():
+    signed = variant(era_birth=100, era_period=8)
+    assert not signed.valid_for(99)
+    assert signed.valid_for(100)
+    assert signed.valid_for(106)
+    # 106 헤더 뒤 제출은 107에 포함되고, 107은 era(100..107)의 마지막 블록이 아님
+    assert not signed.valid_for(107)
+
+
+def test_select_matches_nonce_and_tier_and_prefers_the_latest_anchor():
+    cache = VariantCache([1, 5, 20])
+    old = variant(era_birth=100)
+    new = variant(era_birth=104)
+    for signed in (old, new, variant(tier=1, era_birth=104), variant(nonce=6, era_birth=104)):
+        cache.add(signed)
+
+    assert cache.select("HK", 105, 5, 0) is new
+    assert cache.select("HK", 102, 5, 0) is old
+    assert cache.select("HK", 105, 5, 1).tier == 1
+    assert cache.select("HK", 105, 7, 0) is None
+    assert cache.select("OTHER", 105, 5, 0) is None
+
+
+def test_drop_anchor_removes_its_variants():
+    cache = VariantCache([1, 5, 20])
+    cache.anchors = [100, 104]
+    cache.add(variant(era_birth=100))
+    cache.add(variant(era_birth=104))
+    cache.drop_anchor(104)
+    assert cache.anchors == [100]
+    assert len(cache) == 1
+    assert cache.select("HK", 105, 5, 0).era_birth == 100
+
+
+def test_tier_for_competition_outbids_the_observed_tip():
+    cache = VariantCache([1, 5, 20])
+    assert cache.tier_for_competition(None) == 0
+    assert cache.tier_for_competition(0) == 0
+    assert cache.tier_for_competition(1) == 1
+    assert cache.tier_for_competition(19) == 2
+    assert cache.tier_for_competition(50) == 2
+
+
+def test_era_period_is_a_power_of_two():
+    assert era_period_for(1) == 4
+    assert era_period_for(5) == 8
+    assert era_period_for(64) == 64
@@ -0,0 +1,83 @@
+import asyncio
+
+from header_recorder import StreamRecorder
+from mempool_watcher import MempoolWatcher
+from replay_harness import ReplayMempoolWatcher
+
+
+class PendingSubstrate:
+    """author_pendingExtrinsics 응답을 차례로 돌려주는 노드 대용."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    async def rpc_request(self, method, params):
+        assert method == "author_pendingExtrinsics"
+        return {"result": self.responses.pop(0)}
+
+
+class DecodedWatcher(MempoolWatcher):
+    """extrinsic hex를 'signer:tip' 형식으로 디코딩하는 watcher (메타데이터 없이)."""
+
+    async def decode(self, extrinsic_hex):
+        signer, tip = extrinsic_hex.split(":")
+        return [{"netuid": 1, "hotkey": f"HK-{signer}", "signer": signer, "tip": int(tip), "nonce": 0}]
+
+
+def test_recorded_pool_states_replay_to_the_same_decisions(tmp_path):
+    async def scenario():
+        recorder = StreamRecorder(str(tmp_path / "pool.jsonl.gz"), {})
+        seen = []
+
+        async def on_competitor(registrations):
+            seen.append([registration["tip"] for registration in registrations])
+
+        watcher = DecodedWatcher(
+            PendingSubstrate([["own:9", "rival:20"], ["own:9", "rival:20"], []]), 1, {"own"},
+            on_competitor=on_competitor, recorder=recorder,
+        )
+        await watcher.poll_once()
+        live = [watcher.max_tip()]
+        # 상태가 바뀌지 않은 주기 조회는 기록하지 않음
+        await watcher.poll_once()
+        fresh = await watcher.refresh(timeout=1)
+        live.append(watcher.max_tip())
+
+        replayed_seen = []
+
+        async def on_replayed_competitor(registrations):
+            replayed_seen.append([registration["tip"] for registration in registrations])
+
+        replayed = ReplayMempoolWatcher(recorder.events, 1, {"own"}, on_replayed_competitor)
+        await replayed.deliver_until(recorder.events[0]["t"])
+        replay_tips = [replayed.max_tip()]
+        replay_fresh = await replayed.refresh()
+        replay_tips.append(replayed.max_tip())
+        return recorder.events, seen, live, fresh, replayed_seen, replay_tips, replay_fresh
+
+    events, seen, live, fresh, replayed_seen, replay_tips, replay_fresh = asyncio.run(scenario())
+    assert [(event["type"], event.get("refresh")) for event in events] == [
+        ("pool", None), ("pool", 1), ("pool_refresh", 1),
+    ]
+    assert seen == [[20]]
+    assert live == [20, None] and fresh
+    assert replayed_seen == seen
+    assert replay_tips == live and replay_fresh
+
+
+def test_refresh_that_misses_the_timeout_is_not_used():
+    class SlowSubstrate:
+        async def rpc_request(self, method, params):
+            await asyncio.sleep(0.2)
+            return {"result": []}
+
+    async def scenario():
+        watcher = MempoolWatcher(SlowSubstrate(), 1)
+        watcher.competitors = {"0xstale": [{"tip": 20}]}
+        fresh = await watcher.refresh(timeout=0.01)
+        stale_tip = watcher.max_tip()
+        await asyncio.sleep(0.3)
+        return fresh, stale_tip, watcher.max_tip()
+
+    # 제시간에 끝나지 않으면 False (호출 측은 풀 tip을 쓰지 않음), 조회는 백그라운드에서 끝남
+    assert asyncio.run(scenario()) == (False, 20, None)
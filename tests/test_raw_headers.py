@@ -0,0 +1,43 @@
+import pytest
+
+from raw_headers import compact_encode, header_hash
+
+
+def test_header_hash_of_polkadot_genesis():
+    header = {
+        "parentHash": "0x" + "00" * 32,
+        "number": "0x0",
+        "stateRoot": "0x29d0d972cd27cbc511e9589fcb7a4506d5eb6a9e8df205f00472e5ab354a4e17",
+        "extrinsicsRoot": "0x03170a2e7597b7b7e3d84c05391d139a62b157e78786d8c082f29dcf4c111314",
+        "digest": {"logs": []},
+    }
+    assert header_hash(header) == "0x91b171bb158e2d3848fa23a9f1c25182fb8e20313b2c1eb49219da7a70ce90c3"
+
+
+def test_header_hash_covers_number_and_digest_logs():
+    header = {
+        "parentHash": "0x" + "11" * 32,
+        "number": "0x3e8",
+        "stateRoot": "0x" + "22" * 32,
+        "extrinsicsRoot": "0x" + "33" * 32,
+        "digest": {"logs": []},
+    }
+    with_log = {**header, "digest": {"logs": ["0x0661757261201234"]}}
+    next_block = {**header, "number": "0x3e9"}
+    hashes = {header_hash(header), header_hash(with_log), header_hash(next_block)}
+    assert len(hashes) == 3
+
+
+@pytest.mark.parametrize("value, encoded", [
+    (0, "00"),
+    (1, "04"),
+    (63, "fc"),
+    (64, "0101"),
+    (16383, "fdff"),
+    (16384, "02000100"),
+    (2 ** 30 - 1, "feffffff"),
+    (2 ** 30, "0300000040"),
+    (2 ** 32, "070000000001"),
+])
+def test_compact_encode(value, encoded):
+    assert compact_encode(value).hex() == encoded
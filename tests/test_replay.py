@@ -0,0 +1,88 @@
+"""tests/fixtures의 합성 기록을 재생하여 slot 결정(attempts)을 확인합니다."""
+import asyncio
+import os
+
+import pytest
+
+import replay_harness
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def replay(name):
+    return asyncio.run(replay_harness.replay(os.path.join(FIXTURES, f"{name}.jsonl.gz"), speed=0))
+
+
+def decisions(report):
+    return [
+        (attempt["idx"], attempt["block"], attempt["hotkey"], attempt["submitted"], attempt["rejected"])
+        for attempt in report["attempts"]
+    ]
+
+
+@pytest.mark.parametrize("name", [
+    "all_ok", "tip_retry", "unrecoverable_reject", "exhausted_defer", "fallback_endpoint", "pool_refresh",
+])
+def test_fixture_matches_recorded_result(name):
+    report = replay(name)
+    assert report["completed"]
+    assert report["matches"]
+
+
+def test_all_ok_submits_each_wallet_in_its_slot():
+    report = replay("all_ok")
+    assert decisions(report) == [
+        (0, 998, "HK0", True, False),
+        (1, 999, "HK1", True, False),
+        (2, 1000, "HK2", True, False),
+    ]
+    # 모두 제출하면 남은 헤더를 기다리지 않고 끝남 (995..1000)
+    assert report["heads_delivered"] == 6
+
+
+def test_tip_retry_resubmits_within_the_same_slot():
+    report = replay("tip_retry")
+    assert decisions(report) == [
+        (0, 998, "HK0", True, False),
+        (1, 999, "HK1", True, False),
+        (2, 1000, "HK2", True, False),
+    ]
+    assert len(report["submitted"]) == 4
+    assert report["submitted"][0]["extrinsic"] != report["submitted"][1]["extrinsic"]
+
+
+def test_unrecoverable_rejection_drops_the_wallet_without_deferring():
+    report = replay("unrecoverable_reject")
+    assert decisions(report) == [
+        (0, 998, "HK0", False, True),
+        (1, 999, "HK1", True, False),
+        (2, 1000, "HK2", True, False),
+    ]
+    assert report["heads_delivered"] == 6
+
+
+def test_exhausted_retries_defer_the_wallet_to_the_next_slot():
+    report = replay("exhausted_defer")
+    # 최고 tier까지 거절되면 h0은 다음 slot으로, 밀려난 h2는 다음 epoch로
+    assert decisions(report) == [
+        (0, 998, "HK0", False, False),
+        (1, 999, "HK0", True, False),
+        (2, 1000, "HK1", True, False),
+    ]
+    assert report["heads_delivered"] == 6
+
+
+def test_pool_full_retries_on_the_fallback_endpoint():
+    report = replay("fallback_endpoint")
+    assert [submission["endpoint"] for submission in report["submitted"]] == [0, 1, 0, 0]
+    assert all(attempt["submitted"] for attempt in report["attempts"])
+
+
+def test_pool_refresh_ignores_competitors_included_in_the_new_block():
+    report = replay("pool_refresh")
+    # 998: 이전 조회의 경쟁자는 새 블록에서 다시 조회하면 없으므로 미루지 않음
+    # 999: 다시 조회한 풀에 최고 tier 이상의 경쟁자가 있으므로 h1을 1000으로 미루고 h2는 다음 epoch로
+    assert decisions(report) == [
+        (0, 998, "HK0", True, False),
+        (2, 1000, "HK1", True, False),
+    ]
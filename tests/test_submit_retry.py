@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+
+from submit_retry import (
+    ALREADY_IMPORTED, RETRY_ENDPOINT, RETRY_ERA, RETRY_NONCE, RETRY_TIP, SubmitError, classify_submit_error,
+)
+
+
+@pytest.mark.parametrize("error, kind", [
+    (SubmitError(1014, "Priority is too low: (10 vs 10)"), RETRY_TIP),
+    (SubmitError(1012, "Transaction is temporarily banned"), RETRY_TIP),
+    (SubmitError(1013, "Transaction Already Imported"), ALREADY_IMPORTED),
+    (SubmitError(1016, "Immediately Dropped", "Dropped because of the limit"), RETRY_ENDPOINT),
+    (SubmitError(1010, "Invalid Transaction", "Transaction is outdated"), RETRY_NONCE),
+    (SubmitError(1010, "Invalid Transaction", "Transaction will be valid in the future"), RETRY_NONCE),
+    (SubmitError(1010, "Invalid Transaction", "Transaction has an ancient birth block"), RETRY_ERA),
+    (SubmitError(1010, "Invalid Transaction", "Transaction has a bad signature"), RETRY_ERA),
+    (SubmitError(1010, "Invalid Transaction", "Custom error: 6"), None),
+    (SubmitError(1010, "Invalid Transaction", "Inability to pay some fees"), None),
+    (ConnectionResetError("reset by peer"), RETRY_ENDPOINT),
+    (asyncio.TimeoutError(), RETRY_ENDPOINT),
+    (ConnectionClosed(None, None), RETRY_ENDPOINT),
+    (RuntimeError("something else"), None),
+])
+def test_classify_submit_error(error, kind):
+    assert classify_submit_error(error) == kind
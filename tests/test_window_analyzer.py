@@ -0,0 +1,28 @@
+from window_analyzer import recommend_window
+
+
+def stats(successes, attempts, blocks=10):
+    return {
+        "successes": successes,
+        "success_rate": successes / attempts if attempts else 0.0,
+        "successes_per_block": successes / blocks,
+    }
+
+
+def test_recommend_window_extends_the_best_offset_over_neighbouring_candidates():
+    offsets = {
+        5: stats(1, 10),   # 성공률 미달
+        4: stats(6, 10),
+        3: stats(9, 10),   # 최고
+        2: stats(7, 10),
+        1: stats(0, 0),    # 성공 없음
+        0: stats(8, 10),   # 후보지만 연속되지 않음
+    }
+    recommended = recommend_window(offsets, min_success_rate=0.5)
+    # 블록 N 헤더 뒤 제출은 N+1에 포함되므로 START_OFFSET은 가장 먼 offset + 1
+    assert recommended == {"start_offset": 5, "max_slots": 3, "offsets": [4, 3, 2]}
+
+
+def test_recommend_window_without_candidates():
+    assert recommend_window({3: stats(0, 5), 2: stats(1, 10)}, min_success_rate=0.5) is None
+    assert recommend_window({}) is None
@@ -0,0 +1,290 @@
+import asyncio
+import json
+import os
+import statistics
+from collections import deque
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from chain_utils import extract_registrations, registered_hotkeys_from_events
+
+load_dotenv()
+
+ANALYZE_EPOCHS = int(os.getenv("ANALYZE_EPOCHS", "20"))  # 분석할 과거 epoch 개수
+ANALYZE_CONCURRENCY = int(os.getenv("ANALYZE_CONCURRENCY", "8"))  # 동시에 가져올 블록 수 상한
+ANALYZE_PREFETCH = int(os.getenv("ANALYZE_PREFETCH", "2"))  # 미리 가져올 epoch 개수
+WINDOW_BEFORE = int(os.getenv("WINDOW_BEFORE", "8"))  # epoch 몇 블록 전부터 분석할지
+WINDOW_AFTER = int(os.getenv("WINDOW_AFTER", "3"))  # epoch 몇 블록 후까지 분석할지
+WINDOW_MIN_SUCCESS_RATE = float(os.getenv("WINDOW_MIN_SUCCESS_RATE", "0.5"))
+WINDOW_STATS_PATH = os.getenv("WINDOW_STATS_PATH", "window_stats.json")
+
+
+async def fetch_block_registrations(substrate, block_number, netuid, semaphore):
+    """
+    블록 하나에 포함된 `burned_register` 시도와 결과를 가져옵니다.
+
+    Args:
+        substrate: AsyncSubstrateInterface 인스턴스
+        block_number: 블록 번호
+        netuid: 서브넷 ID
+        semaphore: 동시 요청 수를 제한하는 asyncio.Semaphore
+
+    Returns:
+        dict: {"block", "attempts", "error"} - attempts는 포함 위치(position), tip, 성공 여부 포함
+    """
+    async with semaphore:
+        try:
+            block_hash = await substrate.get_block_hash(block_number)
+            block, events = await asyncio.gather(
+                substrate.get_block(block_hash=block_hash),
+                substrate.get_events(block_hash),
+            )
+        except Exception as e:
+            return {"block": block_number, "attempts": [], "error": str(e)}
+
+    registered = registered_hotkeys_from_events(events, netuid)
+    attempts = []
+    for position, extrinsic in enumerate(block["extrinsics"]):
+        for registration in extract_registrations(extrinsic, netuid):
+            attempts.append({
+                "hotkey": registration["hotkey"],
+                "signer": registration["signer"],
+                "tip": registration["tip"],
+                "position": position,
+                "success": registration["hotkey"] in registered,
+            })
+    return {"block": block_number, "attempts": attempts, "error": None}
+
+
+async def stream_epochs(substrate, netuid, epoch_blocks):
+    """
+    과거 epoch들의 등록 윈도우 블록을 순서대로 스트리밍합니다.
+    다음 epoch 블록은 ANALYZE_PREFETCH개까지 미리 요청하고, 전체 동시 요청은 semaphore로 제한합니다.
+
+    Args:
+        substrate: AsyncSubstrateInterface 인스턴스
+        netuid: 서브넷 ID
+        epoch_blocks: 분석할 epoch(LastAdjustmentBlock) 블록 번호 리스트
+
+    Yields:
+        (epoch_block, List[dict]): epoch 블록 번호와 윈도우 내 블록별 결과
+    """
+    semaphore = asyncio.Semaphore(ANALYZE_CONCURRENCY)
+    pending = deque()
+    epochs = iter(epoch_blocks)
+
+    def schedule_next():
+        epoch_block = next(epochs, None)
+        if epoch_block is None:
+            return
+        tasks = [
+            asyncio.create_task(fetch_block_registrations(substrate, block_number, netuid, semaphore))
+            for block_number in range(epoch_block - WINDOW_BEFORE, epoch_block + WINDOW_AFTER + 1)
+        ]
+        pending.append((epoch_block, tasks))
+
+    for _ in range(max(1, ANALYZE_PREFETCH)):
+        schedule_next()
+
+    try:
+        while pending:
+            epoch_block, tasks = pending.popleft()
+            schedule_next()
+            yield epoch_block, await asyncio.gather(*tasks)
+    finally:
+        for _, tasks in pending:
+            for task in tasks:
+                task.cancel()
+
+
+def new_offset_stats():
+    return {"blocks": 0, "attempts": 0, "successes": 0, "tips": [], "winning_tips": [], "winning_positions": []}
+
+
+def add_block_result(offset_stats, offset, result):
+    stats = offset_stats.setdefault(offset, new_offset_stats())
+    stats["blocks"] += 1
+    for attempt in result["attempts"]:
+        stats["attempts"] += 1
+        stats["tips"].append(attempt["tip"])
+        if attempt["success"]:
+            stats["successes"] += 1
+            stats["winning_tips"].append(attempt["tip"])
+            stats["winning_positions"].append(attempt["position"])
+
+
+def summarize_offset(stats):
+    """누적된 offset 통계를 JSON으로 내보낼 요약 값으로 변환합니다."""
+    attempts = stats["attempts"]
+    blocks = stats["blocks"] or 1
+    return {
+        "blocks": stats["blocks"],
+        "attempts": attempts,
+        "successes": stats["successes"],
+        "success_rate": stats["successes"] / attempts if attempts else 0.0,
+        "congestion": attempts / blocks,  # 블록당 평균 burned_register 시도 수
+        "successes_per_block": stats["successes"] / blocks,
+        "median_tip": statistics.median(stats["tips"]) if stats["tips"] else 0,
+        "max_tip": max(stats["tips"], default=0),
+        "median_winning_tip": statistics.median(stats["winning_tips"]) if stats["winning_tips"] else 0,
+        "mean_winning_position": (
+            statistics.mean(stats["winning_positions"]) if stats["winning_positions"] else None
+        ),
+    }
+
+
+def recommend_window(offsets, min_success_rate=WINDOW_MIN_SUCCESS_RATE):
+    """
+    offset 통계에서 START_OFFSET / MAX_SLOTS를 추천합니다.
+
+    offset은 포함(inclusion) 블록 기준 epoch까지의 거리입니다.
+    봇은 블록 N 헤더를 받은 뒤 제출하므로 N+1에 포함되고, 따라서 START_OFFSET = 최대 offset + 1 입니다.
+
+    Args:
+        offsets: {offset(int): summarize_offset 결과}
+        min_success_rate: 후보로 인정할 최소 성공률
+
+    Returns:
+        dict | None: {"start_offset", "max_slots", "offsets"} (후보가 없으면 None)
+    """
+    candidates = {
+        offset for offset, stats in offsets.items()
+        if stats["successes"] > 0 and stats["success_rate"] >= min_success_rate
+    }
+    if not candidates:
+        return None
+
+    best = max(candidates, key=lambda offset: (offsets[offset]["successes_per_block"], offset))
+    run = [best]
+    while run[-1] + 1 in candidates:
+        run.append(run[-1] + 1)
+    while run[0] - 1 in candidates:
+        run.insert(0, run[0] - 1)
+
+    return {"start_offset": max(run) + 1, "max_slots": len(run), "offsets": sorted(run, reverse=True)}
+
+
+async def find_epoch_blocks(substrate, netuid, epochs):
+    """
+    최근 epoch 블록(LastAdjustmentBlock)들을 최신부터 거꾸로 찾습니다.
+    각 epoch 직전 블록의 LastAdjustmentBlock이 이전 epoch이므로, 그 사이에 AdjustmentInterval이 바뀌었어도 정확합니다.
+    (과거 블록 상태를 조회하므로 archive 노드 필요)
+
+    Returns:
+        List[int]: epoch 블록 번호 (최신순, 체인 시작에 닿으면 epochs개보다 적을 수 있음)
+    """
+    last_adjustment_block = await substrate.query("SubtensorModule", "LastAdjustmentBlock", [netuid])
+    epoch_blocks = [last_adjustment_block.value]
+    while len(epoch_blocks) < epochs and epoch_blocks[-1] > 0:
+        block_hash = await substrate.get_block_hash(epoch_blocks[-1] - 1)
+        previous = await substrate.query("SubtensorModule", "LastAdjustmentBlock", [netuid], block_hash=block_hash)
+        if not 0 < previous.value < epoch_blocks[-1]:
+            break
+        epoch_blocks.append(previous.value)
+    return epoch_blocks
+
+
+def load_window_stats(path=WINDOW_STATS_PATH):
+    """
+    window_analyzer가 저장한 통계 파일을 읽습니다.
+
+    Returns:
+        dict | None: 통계 (파일이 없으면 None)
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+async def analyze_windows(network, netuid, epochs=ANALYZE_EPOCHS):
+    """
+    최근 epoch들의 등록 윈도우를 분석하여 offset별 성공/혼잡 통계를 만듭니다.
+
+    Args:
+        network: 네트워크 이름 또는 엔드포인트 (과거 블록 상태가 필요하므로 archive 노드 권장)
+        netuid: 서브넷 ID
+        epochs: 분석할 과거 epoch 개수
+
+    Returns:
+        dict: 통계 및 추천 윈도우
+    """
+    from bittensor.core.async_subtensor import AsyncSubtensor
+
+    subtensor = AsyncSubtensor(network=network)
+    substrate = subtensor.substrate
+    try:
+        interval = (await substrate.query("SubtensorModule", "AdjustmentInterval", [netuid])).value
+        epoch_blocks = await find_epoch_blocks(substrate, netuid, epochs)
+
+        print(f"Analyzing {len(epoch_blocks)} epochs of netuid {netuid} (current interval {interval} blocks)")
+        print(f"Window: epoch-{WINDOW_BEFORE} to epoch+{WINDOW_AFTER}, concurrency {ANALYZE_CONCURRENCY}")
+
+        offset_stats = {}
+        failed_blocks = 0
+        async for epoch_block, results in stream_epochs(substrate, netuid, epoch_blocks):
+            epoch_attempts = 0
+            epoch_successes = 0
+            for result in results:
+                if result["error"]:
+                    failed_blocks += 1
+                    continue
+                offset = epoch_block - result["block"]
+                add_block_result(offset_stats, offset, result)
+                epoch_attempts += len(result["attempts"])
+                epoch_successes += sum(1 for attempt in result["attempts"] if attempt["success"])
+            print(f"Epoch {epoch_block}: {epoch_attempts} attempts, {epoch_successes} registered")
+    finally:
+        await subtensor.close()
+
+    if failed_blocks:
+        print(f"⚠ {failed_blocks} blocks could not be fetched (pruned state? use an archive node)")
+
+    offsets = {offset: summarize_offset(stats) for offset, stats in sorted(offset_stats.items(), reverse=True)}
+    return {
+        "netuid": netuid,
+        "generated_at": datetime.now().isoformat(),
+        "adjustment_interval": interval,
+        "epochs": epoch_blocks,
+        "failed_blocks": failed_blocks,
+        "offsets": {str(offset): stats for offset, stats in offsets.items()},
+        "recommended": recommend_window(offsets),
+    }
+
+
+def offset_label(offset):
+    return f"epoch-{offset}" if offset > 0 else "epoch" if offset == 0 else f"epoch+{abs(offset)}"
+
+
+def print_report(report):
+    print(f"\n{'='*60}")
+    print(f"{'offset':>7} {'attempts':>9} {'wins':>6} {'rate':>6} {'cong.':>6} {'med tip':>12} {'win tip':>12}")
+    for offset, stats in report["offsets"].items():
+        print(
+            f"{offset_label(int(offset)):>7} "
+            f"{stats['attempts']:>9} {stats['successes']:>6} {stats['success_rate']:>6.2f} "
+            f"{stats['congestion']:>6.2f} {stats['median_tip']:>12,.0f} {stats['median_winning_tip']:>12,.0f}"
+        )
+    recommended = report["recommended"]
+    if recommended:
+        print(f"\nRecommended: START_OFFSET={recommended['start_offset']} MAX_SLOTS={recommended['max_slots']}")
+    else:
+        print("\nNo offset met the minimum success rate; keeping env settings")
+    print(f"{'='*60}\n")
+
+
+def main():
+    netuid = int(os.getenv("NETUID", "1"))
+    network = os.getenv("ARCHIVE_NETWORK", os.getenv("NETWORK", "archive"))
+
+    report = asyncio.run(analyze_windows(network, netuid))
+    print_report(report)
+
+    with open(WINDOW_STATS_PATH, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved window statistics to {WINDOW_STATS_PATH}")
+
+
+if __name__ == "__main__":
+    main()